@@ -1,23 +1,29 @@
 from flask import Flask, jsonify
 from news_data import fetch_latest_news
 from sentiment_analysis import analyze_sentiment  # Import sentiment analysis function
-from model import predict_next_closing_price
+from model import model_path
 from stocks_data import fetch_and_save_stock_data  # Fetch stock data
 import pandas as pd
 import os
 from flask_cors import CORS  # Enable CORS
-from fgi_model import calculate_fgi_with_prediction  # Import updated FGI function
-from fgi_data import fetch_and_save_fgi_data  # Import updated FGI data function
-from interest_rate import fetch_interest_rate
-from gdp import fetch_and_save_gdp_data
-from inflation_rate import fetch_and_save_inflation_data
-from stock_recommendations import load_latest_data, generate_recommendation, save_recommendation
+from refresh import run_refresh  # Fetch → score → predict pipeline
+from model_registry import preload, model_info  # Warm model cache
+from model_bundle import load_manifest  # Preprocessing the served model was trained with
+from batch_predict import load_close_history, expand_date_range, predict_batch, max_horizon
+import storage  # Parquet-backed tables (stocks, predictions, FGI, sentiment, recommendations)
+import market_sentiment  # Overall sentiment, precomputed once per news refresh
+import forecast_snapshot  # Daily prediction/FGI/recommendation snapshot served by /predict
+import market_data  # Shared OHLCV store (the index and per-symbol roots)
+import tickers  # Nifty 50 constituents, each with its own tables (see market_data.symbol_root)
+import serving  # Versioned model registry, hot-swapped deployment, traffic split and shadow models
+from response_cache import cached_json, stats as response_cache_stats  # Pre-serialized JSON + ETags
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import pymysql
 import os
 from dotenv import load_dotenv
+from db_pool import ConnectionPool, PoolTimeout  # Reused MySQL connections
 
 # Load MySQL credentials from .env
 load_dotenv()
@@ -35,6 +41,19 @@ def get_db_connection():
         cursorclass=pymysql.cursors.DictCursor  # ✅ Returns results as dictionary
     )
 
+# ✅ Connection pool shared by the auth endpoints (connections are opened on first use)
+db_pool = ConnectionPool(
+    get_db_connection,
+    max_size=int(os.getenv("DB_POOL_SIZE", "10")),
+    max_lifetime=int(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),  # Below MySQL's wait_timeout (8h default)
+    wait_timeout=float(os.getenv("DB_POOL_WAIT_TIMEOUT", "5")),
+)
+
+# ✅ SQL used by the auth endpoints (parameters are always passed separately)
+insert_user_sql = "INSERT INTO users (name, email, username, password, phone) VALUES (%s, %s, %s, %s, %s)"
+login_sql = "SELECT id, name, email, username, phone FROM users WHERE email = %s AND password = %s"
+user_by_id_sql = "SELECT id, name, email, username, phone FROM users WHERE id = %s"
+
 # ✅ Register User
 @app.route('/register', methods=['POST'])
 def register_user():
@@ -46,18 +65,15 @@ def register_user():
         phone = data['phone']
         password = data['password']
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO users (name, email, username, password, phone) VALUES (%s, %s, %s, %s, %s)",
-            (name, email, username, password, phone)
-        )
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with db_pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(insert_user_sql, (name, email, username, password, phone))
+            cursor.close()
 
         return jsonify({"message": "User registered successfully!"}), 201
 
+    except PoolTimeout as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -69,21 +85,19 @@ def login_user():
         email = data['email']
         password = data['password']
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, name, email, username, phone FROM users WHERE email = %s AND password = %s",
-            (email, password)
-        )
-        user = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with db_pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(login_sql, (email, password))
+            user = cursor.fetchone()
+            cursor.close()
 
         if user:
             return jsonify({"success": True, "user": user})
         else:
             return jsonify({"success": False, "message": "Invalid credentials"}), 401
 
+    except PoolTimeout as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -91,18 +105,19 @@ def login_user():
 @app.route('/user/<int:id>', methods=['GET'])
 def get_user(id):
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name, email, username, phone FROM users WHERE id = %s", (id,))
-        user = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with db_pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(user_by_id_sql, (id,))
+            user = cursor.fetchone()
+            cursor.close()
 
         if user:
             return jsonify(user)
         else:
             return jsonify({"message": "User not found"}), 404
 
+    except PoolTimeout as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -115,31 +130,6 @@ def logout():
 
 # Define file paths
 base_dir = os.path.dirname(__file__)
-data_path = os.path.join(base_dir, "data", "stocks_data.csv")  # Actual stock prices
-predictions_path = os.path.join(base_dir, "data", "predicted_prices.csv")  # Predicted prices
-sentiment_results_path = os.path.join(base_dir, "data", "news_sentiment_results.csv")  # Sentiment scores
-fgi_path = os.path.join(base_dir, "data", "fgi_data_with_fgi.csv")  # Updated FGI data
-
-
-# ✅ Fetch and save latest FGI data before starting Flask
-print("[✔] Fetching and saving latest FGI data...")
-fetch_and_save_fgi_data()
-print("[✔] FGI data updated successfully.")
-
-# ✅ Fetch latest interest rate data before running FGI calculations
-fetch_interest_rate()
-fetch_and_save_gdp_data()
-fetch_and_save_inflation_data()
-
-# ✅ Calculate and save FGI with tomorrow's prediction
-print("[✔] Calculating FGI with tomorrow's prediction...")
-calculate_fgi_with_prediction()
-print("[✔] FGI calculated successfully with prediction.")
-
-# ✅ Ensure stock data updates BEFORE using it in the model
-print("[✔] Fetching latest stock data...")
-fetch_and_save_stock_data()  # Runs stocks_data.py first
-print("[✔] Stock data updated successfully.")
 
 
 
@@ -172,16 +162,13 @@ def get_latest_stock_data():
 # Function to fetch latest 5 news headlines with sentiment scores
 def get_latest_news():
     try:
-        if os.path.exists(sentiment_results_path):
-            # Read sentiment results data
-            sentiment_df = pd.read_csv(sentiment_results_path)
-
-            # Select required columns
-            selected_columns = ['title', 'source', 'publishedAt', 'description', 'url', 'Sentiment']
-            news_df = sentiment_df[selected_columns]
+        # Read only the newest sentiment results, with the required columns
+        selected_columns = ['title', 'source', 'publishedAt', 'description', 'url', 'Sentiment']
+        news_df = storage.tail("news_sentiment", 5, columns=selected_columns)
 
-            # Sort by published date (latest first) and get the top 5 news articles
-            latest_news = news_df.sort_values(by='publishedAt', ascending=False).head(5)
+        if not news_df.empty:
+            # Sort by published date (latest first)
+            latest_news = news_df.sort_values(by='publishedAt', ascending=False)
 
             # Convert to JSON format
             return latest_news.to_dict(orient="records")
@@ -195,46 +182,83 @@ def get_latest_news():
 
 # ====================== API ROUTES ======================
 
-# API to get overall sentiment and predicted stock price
-# API to get overall sentiment and predicted stock price
-# API to get overall sentiment and predicted stock price
+# API to get the latest forecast snapshot (prediction, range, sentiment, FGI and recommendation)
 @app.route('/predict', methods=['GET'])
 def get_prediction():
-    try:
-        # ✅ Load the latest stock, prediction, sentiment, and FGI data before generating recommendation
-        from stock_recommendations import load_latest_data  # Import the function
+    """Serves the snapshot built by the refresh's predict stage; the first request builds one if none exists.
 
-        latest_data = load_latest_data()  # CALL to load latest data
-        
-        # Use analyze_sentiment with a placeholder text to get the overall market sentiment
-        overall_sentiment, _ = analyze_sentiment("Market analysis today")  # Dummy text
-        
-        # Get the predicted stock price and the range
-        predicted_date, predicted_price, prediction_range = predict_next_closing_price()
-
-        # Save prediction to CSV
-        save_prediction(predicted_date, predicted_price)
-
-        # ✅ Generate stock recommendation based on the latest data
-        recommendation_result = generate_recommendation()  # CALL to generate recommendation
-        save_recommendation(recommendation_result)  # CALL to save recommendation to CSV
-
-        # ✅ Return all results including recommendation
-        return jsonify({
-            "Date": predicted_date,
-            "Predicted_Price": predicted_price,
-            "Prediction_Range": prediction_range,
-            "Overall_Market_Sentiment": overall_sentiment,
-            "Today_Close" : recommendation_result["Today_Close"],
-            "FGI Score": recommendation_result["FGI_Score"],
-            "FGI_Sentiment": recommendation_result["FGI_Sentiment"],
-            "Recommendation": recommendation_result["Recommendation"]
-            
-        })
+    ?symbol=<ticker> serves a constituent's latest forecast from the constituents refresh instead.
+    """
+    try:
+        symbol = request.args.get("symbol", market_data.symbol)
+        if symbol != market_data.symbol:
+            if symbol not in market_data.stored_symbols():
+                return jsonify({"error": f"No forecast stored for {symbol}"}), 404
+            return cached_json(f"predict:{symbol}", ["recommendations"], lambda: tickers.latest_forecast(symbol),
+                               root=market_data.symbol_root(symbol))
+        return cached_json("predict", [], forecast_snapshot.latest_or_build, files=[forecast_snapshot.latest_path()])
     except Exception as e:
         return jsonify({"error": f"Failed to get prediction, sentiment, or recommendation: {str(e)}"})
 
 
+# API to forecast many symbols/dates and 1..N trading days ahead in one round trip
+@app.route('/predict/batch', methods=['GET', 'POST'])
+def get_batch_prediction():
+    """GET ?symbols=A,B&as_of=YYYY-MM-DD,...|start=&end=&horizon=N, or POST {"requests": [{"symbol", "as_of"}], "horizon": N}."""
+    max_windows = 5000  # Keeps one request from building an unbounded batch
+    try:
+        body = request.get_json(silent=True) or {}
+        horizon = int(body.get("horizon", request.args.get("horizon", 1)))
+
+        # Only the named symbols' histories are loaded (each is re-read only after its stored bars change)
+        if "requests" in body:
+            pairs = [(item["symbol"], item.get("as_of")) for item in body["requests"]]
+            history = load_close_history(symbols={symbol for symbol, _ in pairs})
+        else:
+            symbols = request.args.get("symbols")
+            symbols = symbols.split(",") if symbols else None
+            history = load_close_history(symbols=symbols)
+            symbols = symbols or list(history)
+            unknown = [symbol for symbol in symbols if symbol not in history]
+            if unknown:
+                return jsonify({"error": f"No price history for: {', '.join(unknown)}"}), 404
+
+            if request.args.get("start") or request.args.get("end"):
+                pairs = expand_date_range(history, symbols, request.args.get("start", "1900-01-01"),
+                                          request.args.get("end", "2100-01-01"))
+            else:
+                as_of = request.args.get("as_of")
+                dates = as_of.split(",") if as_of else [None]
+                pairs = [(symbol, date) for symbol in symbols for date in dates]
+
+        if len(pairs) > max_windows:
+            return jsonify({"error": f"Too many windows ({len(pairs)}); the limit is {max_windows}"}), 400
+
+        return jsonify({"horizon": horizon, "predictions": predict_batch(pairs, horizon, history)})
+    except (KeyError, ValueError, TypeError) as e:
+        return jsonify({"error": f"Invalid batch request (horizon 1-{max_horizon}): {str(e)}"}), 400
+    except Exception as e:
+        return jsonify({"error": f"Failed to get batch predictions: {str(e)}"})
+
+
+# API to inspect the model currently served by /predict
+@app.route('/model_info', methods=['GET'])
+def get_model_info():
+    info = model_info(model_path)
+    if info is None:
+        return jsonify({"error": "Model not loaded"}), 404
+    return jsonify({**info, "bundle": load_manifest(model_path)})
+
+# API to inspect the model registry, the live deployment and each deployed model's live error
+@app.route('/models', methods=['GET'])
+def get_models():
+    """?symbol=<ticker> reports the live error on a constituent's forecasts instead of the index's."""
+    try:
+        return jsonify({"deployment": serving.current().describe(), "versions": serving.versions(),
+                        "live_error": serving.live_error(request.args.get("symbol"))})
+    except Exception as e:
+        return jsonify({"error": f"Failed to get models: {str(e)}"})
+
 # API to get latest stock data
 @app.route('/stock_data', methods=['GET'])
 def stock_data():
@@ -248,89 +272,86 @@ def stock_data():
 @app.route('/latest_news', methods=['GET'])
 def latest_news():
     try:
-        news_data = get_latest_news()
-        return jsonify(news_data)
+        return cached_json("latest_news", ["news_sentiment"], get_latest_news)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch latest news: {str(e)}"})
 
-# API to fetch the past 7 days of actual vs predicted stock prices
-@app.route('/past_predictions', methods=['GET'])
-def past_predictions():
-    try:
-        # Load actual stock data
-        if os.path.exists(data_path):
-            actual_data = pd.read_csv(data_path)
-            actual_data['Date'] = pd.to_datetime(actual_data['Date'])
-        else:
-            return jsonify({"error": "Actual stock data file not found"})
+# Function to build the past 7 days of actual vs predicted stock prices
+def get_past_predictions():
+    # Load actual stock data
+    actual_data = storage.read("stocks", columns=['Date', 'Close'])
+    if actual_data.empty:
+        return {"error": "Actual stock data file not found"}
 
-        # Load predicted stock data
-        if os.path.exists(predictions_path):
-            predicted_data = pd.read_csv(predictions_path)
-            predicted_data['Date'] = pd.to_datetime(predicted_data['Date'])
-        else:
-            return jsonify({"error": "Predicted stock data file not found"})
+    # Load predicted stock data
+    predicted_data = storage.read("predictions")
+    if predicted_data.empty:
+        return {"error": "Predicted stock data file not found"}
 
-        # Merge actual and predicted data
-        merged_data = pd.merge(actual_data, predicted_data, on="Date", how="inner")
-        merged_data = merged_data[['Date', 'Close', 'Predicted_Price']]
+    # Merge actual and predicted data
+    merged_data = pd.merge(actual_data, predicted_data, on="Date", how="inner")
+    merged_data = merged_data[['Date', 'Close', 'Predicted_Price']]
 
-        # Format Date column to 'yyyy/MM/dd'
-        merged_data['Date'] = merged_data['Date'].dt.strftime('%Y/%m/%d')
+    # Format Date column to 'yyyy/MM/dd'
+    merged_data['Date'] = merged_data['Date'].dt.strftime('%Y/%m/%d')
 
-        # Get last 7 days of actual vs predicted prices
-        last_7_days = merged_data.sort_values("Date", ascending=False).head(7)
+    # Get last 7 days of actual vs predicted prices
+    last_7_days = merged_data.sort_values("Date", ascending=False).head(7)
 
-        # Convert to JSON and return
-        result = last_7_days.to_dict(orient="records")
-        return jsonify(result)
+    # Convert to JSON format
+    return last_7_days.to_dict(orient="records")
 
+# API to fetch the past 7 days of actual vs predicted stock prices
+@app.route('/past_predictions', methods=['GET'])
+def past_predictions():
+    try:
+        return cached_json("past_predictions", ["stocks", "predictions"], get_past_predictions)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch past predictions: {str(e)}"})
 
+# Function to build the last 7 days of FGI data, excluding tomorrow's value
+def get_past_fgi():
+    # Load the newest FGI rows
+    fgi_data = storage.tail("fgi", 8, columns=['Date', 'FGI_Normalized', 'Market_Sentiment'])
+
+    if not fgi_data.empty:
+        fgi_data['Date'] = fgi_data['Date'].dt.strftime('%Y-%m-%d')
+
+        # Exclude the last row (tomorrow's FGI value)
+        past_7_days_fgi = fgi_data.iloc[-8:-1][['Date', 'FGI_Normalized', 'Market_Sentiment']]
+
+        # Convert to dictionary format
+        return past_7_days_fgi.to_dict(orient="records")
+    else:
+        return {"error": "FGI data file not found"}
+
 # API to get the latest 5 days of FGI data
 @app.route('/fgi_data', methods=['GET'])
 def get_fgi_data():
     """Fetch the last 7 days of FGI data, excluding tomorrow's value."""
     try:
-        # Define the path to fgi_data_with_fgi.csv
-        fgi_path = "./data/fgi_data_with_fgi.csv"
+        return cached_json("fgi_data", ["fgi"], get_past_fgi)
+    except Exception as e:
+        return jsonify({"error": f"Failed to fetch FGI data: {str(e)}"})
 
-        if os.path.exists(fgi_path):
-            # Load FGI data
-            fgi_data = pd.read_csv(fgi_path)
-            fgi_data['Date'] = pd.to_datetime(fgi_data['Date']).dt.strftime('%Y-%m-%d')
+# Function to build tomorrow's FGI value
+def get_tomorrow_fgi():
+    # Load the newest FGI row
+    fgi_data = storage.tail("fgi", 1, columns=['Date', 'FGI_Normalized', 'Market_Sentiment'])
 
-            # Exclude the last row (tomorrow's FGI value)
-            past_7_days_fgi = fgi_data.iloc[-8:-1][['Date', 'FGI_Normalized', 'Market_Sentiment']]
+    if not fgi_data.empty:
+        fgi_data['Date'] = fgi_data['Date'].dt.strftime('%Y-%m-%d')
 
-            # Convert to dictionary format
-            return jsonify(past_7_days_fgi.to_dict(orient="records"))
-        else:
-            return jsonify({"error": "FGI data file not found"})
+        # Get the last row (tomorrow's FGI value)
+        return fgi_data.iloc[-1][['Date', 'FGI_Normalized', 'Market_Sentiment']].to_dict()
+    else:
+        return {"error": "FGI data file not found"}
 
-    except Exception as e:
-        return jsonify({"error": f"Failed to fetch FGI data: {str(e)}"})
-    
 @app.route('/fgi_tomorrow', methods=['GET'])
 def get_fgi_tomorrow():
     """Fetch only tomorrow's FGI (Fear & Greed Index) value."""
     try:
-        # Define the path to fgi_data_with_fgi.csv
-        fgi_path = "./data/fgi_data_with_fgi.csv"
-
-        if os.path.exists(fgi_path):
-            # Load FGI data
-            fgi_data = pd.read_csv(fgi_path)
-            fgi_data['Date'] = pd.to_datetime(fgi_data['Date']).dt.strftime('%Y-%m-%d')
-
-            # Get the last row (tomorrow's FGI value)
-            tomorrow_fgi = fgi_data.iloc[-1][['Date', 'FGI_Normalized', 'Market_Sentiment']].to_dict()
-
-            return jsonify(tomorrow_fgi)
-        else:
-            return jsonify({"error": "FGI data file not found"})
-
+        return cached_json("fgi_tomorrow", ["fgi"], get_tomorrow_fgi)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch tomorrow's FGI data: {str(e)}"})
 import pandas as pd
@@ -338,12 +359,11 @@ import pandas as pd
 # Function to load past recommendations from CSV
 def load_past_recommendations():
     try:
-        recommendation_path = os.path.join(base_dir, "data", "recommendations.csv")
-        
-        # Ensure the file exists
-        if os.path.exists(recommendation_path):
-            recommendations_df = pd.read_csv(recommendation_path)
-            recommendations_df['Date'] = pd.to_datetime(recommendations_df['Date']).dt.strftime('%Y/%m/%d')  # Ensure Date is in datetime format
+        recommendations_df = storage.read("recommendations")
+
+        # Ensure recommendations exist
+        if not recommendations_df.empty:
+            recommendations_df['Date'] = recommendations_df['Date'].dt.strftime('%Y/%m/%d')  # Format dates for the app
             
             # Sort by Date in descending order to get the most recent first
             recommendations_df = recommendations_df.sort_values(by="Date", ascending=False)
@@ -354,49 +374,67 @@ def load_past_recommendations():
     except Exception as e:
         return {"error": f"Failed to load recommendation data: {str(e)}"}
 
+# Function to build past stock recommendations (excluding the most recent one)
+def get_past_recommendations():
+    # Load past recommendations
+    recommendations_df = load_past_recommendations()
+
+    if isinstance(recommendations_df, dict) and 'error' in recommendations_df:
+        return recommendations_df
+
+    # Exclude the most recent recommendation (i.e., exclude the last row)
+    recommendations_df = recommendations_df.iloc[1:]
+
+    # Convert to JSON format
+    return recommendations_df.to_dict(orient="records")
+
 # API to get past stock recommendations (excluding the most recent one)
 @app.route('/past_recommendations', methods=['GET'])
 def past_recommendations():
     try:
-        # Load past recommendations from CSV
-        recommendations_df = load_past_recommendations()
-        
-        if isinstance(recommendations_df, dict) and 'error' in recommendations_df:
-            return jsonify(recommendations_df)
-        
-        # Exclude the most recent recommendation (i.e., exclude the last row)
-        recommendations_df = recommendations_df.iloc[1:]
-
-        # Convert to JSON format
-        result = recommendations_df.to_dict(orient="records")
-        return jsonify(result)
-    
+        return cached_json("past_recommendations", ["recommendations"], get_past_recommendations)
     except Exception as e:
         return jsonify({"error": f"Failed to fetch past recommendations: {str(e)}"}) 
 
+# API to get every stored recommendation of one symbol, newest first
+@app.route('/recommendations', methods=['GET'])
+def symbol_recommendations():
+    symbol = request.args.get("symbol", market_data.symbol)
+    try:
+        if symbol == market_data.symbol:
+            return cached_json("recommendations", ["recommendations"], lambda: tickers.recommendations(symbol))
+        if symbol not in market_data.stored_symbols():
+            return jsonify({"error": f"No recommendations stored for {symbol}"}), 404
+        return cached_json(f"recommendations:{symbol}", ["recommendations"], lambda: tickers.recommendations(symbol),
+                           root=market_data.symbol_root(symbol))
+    except Exception as e:
+        return jsonify({"error": f"Failed to fetch recommendations for {symbol}: {str(e)}"})
 
+# API to get the overall market sentiment from the last news refresh
+@app.route('/market_sentiment', methods=['GET'])
+def get_market_sentiment():
+    record = market_sentiment.latest()
+    if record is None:
+        return jsonify({"error": "Market sentiment has not been computed yet"}), 404
+    return jsonify(record)
 
+# API to inspect the response cache (hits, misses and 304s per endpoint)
+@app.route('/cache_stats', methods=['GET'])
+def cache_stats():
+    return jsonify(response_cache_stats())
 
 
-# Function to save predictions in a CSV file
-def save_prediction(date, predicted_price):
-    """Save the predicted stock price to a CSV file."""
-    try:
-        new_data = pd.DataFrame({"Date": [date], "Predicted_Price": [predicted_price]})
 
-        if os.path.exists(predictions_path):
-            existing_data = pd.read_csv(predictions_path)
-            updated_data = pd.concat([existing_data, new_data], ignore_index=True)
-        else:
-            updated_data = new_data
-
-        # Save to CSV
-        updated_data.to_csv(predictions_path, index=False)
-    except Exception as e:
-        print(f"Error saving prediction: {e}")
 
 
 # ====================== RUN FLASK APP ======================
 if __name__ == '__main__':
+    # ✅ Refresh data and load the LSTM model before serving (workers importing app skip this)
+    run_refresh()
+    print("[✔] Loading LSTM model...")
+    preload(model_path)
+    serving.current()  # Every deployed model and its bundle's scaler, loaded and warmed once
+    print("[✔] LSTM model loaded.")
+
     print("[✔] Flask server is running...")
     app.run(host='0.0.0.0', port=5000, debug=False)  # Allows external connections
@@ -0,0 +1,79 @@
+# 🧠 Model families from deeplearning_models/, buildable from a flat parameter dict
+#   lstm, rnn, hybrid → Keras (saved as .keras); transformer → PyTorch (torch_transformer.py, saved as .pt)
+families = {"lstm": "keras", "rnn": "keras", "hybrid": "keras", "transformer": "torch"}
+artifact_suffix = {"keras": ".keras", "torch": ".pt"}
+
+
+def _lstm(keras, window, n_features, params):
+    """LSTM_model.ipynb: one LSTM layer, dropout, a linear output."""
+    return keras.Sequential([
+        keras.Input(shape=(window, n_features)),
+        keras.layers.LSTM(params["units"]),
+        keras.layers.Dropout(params["dropout"]),
+        keras.layers.Dense(1),
+    ])
+
+
+def _rnn(keras, window, n_features, params):
+    """RNN_model.ipynb: two stacked ReLU SimpleRNN layers with dropout."""
+    return keras.Sequential([
+        keras.Input(shape=(window, n_features)),
+        keras.layers.SimpleRNN(params["units"], activation="relu", return_sequences=True),
+        keras.layers.Dropout(params["dropout"]),
+        keras.layers.SimpleRNN(params["units"], activation="relu"),
+        keras.layers.Dropout(params["dropout"]),
+        keras.layers.Dense(1),
+    ])
+
+
+def _hybrid(keras, window, n_features, params):
+    """LSTM + Transformer_model.ipynb: transformer blocks and a bidirectional LSTM side by side."""
+    layers = keras.layers
+    inputs = keras.Input(shape=(window, n_features))
+    x = inputs
+    for _ in range(params.get("num_layers", 2)):
+        attention = layers.MultiHeadAttention(key_dim=params["units"] // params.get("num_heads", 4),
+                                              num_heads=params.get("num_heads", 4))(x, x)
+        x = layers.LayerNormalization(epsilon=1e-6)(layers.Add()([layers.Dropout(params["dropout"])(attention), x]))
+        ffn = layers.Dense(n_features)(layers.Dense(params["units"], activation="relu")(x))
+        x = layers.LayerNormalization(epsilon=1e-6)(layers.Add()([layers.Dropout(params["dropout"])(ffn), x]))
+    x = layers.GlobalAveragePooling1D()(x)
+    lstm_out = layers.Bidirectional(layers.LSTM(params["units"] // 2))(inputs)
+    x = layers.Dense(params["units"], activation="relu")(layers.Concatenate()([x, lstm_out]))
+    outputs = layers.Dense(1)(layers.Dropout(params["dropout"])(x))
+    return keras.Model(inputs, outputs)
+
+
+_keras_builders = {"lstm": _lstm, "rnn": _rnn, "hybrid": _hybrid}
+
+
+def build_model(params, window, n_features, **compile_args):
+    """Returns an untrained model for params["architecture"] (compiled with Adam + MSE for Keras families).
+
+    Shared keys: units, dropout, learning_rate; hybrid and transformer also read num_heads and num_layers.
+    compile_args (e.g. jit_compile, steps_per_execution) are passed to Keras' compile().
+    """
+    architecture = params["architecture"]
+    if architecture not in families:
+        raise ValueError(f"Unknown architecture {architecture!r}; expected one of {', '.join(families)}.")
+
+    if families[architecture] == "torch":
+        from torch_transformer import TransformerTimeSeries
+        return TransformerTimeSeries(input_dim=n_features, d_model=params["units"],
+                                     num_heads=params.get("num_heads", 4), hidden_dim=params["units"] * 2,
+                                     num_layers=params.get("num_layers", 2), dropout=params["dropout"])
+
+    from tensorflow import keras
+    model = _keras_builders[architecture](keras, window, n_features, params)
+    model.compile(optimizer=keras.optimizers.Adam(learning_rate=params["learning_rate"]), loss="mean_squared_error",
+                  **compile_args)
+    return model
+
+
+def save_model(model, architecture, path):
+    """Saves a model built by build_model in its family's format (see artifact_suffix)."""
+    if families[architecture] == "torch":
+        import torch_transformer
+        torch_transformer.save(model, path)
+    else:
+        model.save(path)
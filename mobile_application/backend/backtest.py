@@ -0,0 +1,153 @@
+import os
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import indicators
+from model import load_trained_model, load_preprocessor, sequence_length
+from sequences import make_sequences
+from stock_recommendations import recommend
+
+# Define paths
+base_dir = os.path.dirname(os.path.abspath(__file__))
+history_path = os.path.join(base_dir, "..", "..", "data", "Nifty50_Train_max.csv")  # Full training history
+
+long_positions = ["BUY", "STRONG BUY"]
+short_positions = ["SELL", "STRONG SELL"]
+
+
+def load_history(path=history_path):
+    """Loads a Date/Close history in chronological order, without missing closes."""
+    data = pd.read_csv(path, usecols=["Date", "Close"])
+    data['Date'] = pd.to_datetime(data['Date'])
+    return data[pd.notnull(data['Close'])].sort_values(by='Date').reset_index(drop=True)
+
+
+def walk_forward_predictions(closes, model=None, batch_size=1024, preprocessor=None):
+    """Predicts every next close from the 60 closes before it, exactly as model.py would on that day.
+
+    All windows (zero-copy views over the history) are scaled in one NumPy op with the model's bundle
+    preprocessing, then scored batch_size at a time. Returns the predictions for closes[60:].
+    """
+    model = model or load_trained_model()
+    preprocessor = preprocessor or load_preprocessor()
+    X, _ = make_sequences(np.asarray(closes, dtype=np.float64), sequence_length)
+    X = X[:, -preprocessor.window:]  # Models trained on shorter windows see the latest closes only
+    scaled = preprocessor.transform(X)
+    predicted_scaled = np.empty((len(X), 1))
+    for start in range(0, len(X), batch_size):
+        batch = model.predict_on_batch(scaled[start:start + batch_size])
+        predicted_scaled[start:start + batch_size] = np.asarray(batch)[:, :1]
+    return preprocessor.inverse_transform(predicted_scaled, X)[:, 0]
+
+
+def point_in_time_fgi(closes, interest_rate, gdp, inflation):
+    """FGI_Normalized for each day using only the days up to it (running min/max, no look-ahead)."""
+    closes = pd.Series(closes, dtype=float)
+    atr_14 = indicators.atr(indicators.estimated_true_range(closes))
+    score = pd.Series(indicators.fgi_score(indicators.sma(closes, 50), indicators.sma(closes, 200),
+                                           indicators.rsi(closes, 14), atr_14, interest_rate, gdp, inflation))
+    low, high = score.cummin(), score.cummax()
+    return ((score - low) / (high - low) * 100).to_numpy()
+
+
+def run_backtest(data, model=None, batch_size=1024, market_sentiment="neutral", cost_bps=0.0,
+                 macro_inputs=None, preprocessor=None):
+    """Replays the history day by day and returns one row per trading day with its prediction and P&L.
+
+    On each day the model sees the last 60 closes, the recommendation rules see today's close, the
+    prediction, today's FGI and market_sentiment (no historical news exists), and the position is
+    held until the next close. cost_bps is charged per unit of position change.
+    """
+    if macro_inputs is None:
+        from fgi_model import load_macro_inputs
+        macro_inputs = load_macro_inputs()
+
+    closes = data['Close'].to_numpy(dtype=np.float64)
+    predicted = walk_forward_predictions(closes, model, batch_size, preprocessor)
+    fgi = point_in_time_fgi(closes, *macro_inputs)
+
+    # Day t predicts day t + 1
+    today = slice(sequence_length - 1, len(closes) - 1)
+    results = pd.DataFrame({
+        "Date": data['Date'].iloc[today].dt.strftime('%Y-%m-%d').to_numpy(),
+        "Today_Close": closes[today],
+        "Predicted_Close": predicted,
+        "Next_Close": closes[sequence_length:],
+        "FGI_Score": fgi[today],
+    })
+    results["Recommendation"] = recommend(results["Today_Close"].to_numpy(), predicted,
+                                          results["FGI_Score"].to_numpy(), market_sentiment)
+
+    position = (np.isin(results["Recommendation"], long_positions).astype(float)
+                - np.isin(results["Recommendation"], short_positions))
+    turnover = np.abs(np.diff(position, prepend=0.0))
+    results["Position"] = position
+    results["Return"] = position * (results["Next_Close"] / results["Today_Close"] - 1) - turnover * cost_bps / 1e4
+    return results
+
+
+def summarize(results):
+    """Forecast error, directional accuracy and strategy P&L for a backtest."""
+    error = results["Predicted_Close"] - results["Next_Close"]
+    actual_move = np.sign(results["Next_Close"] - results["Today_Close"])
+    predicted_move = np.sign(results["Predicted_Close"] - results["Today_Close"])
+    moved = actual_move != 0
+    traded = results["Position"] != 0
+
+    equity = (1 + results["Return"]).cumprod()
+    return {
+        "days": len(results),
+        "start": results["Date"].iloc[0],
+        "end": results["Date"].iloc[-1],
+        "mae": float(error.abs().mean()),
+        "rmse": float(np.sqrt((error ** 2).mean())),
+        "directional_accuracy": float((actual_move[moved] == predicted_move[moved]).mean()),
+        "trades": int(traded.sum()),
+        "hit_rate": float((results["Return"][traded] > 0).mean()),
+        "strategy_return": float(equity.iloc[-1] - 1),
+        "buy_and_hold_return": float(results["Next_Close"].iloc[-1] / results["Today_Close"].iloc[0] - 1),
+        "max_drawdown": float((equity / equity.cummax() - 1).min()),
+        "recommendations": results["Recommendation"].value_counts().to_dict(),
+    }
+
+
+# Run as a script: walk-forward backtest over the full training history
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Walk-forward backtest of the saved LSTM model.")
+    parser.add_argument("--data", default=history_path, help="CSV with Date and Close columns")
+    parser.add_argument("--start", help="First prediction date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last prediction date (YYYY-MM-DD)")
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--sentiment", default="neutral", choices=["positive", "neutral", "negative"],
+                        help="Market sentiment assumed on every day")
+    parser.add_argument("--cost-bps", type=float, default=0.0, help="Cost per position change, in basis points")
+    parser.add_argument("--output", help="Optional CSV path for the per-day results")
+    parser.add_argument("--model", help="Registered model to evaluate, e.g. rnn@v1 (default: the saved LSTM)")
+    args = parser.parse_args()
+
+    model = preprocessor = None
+    if args.model:
+        from serving import resolve
+        from model_registry import get_model
+        from model_bundle import get_preprocessor
+        model_path = resolve(args.model)[1]
+        model, preprocessor = get_model(model_path), get_preprocessor(model_path)
+
+    start_time = time.perf_counter()
+    results = run_backtest(load_history(args.data), model, batch_size=args.batch_size,
+                           market_sentiment=args.sentiment, cost_bps=args.cost_bps, preprocessor=preprocessor)
+    if args.start:
+        results = results[results["Date"] >= args.start]
+    if args.end:
+        results = results[results["Date"] <= args.end]
+    results = results.reset_index(drop=True)
+
+    for key, value in summarize(results).items():
+        print(f"{key:>22}: {value:.4f}" if isinstance(value, float) else f"{key:>22}: {value}")
+    print(f"[✔] Backtest finished in {time.perf_counter() - start_time:.2f}s")
+    if args.output:
+        results.to_csv(args.output, index=False)
+        print(f"[✔] Per-day results saved to {args.output}")
@@ -0,0 +1,175 @@
+import os
+import glob
+import threading
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+import storage
+import market_data
+from model import load_trained_model, load_preprocessor, sequence_length, prediction_margin
+from trading_calendar import next_sessions
+
+# Define paths
+base_dir = os.path.dirname(__file__)
+tickers_dir = os.path.join(base_dir, "data", "tickers")  # Optional <SYMBOL>.csv files with Date/Close
+
+default_symbol = "^NSEI"  # The stocks table holds the Nifty 50 index
+max_horizon = 30  # Longest recursive forecast served, in trading days
+
+# 🗃️ Parsed close history per symbol, keyed on the (path, mtime, size) of its source files
+_history_cache = {}
+_history_lock = threading.Lock()
+
+
+# ====================== PRICE HISTORY ======================
+
+def _history_sources(tickers_dir=tickers_dir):
+    """{symbol: (signature, read)}: the stocks tables and data/tickers/*.csv, with a reader for each."""
+    columns = ["Date", "Close"]
+    sources = {default_symbol: (storage.signature("stocks"), partial(storage.read, "stocks", columns=columns))}
+    for symbol in market_data.stored_symbols():  # Constituents refreshed by tickers.py
+        root = market_data.symbol_root(symbol)
+        sources[symbol] = (storage.signature("stocks", root), partial(storage.read, "stocks", columns=columns, root=root))
+    for path in sorted(glob.glob(os.path.join(tickers_dir, "*.csv"))):
+        stat = os.stat(path)
+        sources[os.path.splitext(os.path.basename(path))[0]] = ((path, stat.st_mtime_ns, stat.st_size),
+                                                                partial(pd.read_csv, path, usecols=columns))
+    return sources
+
+
+def _close_series(data):
+    """(dates, closes) sorted by date as read-only arrays (they are shared between requests), or None."""
+    if data.empty:
+        return None
+    data['Date'] = pd.to_datetime(data['Date'])
+    data = data[pd.notnull(data['Close'])].sort_values(by='Date')
+    dates, closes = data['Date'].to_numpy(), data['Close'].to_numpy(dtype=np.float64)
+    dates.flags.writeable = closes.flags.writeable = False
+    return dates, closes
+
+
+def load_close_history(tickers_dir=tickers_dir, symbols=None):
+    """Returns {symbol: (dates, closes)} sorted by date, from the stocks tables and data/tickers/*.csv.
+
+    Only the given symbols (default: all) are loaded, and a symbol's files are only read again after they changed.
+    """
+    history = {}
+    for symbol, (signature, read) in _history_sources(tickers_dir).items():
+        if symbols is not None and symbol not in symbols:
+            continue
+        entry = _history_cache.get(symbol)
+        if entry is None or entry[0] != signature:
+            entry = (signature, _close_series(read()))
+            with _history_lock:
+                _history_cache[symbol] = entry
+        if entry[1] is not None:
+            history[symbol] = entry[1]
+    return history
+
+
+def expand_date_range(history, symbols, start, end):
+    """Returns (symbol, as_of) requests for every trading day in [start, end] with a full window behind it."""
+    requests = []
+    for symbol in symbols:
+        dates = history[symbol][0][sequence_length - 1:]
+        in_range = (dates >= pd.Timestamp(start).to_datetime64()) & (dates <= pd.Timestamp(end).to_datetime64())
+        requests.extend((symbol, date) for date in dates[in_range])
+    return requests
+
+
+# ====================== BATCH INFERENCE ======================
+
+def gather_windows(history, requests):
+    """Stacks the 60 closes ending on or before each (symbol, as_of) into one (n, 60) array.
+
+    as_of=None means the latest close. Returns the windows and the date of each window's last close.
+    """
+    windows = np.empty((len(requests), sequence_length))
+    last_dates = []
+    for row, (symbol, as_of) in enumerate(requests):
+        if symbol not in history:
+            raise KeyError(f"No price history for {symbol}.")
+        dates, closes = history[symbol]
+        if as_of is None:
+            position = len(dates) - 1
+        else:
+            position = np.searchsorted(dates, pd.Timestamp(as_of).to_datetime64(), side="right") - 1
+        if position < sequence_length - 1:
+            raise ValueError(f"Need {sequence_length} closes for {symbol} up to {as_of}, got {max(position + 1, 0)}.")
+        windows[row] = closes[position - sequence_length + 1:position + 1]
+        last_dates.append(pd.Timestamp(dates[position]))
+    return windows, last_dates
+
+
+def forecast_windows(windows, horizon=1, model=None, symbols=None, preprocessor=None):
+    """Recursively forecasts horizon steps for every window with one model call per step.
+
+    Each step scales every window at once with the served model's bundle preprocessing (see
+    model_bundle.py), predicts all windows, and slides the predicted close into the window.
+    symbols names each window's series; None means they are all the series the model was trained
+    on (the index). Returns an (n, horizon) array of prices.
+    """
+    model = model or load_trained_model()
+    preprocessor = preprocessor or load_preprocessor()
+    if preprocessor.features != ["Close"]:
+        raise ValueError(f"Recursive forecasts need a Close-only model, got features {preprocessor.features}.")
+    fitted = True if symbols is None else preprocessor.fits(symbols)
+    windows = np.array(windows, dtype=np.float64)
+    prices = np.empty((len(windows), horizon))
+    for step in range(horizon):
+        predicted_scaled = model.predict_on_batch(preprocessor.transform(windows, fitted))
+        predicted = preprocessor.inverse_transform(predicted_scaled, windows, fitted)
+
+        prices[:, step] = predicted[:, 0]
+        windows = np.concatenate([windows[:, 1:], predicted], axis=1)
+    return prices
+
+
+def predict_batch(requests, horizon=1, history=None, model=None):
+    """Forecasts 1..horizon trading days ahead for many (symbol, as_of) pairs in one batch.
+
+    Each request is served by the deployed model its symbol and forecast date route to (see
+    serving.py), unless a model is given. Returns one record per request and step with the
+    forecast date, price, ±range and serving model.
+    """
+    if not 1 <= horizon <= max_horizon:
+        raise ValueError(f"horizon must be between 1 and {max_horizon}, got {horizon}.")
+    history = load_close_history() if history is None else history
+    if not requests:
+        return []
+
+    windows, last_dates = gather_windows(history, requests)
+
+    # Forecast dates are shared by every request with the same last close
+    schedules = {last_date: list(next_sessions(last_date, horizon).strftime('%Y-%m-%d')) for last_date in set(last_dates)}
+
+    symbols = [symbol for symbol, _ in requests]
+    if model is None:
+        import serving  # Imported here: serving builds on this module
+        first_dates = [schedules[last_date][0] for last_date in last_dates]
+        prices, served = serving.forecast(windows, horizon, symbols, first_dates)
+    else:
+        prices, served = forecast_windows(windows, horizon, model, symbols), [None] * len(requests)
+
+    records = []
+    for symbol, last_date, row, model_id in zip(symbols, last_dates, prices, served):
+        for step, (date, price) in enumerate(zip(schedules[last_date], row), start=1):
+            records.append({
+                "Symbol": symbol,
+                "As_Of": last_date.strftime('%Y-%m-%d'),
+                "Step": step,
+                "Date": date,
+                "Predicted_Price": float(price),
+                "Prediction_Range": [float(price) - prediction_margin, float(price) + prediction_margin],
+                "Model": model_id,
+            })
+    return records
+
+
+# Run as a script: a week of forecasts for every known symbol
+if __name__ == "__main__":
+    history = load_close_history()
+    for record in predict_batch([(symbol, None) for symbol in history], horizon=5, history=history):
+        print(f"{record['Symbol']:>12} {record['Date']} (+{record['Step']}): {record['Predicted_Price']:.2f}")
@@ -0,0 +1,58 @@
+"""Walk-forward backtest: batched inference vs one model call per day.
+
+Run from the backend folder:  python benchmarks/bench_backtest.py [--loop-days 300]
+
+The per-day loop is model.py's path verbatim (the bundle's scaler on the last 60 closes,
+batch size 1). It runs on the last --loop-days days only and is extrapolated
+to the full history; its predictions must match the batched ones.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtest import load_history, walk_forward_predictions
+from model import load_trained_model, load_preprocessor
+
+
+def loop_predictions(model, closes):
+    """One predict_on_batch call per day, like calling predict_next_closing_price daily."""
+    preprocessor = load_preprocessor()
+    predictions = []
+    for end in range(60, len(closes)):
+        window = closes[np.newaxis, end - 60:end]
+        predicted_scaled = model.predict_on_batch(preprocessor.transform(window))
+        predictions.append(preprocessor.inverse_transform(predicted_scaled, window)[0, 0])
+    return np.array(predictions)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--loop-days", type=int, default=300)
+    parser.add_argument("--batch-sizes", type=int, nargs="*", default=[256, 1024, 4096])
+    args = parser.parse_args()
+
+    model = load_trained_model()
+    closes = load_history()["Close"].to_numpy(dtype=np.float64)
+    days = len(closes) - 60
+
+    for batch_size in args.batch_sizes:
+        start = time.perf_counter()
+        batched = walk_forward_predictions(closes, model, batch_size)
+        print(f"batched (batch {batch_size:>5}): {days} days in {time.perf_counter() - start:6.2f} s")
+
+    tail = closes[-(args.loop_days + 60):]
+    start = time.perf_counter()
+    looped = loop_predictions(model, tail)
+    loop_seconds = time.perf_counter() - start
+    np.testing.assert_allclose(batched[-args.loop_days:], looped, rtol=1e-5)
+    print(f"per-day loop: {args.loop_days} days in {loop_seconds:6.2f} s "
+          f"(~{loop_seconds / args.loop_days * days:.0f} s for the full history, predictions agree to 1e-5)")
+
+
+if __name__ == "__main__":
+    main()
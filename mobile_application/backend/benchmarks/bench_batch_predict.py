@@ -0,0 +1,103 @@
+"""Batch multi-horizon inference: agreement with model.py and speed vs one call per ticker/step.
+
+Run from the backend folder:  python benchmarks/bench_batch_predict.py [--tickers 50] [--horizon 5]
+
+Synthetic tickers are rescaled slices of data/Nifty50_Train_max.csv. The per-request loop
+reproduces the original per-request path (sklearn MinMaxScaler per window, batch size 1; the
+bundle's fitted scaler is for the index only, so constituents are still scaled per window) and
+is what a week of forecasts for every constituent would cost without batching.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+repo_dir = os.path.dirname(os.path.dirname(backend_dir))
+sys.path.insert(0, backend_dir)
+
+import model as model_module
+import storage
+from batch_predict import load_close_history, expand_date_range, gather_windows, predict_batch, default_symbol
+
+
+def loop_forecast(model, windows, horizon):
+    """One predict_on_batch per window and step, with a MinMaxScaler fit on each window."""
+    from sklearn.preprocessing import MinMaxScaler
+
+    prices = np.empty((len(windows), horizon))
+    for row, window in enumerate(windows):
+        window = list(window)
+        for step in range(horizon):
+            scaler = MinMaxScaler(feature_range=(0, 1))
+            scaled = scaler.fit_transform(np.array(window[-60:]).reshape(-1, 1))
+            predicted_scaled = model.predict_on_batch(scaled.reshape(1, 60, 1))
+            price = scaler.inverse_transform([[predicted_scaled[0, 0]]])[0, 0]
+            prices[row, step] = price
+            window.append(price)
+    return prices
+
+
+def synthetic_history(tickers, seed=0):
+    """Rescaled, shifted copies of the Nifty 50 history, one per fake ticker."""
+    base = pd.read_csv(os.path.join(repo_dir, "data", "Nifty50_Train_max.csv"), usecols=["Date", "Close"]).dropna()
+    dates = pd.to_datetime(base["Date"]).to_numpy()
+    closes = base["Close"].to_numpy(dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    history = {}
+    for index in range(tickers):
+        offset = int(rng.integers(0, 500))
+        history[f"SYN{index:02d}.NS"] = (dates[offset:], closes[offset:] * rng.uniform(0.01, 0.5))
+    return history
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--horizon", type=int, default=5)
+    parser.add_argument("--range-days", type=int, default=250, help="Trading days in the date-range run")
+    args = parser.parse_args()
+
+    model = model_module.load_trained_model()
+
+    # ✅ Agreement: horizon 1 on the live series matches predict_next_closing_price
+    storage.store_dir = os.path.join(tempfile.mkdtemp(prefix="batch_predict_"), "store")  # Keep the real store untouched
+    expected_date, expected_price, _ = model_module.predict_next_closing_price()
+    [record] = predict_batch([(default_symbol, None)], horizon=1, history=load_close_history())
+    assert record["Date"] == expected_date
+    np.testing.assert_allclose(record["Predicted_Price"], expected_price, rtol=1e-6)
+    print(f"model.py agreement: {record['Date']} {record['Predicted_Price']:.2f} vs {expected_price:.2f}")
+
+    # ⚡ A week of forecasts for every synthetic constituent
+    history = synthetic_history(args.tickers)
+    requests = [(symbol, None) for symbol in history]
+    windows, _ = gather_windows(history, requests)
+
+    start = time.perf_counter()
+    looped = loop_forecast(model, windows, args.horizon)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    records = predict_batch(requests, horizon=args.horizon, history=history, model=model)
+    batch_seconds = time.perf_counter() - start
+
+    batched = np.array([record["Predicted_Price"] for record in records]).reshape(len(requests), args.horizon)
+    np.testing.assert_allclose(batched, looped, rtol=1e-5)
+    print(f"{args.tickers} tickers x {args.horizon} days: loop {loop_seconds * 1e3:8.1f} ms  "
+          f"batch {batch_seconds * 1e3:8.1f} ms  ({loop_seconds / batch_seconds:.1f}x, agree to 1e-5)")
+
+    # 📅 Date range: one-step forecasts for every day of the last year of one ticker
+    symbol = next(iter(history))
+    dates = history[symbol][0]
+    range_requests = expand_date_range(history, [symbol], dates[-args.range_days], dates[-1])
+    start = time.perf_counter()
+    predict_batch(range_requests, horizon=1, history=history, model=model)
+    print(f"{len(range_requests)} as-of dates x 1 day: batch {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
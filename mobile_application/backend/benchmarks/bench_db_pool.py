@@ -0,0 +1,123 @@
+"""Auth endpoints under concurrent load: a new connection per request vs the connection pool.
+
+Run from the backend folder:  python benchmarks/bench_db_pool.py [--threads 16] [--requests 2000] [--handshake-ms 5]
+
+MySQL is replaced by a SQLite stand-in (benchmarks/standin_db.py); --handshake-ms is the simulated
+TCP + auth cost of opening a connection, which is what pooling saves. "unpooled" is the same pool
+with max_lifetime=0, i.e. every request opens and closes its own connection like before.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app as app_module
+from db_pool import ConnectionPool, PoolTimeout
+from standin_db import create_users_db, standin_connect
+
+
+def run_load(pool, threads, requests, users):
+    """Fires /login and /user/<id> calls from `threads` workers; returns (req/s, p50 ms, p99 ms)."""
+    app_module.db_pool = pool
+    client = app_module.app.test_client()
+    latencies = []
+    lock = threading.Lock()
+
+    def call(index):
+        user = index % users
+        start = time.perf_counter()
+        if index % 2:
+            response = client.post("/login", json={"email": f"user{user}@example.com", "password": f"password{user}"})
+        else:
+            response = client.get(f"/user/{user + 1}")
+        elapsed = time.perf_counter() - start
+        assert response.status_code == 200, response.get_json()
+        with lock:
+            latencies.append(elapsed)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(call, range(requests)))
+    seconds = time.perf_counter() - start
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    return requests / seconds, p50, p99
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--pool-size", type=int, default=8)
+    parser.add_argument("--handshake-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix="db_pool_"), "users.db")
+    create_users_db(db_path, args.users)
+    connect = standin_connect(db_path, args.handshake_ms)
+
+    # ✅ /register goes through the pool and commits
+    pool = ConnectionPool(connect, max_size=args.pool_size)
+    app_module.db_pool = pool
+    response = app_module.app.test_client().post("/register", json={
+        "name": "New User", "email": "new@example.com", "username": "new", "phone": "9800000000", "password": "pw"})
+    assert response.status_code == 201, response.get_json()
+    assert app_module.app.test_client().post(
+        "/login", json={"email": "new@example.com", "password": "pw"}).get_json()["success"]
+
+    print(f"{args.threads} threads, {args.requests} requests, {args.handshake_ms:.0f} ms simulated handshake")
+    unpooled = ConnectionPool(connect, max_size=args.threads, max_lifetime=0)
+    rate, p50, p99 = run_load(unpooled, args.threads, args.requests, args.users)
+    print(f"  unpooled : {rate:8.0f} req/s  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  "
+          f"connections opened {unpooled.status()['created']}")
+
+    pooled = ConnectionPool(connect, max_size=args.pool_size)
+    rate, p50, p99 = run_load(pooled, args.threads, args.requests, args.users)
+    print(f"  pooled   : {rate:8.0f} req/s  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  "
+          f"connections opened {pooled.status()['created']} (max {args.pool_size})")
+
+    # ✅ Stale connections are recycled, broken ones replaced, and waits are bounded
+    pooled.ping_after = 0
+    for conn, _, _ in list(pooled._idle):
+        conn.close()  # Simulate the server dropping idle connections
+    with pooled.connection() as conn:
+        conn.ping()
+    assert pooled.status()["broken"] >= 1
+    pooled.max_lifetime = 0
+    with pooled.connection():
+        pass
+    assert pooled.status()["recycled"] >= 1
+    broken = pooled.status()["broken"]
+    try:
+        with pooled.connection() as conn:
+            conn.close()  # The server goes away mid-request, so the rollback fails too
+            raise LookupError("caller's error")
+    except LookupError:
+        pass  # The caller's error surfaces, not the rollback's
+    assert pooled.status()["broken"] == broken + 1
+
+    tiny = ConnectionPool(connect, max_size=1, wait_timeout=0.05)
+    with tiny.connection():
+        try:
+            with tiny.connection():
+                raise AssertionError("second checkout should time out")
+        except PoolTimeout:
+            pass
+    app_module.db_pool = tiny
+    with tiny.connection():
+        assert app_module.app.test_client().get("/user/1").status_code == 503
+    print("  checks   : lifetime recycling, broken-connection replacement, caller's error kept, wait timeout (503) ok")
+    print("  pool     :", pooled.status())
+
+
+if __name__ == "__main__":
+    main()
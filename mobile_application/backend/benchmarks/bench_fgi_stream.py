@@ -0,0 +1,71 @@
+"""Incremental FGI: agreement with fgi_model's windowed batch output and per-bar cost vs a full recompute.
+
+Run from the backend folder:  python benchmarks/bench_fgi_stream.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+repo_dir = os.path.dirname(os.path.dirname(backend_dir))
+sys.path.insert(0, backend_dir)
+
+import fgi_model
+from fgi_stream import FGIState
+
+interest_rate, gdp, inflation = 1.7046, 3.57e12, 5.65
+compared_columns = ["SMA_50", "SMA_200", "EMA_50", "EMA_200", "True_Range", "ATR_14", "RSI_14", "FGI_Normalized"]
+
+
+def main():
+    history = pd.read_csv(os.path.join(repo_dir, "data", "Nifty50_Train_max.csv"))[["Date", "Close"]]
+    history = history.dropna().reset_index(drop=True)
+    warmup, live = history.iloc[:-250], history.iloc[-250:]
+
+    # 🔁 Build the state on the warm-up history, persist it, and stream the remaining bars one by one
+    state = FGIState.from_history(warmup, interest_rate, gdp, inflation)
+    state_file = os.path.join(tempfile.mkdtemp(prefix="fgi_state_"), "fgi_state.json")
+    state.save(state_file)
+    state = FGIState.load(state_file)
+
+    rows, update_seconds = [], []
+    for date, close in zip(live["Date"], live["Close"]):
+        start = time.perf_counter()
+        rows.append(state.update(date, close))
+        update_seconds.append(time.perf_counter() - start)
+    streamed = pd.DataFrame(rows)
+
+    # 🔮 What-if: tomorrow's predicted close must not touch the persisted state
+    predicted_close = history["Close"].iloc[-1] * 1.01
+    before = state.to_dict()
+    start = time.perf_counter()
+    tomorrow = state.what_if("2100-01-01", predicted_close)
+    what_if_seconds = time.perf_counter() - start
+    assert state.to_dict() == before
+    streamed = pd.concat([streamed, pd.DataFrame([tomorrow])], ignore_index=True)
+
+    # 📊 fgi_model's batch output (history plus the predicted close, windowed normalization) for reference
+    start = time.perf_counter()
+    batch = fgi_model.fgi_with_prediction(history, "2100-01-01", predicted_close, interest_rate, gdp, inflation)
+    batch = batch.iloc[-len(streamed):]
+    batch_seconds = time.perf_counter() - start
+
+    for column in compared_columns:
+        np.testing.assert_allclose(streamed[column].to_numpy(), batch[column].to_numpy(), rtol=1e-9, atol=1e-9)
+    for column in ["FGI_Score", "Market_Sentiment"]:
+        assert (streamed[column].to_numpy() == batch[column].to_numpy()).all(), column
+    print(f"{len(live)} streamed bars and the what-if bar agree with fgi_model (rtol 1e-9, scores and labels exact)")
+    print(f"what-if FGI for tomorrow: {tomorrow['FGI_Normalized']:.1f} ({tomorrow['Market_Sentiment']})")
+
+    print(f"incremental update: p50 {np.percentile(update_seconds, 50) * 1e6:8.1f} µs  "
+          f"p99 {np.percentile(update_seconds, 99) * 1e6:8.1f} µs")
+    print(f"what-if (copy + update): {what_if_seconds * 1e6:8.1f} µs")
+    print(f"full batch recompute ({len(history)} rows): {batch_seconds * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""FinBERT backends: FP32 vs torch dynamic int8 vs ONNX Runtime (FP32 and int8), on an offline stand-in.
+
+Run from the backend folder:  python benchmarks/bench_finbert_backends.py [--size base] [--calls 200]
+
+Each backend runs in a fresh worker process on the same randomly initialised stand-in (same seed),
+so the weights match across workers. The ONNX files are exported once up front, as in production,
+and their export (+ quantization) time is reported as the conversion time; the ONNX workers then
+load just the tokenizer, config and .onnx file, as sentiment_analysis.load_finbert does once the
+files exist. Reported: resident memory added by the model (over the torch/transformers/onnxruntime
+imports) once loaded and after scoring, single-text latency (what /predict pays per call) and
+throughput on news_data.csv, plus label agreement and probability drift versus FP32. With
+--size base the stand-in has FinBERT's exact dimensions. The real model's agreement report is
+`python finbert_runtime.py`, which needs the ProsusAI/finbert weights.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from finbert_runtime import backends, agreement
+
+
+def rss_mb():
+    with open("/proc/self/status") as status:
+        fields = dict(line.split(":", 1) for line in status)
+    return int(fields["VmRSS"].split()[0]) / 1024
+
+
+def onnx_paths(onnx_dir):
+    import finbert_runtime
+    return finbert_runtime.onnx_paths("standin", "local", onnx_dir)
+
+
+def export_worker(size, onnx_dir):
+    """Exports the stand-in to ONNX and quantizes it; prints the timings as one JSON line."""
+    import finbert_runtime
+    from standin_models import build_standin_finbert, load_news_texts
+
+    tokenizer, fp32_model = build_standin_finbert(load_news_texts(), size=size)
+    tokenizer.save_pretrained(onnx_dir)  # The ONNX workers load only these, like sentiment_analysis.load_finbert
+    fp32_model.config.save_pretrained(onnx_dir)
+    paths = onnx_paths(onnx_dir)
+    start = time.perf_counter()
+    finbert_runtime.export_onnx(fp32_model, tokenizer, paths["onnx"])
+    export_seconds = time.perf_counter() - start
+    finbert_runtime.quantize_onnx(paths["onnx"], paths["onnx-int8"])
+    print(json.dumps({"onnx": export_seconds, "onnx-int8": time.perf_counter() - start}))
+
+
+def worker(backend, size, calls, repeat, onnx_dir):
+    """Runs inside the child process; prints one JSON line."""
+    import gc
+
+    import numpy as np
+    import onnxruntime  # noqa: F401  Imported by every worker so the baseline is comparable
+    import torch  # noqa: F401
+    from transformers import AutoConfig, AutoTokenizer
+
+    import finbert_runtime
+    import sentiment_analysis
+    from standin_models import build_standin_finbert, load_news_texts
+
+    texts = load_news_texts(repeat=repeat)
+    baseline_rss = rss_mb()
+    start = time.perf_counter()
+    if backend.startswith("onnx"):
+        tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+        model = finbert_runtime.ONNXFinBERT(onnx_paths(onnx_dir)[backend], AutoConfig.from_pretrained(onnx_dir))
+    else:
+        tokenizer, fp32_model = build_standin_finbert(load_news_texts(), size=size)
+        start = time.perf_counter()
+        model = finbert_runtime.load_backend(fp32_model, tokenizer, backend)
+        del fp32_model  # sentiment_analysis.load_finbert keeps only the converted model
+        gc.collect()
+    convert_seconds = time.perf_counter() - start
+    loaded_rss = rss_mb()
+    sentiment_analysis.tokenizer, sentiment_analysis.model = tokenizer, model
+
+    sentiment_analysis.score_batches(["Market analysis today"])  # Warm-up
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        sentiment_analysis.score_batches(["Market analysis today"])
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    probs = sentiment_analysis.score_batches(texts)
+    batch_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "convert_seconds": convert_seconds,
+        "model_mb": loaded_rss - baseline_rss,
+        "peak_added_mb": rss_mb() - baseline_rss,
+        "p50_ms": float(np.percentile(latencies, 50) * 1e3),
+        "p99_ms": float(np.percentile(latencies, 99) * 1e3),
+        "articles_per_s": len(texts) / batch_seconds,
+        "probs": probs.tolist(),
+    }))
+
+
+def run_worker(name, args, onnx_dir):
+    command = [sys.executable, os.path.abspath(__file__), "--worker", name, "--size", args.size,
+               "--calls", str(args.calls), "--repeat", str(args.repeat), "--onnx-dir", onnx_dir]
+    output = subprocess.run(command, cwd=backend_dir, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", choices=["small", "base"], default="small")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=2, help="Repeat news_data.csv to get more articles")
+    parser.add_argument("--worker", choices=backends + ["export"], help=argparse.SUPPRESS)
+    parser.add_argument("--onnx-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker == "export":
+        return export_worker(args.size, args.onnx_dir)
+    if args.worker:
+        return worker(args.worker, args.size, args.calls, args.repeat, args.onnx_dir)
+
+    onnx_dir = tempfile.mkdtemp(prefix="finbert_onnx_")
+    export_seconds = run_worker("export", args, onnx_dir)
+    print(f"stand-in size={args.size}")
+    print(f"{'backend':<10} {'convert':>9} {'+model':>8} {'+after batch':>13} {'p50 (1 text)':>13} {'p99':>9} {'throughput':>14} "
+          f"{'labels agree':>13} {'max |Δp|':>9} {'mean |Δp|':>10}")
+    reference = None
+    for backend in backends:
+        result = run_worker(backend, args, onnx_dir)
+        result["convert_seconds"] = export_seconds.get(backend, result["convert_seconds"])
+        reference = reference if reference is not None else result["probs"]
+        report = agreement(reference, result["probs"])
+        print(f"{backend:<10} {result['convert_seconds']:>7.2f} s {result['model_mb']:>5.0f} MB {result['peak_added_mb']:>10.0f} MB "
+              f"{result['p50_ms']:>10.2f} ms {result['p99_ms']:>6.2f} ms {result['articles_per_s']:>7.1f} art/s "
+              f"{report['label_agreement']:>12.1%} {report['max_abs_diff']:>9.4f} {report['mean_abs_diff']:>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
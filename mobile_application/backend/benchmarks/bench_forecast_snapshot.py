@@ -0,0 +1,114 @@
+"""/predict throughput under concurrent clients: per-request inference vs the daily forecast snapshot.
+
+Run from the backend folder:  python benchmarks/bench_forecast_snapshot.py [--seconds 5] [--clients 1 4 16]
+
+Starts the Flask app on a threaded local HTTP server over a scratch store (migrated from the bundled
+CSVs) and hits it from N client threads, each with its own keep-alive session. "Before" is the old
+/predict body, registered as /predict_legacy: load the latest rows, run the LSTM, upsert the
+prediction twice, regenerate and rewrite the recommendation. Also checks that concurrent builds of
+the same date store exactly one snapshot.
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import requests
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import storage
+import forecast_snapshot
+from flask import jsonify
+from werkzeug.serving import make_server
+from app import app
+from model import predict_next_closing_price
+from stock_recommendations import load_latest_data, generate_recommendation, save_recommendation
+
+storage.store_dir = os.path.join(tempfile.mkdtemp(prefix="forecast_snapshot_"), "store")  # Keep the real store untouched
+
+
+@app.route('/predict_legacy', methods=['GET'])
+def legacy_prediction():
+    """The /predict route before snapshots (minus the FinBERT call removed earlier)."""
+    try:
+        latest_data = load_latest_data()
+        predicted_date, predicted_price, prediction_range = predict_next_closing_price()
+        storage.upsert("predictions", pd.DataFrame({"Date": [predicted_date], "Predicted_Price": [predicted_price]}))
+        recommendation_result = generate_recommendation()
+        save_recommendation(recommendation_result)
+        return jsonify({"Date": predicted_date, "Predicted_Price": predicted_price,
+                        "Prediction_Range": prediction_range,
+                        "Overall_Market_Sentiment": latest_data["market_sentiment"],
+                        "Recommendation": recommendation_result["Recommendation"]})
+    except Exception as e:
+        return jsonify({"error": str(e)})
+
+
+def run_clients(url, clients, seconds):
+    """Returns (requests/sec, p50 ms, p99 ms, failed requests) for `clients` threads hammering url."""
+    deadline = time.perf_counter() + seconds
+    timings, failures = [], []
+
+    def client():
+        session = requests.Session()
+        local_timings, local_failures = [], 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = session.get(url)
+            local_timings.append(time.perf_counter() - start)
+            local_failures += response.status_code != 200 or "error" in response.json()
+        timings.extend(local_timings)
+        failures.append(local_failures)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    timings = np.array(timings) * 1e3
+    return len(timings) / elapsed, np.percentile(timings, 50), np.percentile(timings, 99), sum(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    # ✅ Concurrent builds of one date store a single immutable snapshot
+    builders = [threading.Thread(target=forecast_snapshot.build_snapshot) for _ in range(8)]
+    for thread in builders:
+        thread.start()
+    for thread in builders:
+        thread.join()
+    date = forecast_snapshot.forecast_date()
+    stored = sorted(os.listdir(forecast_snapshot.snapshot_dir()))
+    assert stored == [f"{date}-v1.json", "latest.json"], stored
+    print(f"8 concurrent builds for {date}: stored {', '.join(stored)}")
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)  # No per-request access log
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    for path in ("/predict_legacy", "/predict"):
+        requests.get(base_url + path)  # Warm-up
+
+    print(f"{'endpoint':<16} {'clients':>7} {'req/s':>9} {'p50':>10} {'p99':>10} {'failed':>7}")
+    for path in ("/predict_legacy", "/predict"):
+        for clients in args.clients:
+            rate, p50, p99, failed = run_clients(base_url + path, clients, args.seconds)
+            print(f"{path:<16} {clients:>7} {rate:>9.1f} {p50:>7.2f} ms {p99:>7.2f} ms {failed:>7}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
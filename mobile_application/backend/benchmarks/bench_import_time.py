@@ -0,0 +1,52 @@
+"""Import-time report for the backend modules (python -X importtime, summarised).
+
+Run from the backend folder:  python benchmarks/bench_import_time.py [module ...]
+"""
+import os
+import subprocess
+import sys
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+default_modules = [
+    "app", "refresh", "model", "model_registry", "sentiment_analysis", "news_data",
+    "stocks_data", "fgi_data", "fgi_model", "stock_recommendations", "ingest", "market_data",
+]
+# Heavy libraries that must never be imported just by importing a backend module
+heavy_modules = {"tensorflow", "torch", "transformers", "yfinance", "pandas_market_calendars", "sklearn", "nltk",
+                 "onnxruntime", "ai_edge_litert", "tf2onnx"}
+top_n = 8
+
+
+def import_profile(module):
+    """Imports module in a fresh interpreter and returns [(name, self_us, cumulative_us)]."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=backend_dir, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main(modules):
+    for module in modules:
+        rows = import_profile(module)
+        total_ms = next(cumulative for name, _, cumulative in rows if name == module) / 1000
+        loaded_heavy = sorted({name.split(".")[0] for name, _, _ in rows} & heavy_modules)
+
+        print(f"\n=== import {module}: {total_ms:.1f} ms, {len(rows)} modules ===")
+        print(f"heavy libraries imported: {', '.join(loaded_heavy) or 'none'}")
+        top_level = [row for row in rows if "." not in row[0] and row[0] != module]
+        for name, _, cumulative in sorted(top_level, key=lambda row: row[2], reverse=True)[:top_n]:
+            print(f"  {cumulative / 1000:9.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or default_modules)
@@ -0,0 +1,151 @@
+"""Vectorized FGI indicators: golden-output check and scaling benchmark vs the old row-wise code.
+
+Run from the backend folder:  python benchmarks/bench_indicators.py [--sizes 1000 10000 100000]
+
+The golden check recomputes data/fgi_data_with_fgi.csv from data/fgi_data.csv (plus the
+predicted row it was saved with) through fgi_model.calculate_fgi_with_prediction in a
+scratch copy of data/ and a scratch store, and compares the stored FGI table with the file. Floats are compared at
+rtol=1e-12 (rolling sums can differ in the last bit across pandas versions); scores
+and labels must match exactly. The file normalized every row by the whole window, while
+fgi_model now normalizes each row by the window up to it, so FGI_Normalized and its label
+are compared on the newest (predicted) row only, which is the one served. The new engine
+must also match the old row-wise algorithm bit for bit on synthetic data.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import indicators
+import storage
+
+# Macro inputs used for the synthetic runs (same scale as the stored data files)
+interest_rate, gdp, inflation = 1.7046, 3.57e12, 5.65
+
+
+def legacy_fgi(data):
+    """The previous fgi_model implementation: Python True Range loop and row-wise apply."""
+    data['SMA_50'] = data['Close'].rolling(window=50).mean()
+    data['SMA_200'] = data['Close'].rolling(window=200).mean()
+    data['EMA_50'] = data['Close'].ewm(span=50, adjust=False).mean()
+    data['EMA_200'] = data['Close'].ewm(span=200, adjust=False).mean()
+
+    def calculate_true_range(row, prev_close):
+        if pd.isnull(row['High-Low']) or row['High-Low'] == 0:
+            row['High-Low'] = abs(prev_close * 1.01 - prev_close * 0.99)
+            row['High-Close'] = abs(prev_close * 1.01 - prev_close)
+            row['Low-Close'] = abs(prev_close * 0.99 - prev_close)
+        return max(row['High-Low'], row['High-Close'], row['Low-Close'])
+
+    data['High-Low'] = 0
+    data['High-Close'] = 0
+    data['Low-Close'] = 0
+    data['True_Range'] = 0.0  # float column: newer pandas refuses float writes into an int column
+    for i in range(1, len(data)):
+        prev_close = data.loc[i - 1, 'Close']
+        data.loc[i, 'True_Range'] = calculate_true_range(data.loc[i], prev_close)
+    data['ATR_14'] = data['True_Range'].rolling(window=14).mean()
+    data['RSI_14'] = indicators.rsi(data['Close'], 14)
+    data['Interest_Rate'] = interest_rate
+
+    gdp_points, inflation_points = indicators.gdp_score(gdp), indicators.inflation_score(inflation)
+
+    def calculate_fgi(row):
+        score = 1 if row['SMA_50'] > row['SMA_200'] else -1
+        if row['RSI_14'] < 30:
+            score -= 1
+        elif row['RSI_14'] > 70:
+            score += 1
+        if pd.notnull(row['ATR_14']) and row['ATR_14'] > data['ATR_14'].rolling(window=50).mean().iloc[row.name]:
+            score -= 1
+        else:
+            score += 1
+        if row['Interest_Rate'] < 5:
+            score += 1
+        elif row['Interest_Rate'] > 7:
+            score -= 1
+        return score + gdp_points + inflation_points
+
+    data['FGI_Score'] = data.apply(calculate_fgi, axis=1)
+    data['FGI_Normalized'] = indicators.normalize(data['FGI_Score'])
+    data['Market_Sentiment'] = indicators.classify_sentiment(data['FGI_Normalized'])
+    return data
+
+
+def synthetic_closes(rows, seed=0):
+    """Random-walk closes around Nifty 50 levels."""
+    rng = np.random.default_rng(seed)
+    close = 20000 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    return pd.DataFrame({'Date': pd.bdate_range("2000-01-03", periods=rows).date, 'Close': close})
+
+
+def golden_check():
+    """Recomputes the saved FGI file end to end and compares it with the committed output."""
+    golden_path = os.path.join(backend_dir, "data", "fgi_data_with_fgi.csv")
+    golden = pd.read_csv(golden_path)
+
+    scratch = tempfile.mkdtemp(prefix="fgi_golden_")
+    shutil.copytree(os.path.join(backend_dir, "data"), os.path.join(scratch, "data"),
+                    ignore=shutil.ignore_patterns("store"))
+    storage.data_dir = os.path.join(scratch, "data")
+    storage.store_dir = os.path.join(scratch, "data", "store")
+    # The saved file's last row is the prediction it was computed with
+    storage.upsert("predictions", pd.DataFrame({'Date': [golden['Date'].iloc[-1]],
+                                                'Predicted_Price': [golden['Close'].iloc[-1]]}))
+
+    import fgi_model
+
+    cwd = os.getcwd()
+    os.chdir(scratch)
+    try:
+        fgi_model.calculate_fgi_with_prediction()
+    finally:
+        os.chdir(cwd)
+    recomputed = storage.read("fgi")
+    recomputed['Date'] = recomputed['Date'].dt.strftime('%Y-%m-%d')
+
+    assert list(recomputed.columns) == list(golden.columns), "column order changed"
+    windowed = ['FGI_Normalized', 'Market_Sentiment']
+    pd.testing.assert_frame_equal(recomputed.drop(columns=windowed), golden.drop(columns=windowed),
+                                  check_exact=False, rtol=1e-12, atol=0)
+    pd.testing.assert_series_equal(recomputed['FGI_Score'], golden['FGI_Score'], check_exact=True)
+    pd.testing.assert_frame_equal(recomputed[windowed].tail(1), golden[windowed].tail(1), check_exact=True)
+    print(f"golden check: {len(golden)} rows match {os.path.relpath(golden_path, backend_dir)}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    parser.add_argument("--legacy-max-rows", type=int, default=10000,
+                        help="Skip the O(n²) legacy code above this many rows")
+    args = parser.parse_args()
+
+    golden_check()
+
+    for rows in args.sizes:
+        data = synthetic_closes(rows)
+        start = time.perf_counter()
+        new = indicators.add_fgi_columns(data.copy(), interest_rate, gdp, inflation)
+        new_seconds = time.perf_counter() - start
+
+        if rows <= args.legacy_max_rows:
+            start = time.perf_counter()
+            old = legacy_fgi(data.copy())
+            old_seconds = time.perf_counter() - start
+            pd.testing.assert_frame_equal(new, old[new.columns], check_exact=True, check_dtype=False)
+            legacy = f"legacy {old_seconds * 1000:10.1f} ms  ({old_seconds / new_seconds:7.0f}x, identical)"
+        else:
+            legacy = "legacy skipped"
+        print(f"{rows:>7} rows: vectorized {new_seconds * 1000:8.1f} ms   {legacy}")
+
+
+if __name__ == "__main__":
+    main()
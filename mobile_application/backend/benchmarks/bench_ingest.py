@@ -0,0 +1,151 @@
+"""Full data refresh: today's serial fetches vs the concurrent ingestion orchestrator.
+
+Run from the backend folder:  python benchmarks/bench_ingest.py [--latency-ms 300] [--yfinance-ms 1500]
+
+World Bank and NewsAPI are replaced by a local HTTP server that answers after --latency-ms;
+the yfinance download is replaced by a fixture that sleeps for --yfinance-ms and returns
+data/fgi_data.csv. Every file is written to a scratch folder.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import requests
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import storage
+import ingest
+import gdp
+import inflation_rate
+import interest_rate
+import news_data
+
+
+def world_bank_payload(first_year=1990, last_year=2024):
+    records = [{"date": str(year), "value": 3.0 + (year % 7) * 0.5} for year in range(last_year, first_year - 1, -1)]
+    return [{"page": 1, "pages": 1, "total": len(records)}, records]
+
+
+def news_page(page, per_page=100, pages=5):
+    if page > pages:
+        return {"status": "ok", "articles": []}
+    return {"status": "ok", "articles": [{
+        "title": f"Nifty50 update {page}-{index}", "source": {"name": "Stub Times"},
+        "publishedAt": f"2025-04-{1 + (page * per_page + index) % 28:02d}T05:{index % 60:02d}:00Z",
+        "description": "Markets moved.", "url": f"https://example.com/{page}/{index}",
+    } for index in range(per_page)]}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """World Bank and NewsAPI stand-in; /fail/<n>/... fails the first n hits, /slow/... never answers in time."""
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real APIs
+    latency = 0.3
+    hits = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        parts = parsed.path.strip("/").split("/")
+        with self.lock:
+            self.hits[parsed.path] = self.hits.get(parsed.path, 0) + 1
+            hit = self.hits[parsed.path]
+        if parts[0] == "slow":
+            time.sleep(self.latency * 10)
+        time.sleep(self.latency)
+        if parts[0] == "fail" and hit <= int(parts[1]):
+            return self._send(503, {"message": "Service Unavailable"})
+        if parts[-1] == "news":
+            return self._send(200, news_page(int(parse_qs(parsed.query).get("page", ["1"])[0])))
+        return self._send(200, world_bank_payload())
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def yfinance_fixture(seconds):
+    """Stands in for a yf.download call: waits, then returns the bundled OHLCV window."""
+    def fetch(session=None, timeout=None):
+        time.sleep(seconds)
+        return pd.read_csv(os.path.join(backend_dir, "data", "fgi_data.csv"))
+    return fetch
+
+
+def serial_refresh(sources):
+    """Today's path: one source after another, a new connection per request, no timeouts or retries."""
+    for source in sources.values():
+        source["save"](source["fetch"](session=requests, timeout=None))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency-ms", type=float, default=300, help="Stub API response time")
+    parser.add_argument("--yfinance-ms", type=float, default=1500, help="Simulated yf.download time")
+    args = parser.parse_args()
+
+    StubHandler.latency = args.latency_ms / 1e3
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    scratch = tempfile.mkdtemp(prefix="ingest_")
+    storage.store_dir = os.path.join(scratch, "store")  # Keep the real store untouched
+    news_data.filename = os.path.join(scratch, "news_data.csv")
+    for module, name in [(interest_rate, "interest"), (gdp, "gdp"), (inflation_rate, "inflation")]:
+        module.url = f"{base_url}/{name}"
+        module.csv_file_path = os.path.join(scratch, f"{name}.csv")
+    news_data.url = f"{base_url}/news"
+
+    sources = {name: dict(source) for name, source in ingest.SOURCES.items()}
+    sources["market data"]["fetch"] = yfinance_fixture(args.yfinance_ms / 1e3)
+
+    start = time.perf_counter()
+    serial_refresh(sources)
+    serial_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = ingest.ingest(sources)
+    concurrent_seconds = time.perf_counter() - start
+    assert all(entry["ok"] for entry in report.values()), report
+    assert len(pd.read_csv(news_data.filename)) == 500
+    assert not [name for name in os.listdir(scratch) if name.endswith(".tmp")]
+
+    # ✅ Retries with backoff recover from transient 503s; timeouts bound a hung source
+    ingest.backoff_seconds = 0.05
+    gdp.url = f"{base_url}/fail/2/gdp"
+    inflation_rate.url = f"{base_url}/slow/inflation"
+    checks = {name: sources[name] for name in ["GDP", "inflation rate"]}
+    checks["inflation rate"] = dict(checks["inflation rate"], timeout=StubHandler.latency * 3, retries=1)
+    start = time.perf_counter()
+    check_report = ingest.ingest(checks)
+    assert check_report["GDP"]["ok"] and check_report["GDP"]["attempts"] == 3
+    assert not check_report["inflation rate"]["ok"] and "Timeout" in check_report["inflation rate"]["error"]
+    print(f"\nretry/timeout checks ok in {time.perf_counter() - start:.2f}s "
+          f"(GDP after 2 x 503, hung source given up after 2 timeouts)")
+
+    print(f"\nfull refresh ({len(sources)} sources, {args.latency_ms:.0f} ms API latency, "
+          f"{args.yfinance_ms:.0f} ms yfinance):")
+    print(f"  serial     : {serial_seconds:6.2f} s")
+    print(f"  concurrent : {concurrent_seconds:6.2f} s  ({serial_seconds / concurrent_seconds:.1f}x)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
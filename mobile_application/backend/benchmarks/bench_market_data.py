@@ -0,0 +1,109 @@
+"""Daily OHLCV refresh: two overlapping lookback downloads vs one incremental shared store.
+
+Run from the backend folder:  python benchmarks/bench_market_data.py [--days 20] [--latency-ms 400] [--ms-per-bar 2]
+
+Yahoo Finance is replaced by a fixture serving data/Nifty50_Train_max.csv, re-dated to end on the
+simulated day, that costs --latency-ms per request plus --ms-per-bar per bar returned. The old
+path downloads 100 bars (stocks) and 261 bars (FGI) every day; the new one backfills once and then
+only asks for bars from the last stored date onwards.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+repo_dir = os.path.dirname(os.path.dirname(backend_dir))
+sys.path.insert(0, backend_dir)
+
+import storage
+import market_data
+
+
+class RemoteBars:
+    """Serves [start, end) from a fixed history and records what each call cost."""
+
+    def __init__(self, history, latency, seconds_per_bar):
+        self.history = history
+        self.latency = latency
+        self.seconds_per_bar = seconds_per_bar
+        self.requests = self.bars = 0
+        self.seconds = 0.0
+
+    def download(self, start_date, end_date, timeout=10):
+        dates = pd.to_datetime(self.history['Date'])
+        bars = self.history[(dates >= start_date) & (dates < end_date)].reset_index(drop=True)
+        self.requests += 1
+        self.bars += len(bars)
+        self.seconds += self.latency + len(bars) * self.seconds_per_bar  # Simulated, not slept
+        return bars
+
+    def lookback(self, today, trading_days):
+        """The old path: the last trading_days bars up to today (start found with the NSE calendar)."""
+        dates = pd.to_datetime(self.history['Date'])
+        start_date = dates[dates <= today].iloc[-trading_days]
+        return self.download(start_date, today + pd.Timedelta(days=1))
+
+
+def synthetic_history(end_date):
+    base = pd.read_csv(os.path.join(repo_dir, "data", "Nifty50_Train_max.csv")).dropna(subset=["Close"])
+    base = base.tail(2000).reset_index(drop=True)
+    dates = pd.bdate_range(end=end_date, periods=len(base))
+    return pd.DataFrame({"Date": dates.strftime('%Y-%m-%d'), "Close": base["Close"], "High": base["High"],
+                         "Low": base["Low"], "Open": base["Open"], "Volume": base["Volume"].fillna(0).astype(np.int64)})
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=20, help="Consecutive trading days to refresh")
+    parser.add_argument("--latency-ms", type=float, default=400)
+    parser.add_argument("--ms-per-bar", type=float, default=2)
+    args = parser.parse_args()
+
+    storage.store_dir = os.path.join(tempfile.mkdtemp(prefix="market_data_"), "store")  # Empty scratch store
+    storage.data_dir = os.path.dirname(storage.store_dir)  # No legacy CSVs to migrate or seed from
+    days = pd.bdate_range(end="2025-04-24", periods=args.days)
+    history = synthetic_history(days[-1])
+
+    old_csv = os.path.join(tempfile.mkdtemp(prefix="market_data_old_"), "fgi_data.csv")
+    old = RemoteBars(history, args.latency_ms / 1e3, args.ms_per_bar / 1e3)
+    new = RemoteBars(history, args.latency_ms / 1e3, args.ms_per_bar / 1e3)
+    market_data.download_bars = new.download
+
+    old_store_seconds = new_store_seconds = 0.0
+    for index, day in enumerate(days):
+        # Old: two lookback downloads, the LSTM window upserted, the FGI window rewritten as a CSV
+        start = time.perf_counter()
+        stocks, fgi = old.lookback(day, 100), old.lookback(day, market_data.fgi_window)
+        stocks.tail(market_data.lstm_window), fgi.to_csv(old_csv, index=False)
+        old_store_seconds += time.perf_counter() - start
+
+        # New: one incremental download into the shared store, both windows read from it
+        start = time.perf_counter()
+        market_data.save_bars(market_data.download_new_bars(today=day))
+        lstm_bars = market_data.window(market_data.lstm_window)
+        fgi_bars = market_data.window(market_data.fgi_window)
+        new_store_seconds += time.perf_counter() - start
+        if index == 0:
+            backfill = new.bars
+
+        expected = history[pd.to_datetime(history['Date']) <= day].tail(market_data.fgi_window)
+        np.testing.assert_allclose(fgi_bars['Close'], expected['Close'])
+        np.testing.assert_allclose(lstm_bars['Close'], expected['Close'].tail(market_data.lstm_window))
+
+    print(f"\n{args.days} daily refreshes ({args.latency_ms:.0f} ms per request, {args.ms_per_bar:g} ms per bar):")
+    for name, remote, local in [("two lookbacks", old, old_store_seconds), ("shared store", new, new_store_seconds)]:
+        print(f"  {name:<14}: {remote.requests:4d} requests {remote.bars:7d} bars  "
+              f"network ~{remote.seconds:6.2f} s  local {local:5.2f} s")
+    steady = (new.bars - backfill) / max(args.days - 1, 1)
+    print(f"  backfill    : {backfill} bars on the first day (empty store)")
+    print(f"  steady state: {steady:.1f} bars/day vs {100 + market_data.fgi_window} "
+          f"(windows match a fresh lookback on every day)")
+
+
+if __name__ == "__main__":
+    main()
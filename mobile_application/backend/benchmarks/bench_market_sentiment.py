@@ -0,0 +1,134 @@
+"""Per-request /predict latency with the old FinBERT call vs the precomputed market sentiment record.
+
+Run from the backend folder:  python benchmarks/bench_market_sentiment.py [--requests 200] [--size base]
+
+/predict now serves the daily forecast snapshot (see bench_forecast_snapshot.py), so this measures
+the per-request route it replaced, registered as /predict_uncached: load the latest rows, run the
+LSTM, regenerate and save the recommendation. "Before" adds the old FinBERT pass on "Market analysis
+today" (with the sentiment cache off, and on, as shipped) and a Parquet read of the market_sentiment
+table in load_latest_data. Requests go through Flask's test client over a scratch store migrated
+from the bundled CSVs. FinBERT is the offline stand-in from standin_models (--size base has
+FinBERT's dimensions). Also checks that the recommendation follows a new sentiment record.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import storage
+import market_sentiment
+import sentiment_analysis
+from flask import jsonify
+from sentiment_cache import SentimentCache
+from standin_models import build_standin_finbert, load_news_texts
+import app as app_module
+from model import predict_next_closing_price
+from stock_recommendations import load_latest_data, generate_recommendation, save_recommendation
+
+scratch_dir = tempfile.mkdtemp(prefix="market_sentiment_")
+storage.store_dir = os.path.join(scratch_dir, "store")  # Keep the real store untouched
+old_path = {"enabled": False}
+new_latest = market_sentiment.latest
+
+
+def old_latest():
+    """The old load_latest_data read: the newest market_sentiment row from Parquet."""
+    return storage.tail("market_sentiment", 1).iloc[-1]
+
+
+@app_module.app.route('/predict_uncached', methods=['GET'])
+def uncached_prediction():
+    """The per-request /predict body, with the old FinBERT call when old_path is enabled."""
+    latest_data = load_latest_data()
+    if old_path["enabled"]:
+        overall_sentiment, _ = sentiment_analysis.analyze_sentiment("Market analysis today")
+    else:
+        overall_sentiment = latest_data["market_sentiment"]
+    predicted_date, predicted_price, prediction_range = predict_next_closing_price()
+    recommendation_result = generate_recommendation()
+    save_recommendation(recommendation_result)
+    return jsonify({"Date": predicted_date, "Predicted_Price": predicted_price,
+                    "Overall_Market_Sentiment": overall_sentiment,
+                    "Recommendation": recommendation_result["Recommendation"]})
+
+
+def latencies(client, count):
+    client.get("/predict_uncached")  # Warm-up (model load, first FinBERT pass)
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = client.get("/predict_uncached")
+        timings.append(time.perf_counter() - start)
+        assert "error" not in response.get_json(), response.get_json()
+    return np.array(timings) * 1e3
+
+
+def stored_date_plus(days):
+    return storage.tail("market_sentiment", 1).iloc[-1]["Date"] + np.timedelta64(days, "D")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--size", choices=["small", "base"], default="base")
+    args = parser.parse_args()
+
+    sentiment_analysis.tokenizer, sentiment_analysis.model = build_standin_finbert(load_news_texts(), size=args.size)
+    client = app_module.app.test_client()
+
+    phases = {}
+    # ⏱️ Before: FinBERT on every request, sentiment cache off
+    old_path["enabled"], market_sentiment.latest = True, old_latest
+    sentiment_analysis.USE_CACHE, sentiment_analysis.cache = False, None
+    phases["before (FinBERT, no cache)"] = latencies(client, args.requests)
+
+    # ⏱️ Before: as shipped, the constant text hits the SQLite sentiment cache after the first request
+    sentiment_analysis.USE_CACHE = True
+    sentiment_analysis.cache = SentimentCache(os.path.join(scratch_dir, "sentiment_cache.sqlite"))
+    phases["before (FinBERT, cached)"] = latencies(client, args.requests)
+
+    # ⏱️ After: the materialized record
+    old_path["enabled"], market_sentiment.latest = False, new_latest
+    phases["after (precomputed record)"] = latencies(client, args.requests)
+
+    print(f"/predict_uncached over {args.requests} requests (stand-in FinBERT size={args.size})")
+    for name, timings in phases.items():
+        print(f"{name:<28} p50 {np.percentile(timings, 50):8.2f} ms   p99 {np.percentile(timings, 99):8.2f} ms")
+
+    # ✅ The route reports the stored sentiment and follows a new refresh
+    stored = storage.tail("market_sentiment", 1).iloc[-1]["Overall_Sentiment"]
+    assert client.get("/predict_uncached").get_json()["Overall_Market_Sentiment"] == stored
+    flipped = "positive" if stored != "positive" else "negative"
+    labels = [flipped] * 3 + ["neutral"]
+    record = market_sentiment.summarize(labels, [0.9, 0.8, 0.7, 0.6], stored_date_plus(1))
+    market_sentiment.save(record)
+    assert client.get("/predict_uncached").get_json()["Overall_Market_Sentiment"] == flipped
+    assert generate_recommendation()["Market_Sentiment"] == flipped
+    assert client.get("/market_sentiment").get_json() == record
+    print(f"record check: served '{stored}', then '{record['Overall_Sentiment']}' after a refresh "
+          f"(weighted score {record['Weighted_Score']:+.4f})")
+
+    # ⚡ The sentiment step alone: old (cached FinBERT call + Parquet read) vs the record read
+    calls = 200
+    start = time.perf_counter()
+    for _ in range(calls):
+        sentiment_analysis.analyze_sentiment("Market analysis today")
+        old_latest()
+    old_seconds = (time.perf_counter() - start) / calls
+    calls = 100000
+    start = time.perf_counter()
+    for _ in range(calls):
+        market_sentiment.latest()
+    new_seconds = (time.perf_counter() - start) / calls
+    print(f"sentiment step: old (cached) {old_seconds * 1e6:9.1f} µs   market_sentiment.latest() {new_seconds * 1e6:6.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
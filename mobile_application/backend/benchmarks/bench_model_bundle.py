@@ -0,0 +1,108 @@
+"""Model bundle preprocessing: the bundle's fitted scaler vs refitting a MinMaxScaler on every window.
+
+Run from the backend folder:  python benchmarks/bench_model_bundle.py [--repeats 2000]
+
+Speed: one request's scaling (what model.py did per call vs Preprocessor.transform/inverse_transform)
+and every window of data/Nifty50_Train_max.csv at once (a sklearn loop, the per-window NumPy scaling
+batch_predict used, and the bundle's single op). Accuracy: walk-forward one-day forecasts of the
+LSTM scaled per window vs with the scaler it was trained with, on the notebook's test split (last
+20% of data/Nifty50_Train.csv) and on data/stocks_data.csv, which starts after the training data.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from backtest import load_history, walk_forward_predictions
+from model import load_trained_model, load_preprocessor, sequence_length
+from model_bundle import Preprocessor, data_path
+from sequences import make_sequences
+
+
+def timed(function, repeats=1):
+    """Mean seconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+def sklearn_request(window, predicted_scaled):
+    """model.py before bundles: fit a MinMaxScaler on the window, scale it, invert the prediction."""
+    from sklearn.preprocessing import MinMaxScaler
+
+    scaler = MinMaxScaler(feature_range=(0, 1))
+    scaled = scaler.fit_transform(window.reshape(-1, 1)).reshape(1, sequence_length, 1)
+    return scaled, scaler.inverse_transform([[predicted_scaled]])[0, 0]
+
+
+def per_window_numpy(windows):
+    """batch_predict.forecast_windows' scaling before bundles: min/max of each window, vectorized."""
+    low = windows.min(axis=1, keepdims=True)
+    data_range = windows.max(axis=1, keepdims=True) - low
+    data_range[data_range == 0] = 1.0
+    return ((windows - low) / data_range).astype(np.float32)[..., np.newaxis]
+
+
+def accuracy(name, closes, model, preprocessors):
+    """MAE and directional accuracy of one-day forecasts over closes[60:] for each preprocessor."""
+    actual = closes[sequence_length:]
+    today = closes[sequence_length - 1:-1]
+    for label, preprocessor in preprocessors.items():
+        predicted = walk_forward_predictions(closes, model, preprocessor=preprocessor)
+        moved = actual != today
+        direction = np.mean(np.sign(predicted - today)[moved] == np.sign(actual - today)[moved])
+        print(f"{name:<34} {label:<16} {len(actual):>5} days  MAE {np.mean(np.abs(predicted - actual)):8.2f}  "
+              f"direction {direction:.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=2000)
+    args = parser.parse_args()
+
+    bundle = load_preprocessor()
+    if not bundle.fitted:
+        sys.exit("models/LSTM_model_best.bundle.json is missing; run python model_bundle.py models/LSTM_model_best.h5")
+    per_window = Preprocessor(["Close"], sequence_length)
+
+    # ⏱️ One request
+    closes = load_history()["Close"].to_numpy(dtype=np.float64)
+    window = closes[np.newaxis, -sequence_length:]
+    sklearn_request(window[0], 0.5)  # Import sklearn outside the timing
+    sklearn_seconds = timed(lambda: sklearn_request(window[0], 0.5), args.repeats)
+    bundle_seconds = timed(lambda: (bundle.transform(window), bundle.inverse_transform([[0.5]], window)), args.repeats)
+    print(f"one request:  sklearn refit {sklearn_seconds * 1e6:8.1f} us   bundle {bundle_seconds * 1e6:8.1f} us   "
+          f"({sklearn_seconds / bundle_seconds:.0f}x)")
+
+    # ⏱️ Every window of the history at once
+    windows = make_sequences(closes, sequence_length)[0][:, :, 0]
+    loop_seconds = timed(lambda: [sklearn_request(row, 0.5) for row in windows])
+    numpy_seconds = timed(lambda: per_window_numpy(windows), 20)
+    bundle_seconds = timed(lambda: bundle.transform(windows), 20)
+    print(f"{len(windows)} windows: sklearn loop {loop_seconds * 1e3:8.1f} ms   per-window NumPy "
+          f"{numpy_seconds * 1e3:6.2f} ms   bundle {bundle_seconds * 1e3:6.2f} ms")
+    np.testing.assert_allclose(per_window.transform(windows), per_window_numpy(windows), rtol=1e-6)
+
+    # 🎯 Forecast accuracy with each scaling
+    model = load_trained_model()
+    preprocessors = {"per window": per_window, "bundle scaler": bundle}
+    train = pd.read_csv(data_path, usecols=["Close"]).ffill()["Close"].to_numpy(dtype=np.float64)
+    accuracy("Nifty50_Train.csv, last 20%", train[int(len(train) * 0.8) - sequence_length:], model, preprocessors)
+    stocks_path = os.path.join(backend_dir, "data", "stocks_data.csv")
+    if os.path.exists(stocks_path):
+        stocks = pd.read_csv(stocks_path, usecols=["Date", "Close"])
+        stocks["Close"] = pd.to_numeric(stocks["Close"], errors="coerce")
+        stocks["Date"] = pd.to_datetime(stocks["Date"], errors="coerce")
+        stocks = stocks.dropna().sort_values("Date")
+        accuracy("stocks_data.csv (after training)", stocks["Close"].to_numpy(dtype=np.float64), model, preprocessors)
+
+
+if __name__ == "__main__":
+    main()
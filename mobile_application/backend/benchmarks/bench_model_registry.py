@@ -0,0 +1,63 @@
+"""Cold vs warm model loading: startup time and per-request prediction latency.
+
+Run from the backend folder:  python benchmarks/bench_model_registry.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import model_registry
+
+model_path = model_registry.default_model_path
+requests_per_path = 20
+
+
+def timed(fn, repeat):
+    """Runs fn repeat times and returns the list of latencies in milliseconds."""
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label, latencies):
+    print(f"{label:<32} p50={np.percentile(latencies, 50):9.2f} ms  "
+          f"p99={np.percentile(latencies, 99):9.2f} ms  n={len(latencies)}")
+
+
+def main():
+    # Representative scaled input: the last 60 closes of the LSTM window
+    input_sequence = np.random.rand(1, 60, 1).astype("float32")
+
+    # ⏱️ Startup: first load (includes TensorFlow import) vs a registry hit
+    start = time.perf_counter()
+    model_registry.preload(model_path)
+    print(f"Startup (import TF + first load):  {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+    start = time.perf_counter()
+    model_registry.get_model(model_path)
+    print(f"Registry hit (already resident):   {(time.perf_counter() - start) * 1000:9.3f} ms")
+
+    # 🥶 Cold path: what every /predict request used to do
+    def cold_request():
+        model = model_registry._load_keras_model(model_path)
+        model.predict(input_sequence, verbose=0)
+
+    # 🔥 Warm path: what /predict does now
+    def warm_request():
+        model = model_registry.get_model(model_path)
+        model.predict_on_batch(input_sequence)
+
+    warm_request()  # trace the call once before timing
+    report("cold: load_model + predict", timed(cold_request, requests_per_path))
+    report("warm: registry + predict_on_batch", timed(warm_request, requests_per_path * 10))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Pure-NumPy LSTM vs Keras predict_on_batch: agreement and latency/throughput across batch sizes.
+
+Run from the backend folder:  python export_model.py numpy && python benchmarks/bench_numpy_lstm.py [--repeats 20]
+
+Windows are drawn from export_model.check_windows (scaled history plus random and edge cases).
+Both models are warmed up on each batch size first; the best of --repeats runs is reported.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from export_model import check_windows, tolerance
+from model import model_paths
+from model_registry import loaders
+
+batch_sizes = [1, 8, 64, 512, 4096]
+
+
+def best_seconds(model, windows, repeats):
+    model.predict_on_batch(windows)  # Warm-up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict_on_batch(windows)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    numpy_model = loaders[".npz"](model_paths["numpy"])
+    keras_model = loaders[".h5"](model_paths["keras"])
+
+    # ✅ Agreement with Keras on the export check windows
+    windows = check_windows()
+    error = float(np.abs(numpy_model.predict_on_batch(windows) - keras_model.predict_on_batch(windows)).max())
+    print(f"agreement: max |Δ| {error:.2e} on {len(windows)} windows (tolerance {tolerance:g})")
+    assert error <= tolerance
+
+    # ⚡ Latency and throughput per batch size
+    rng = np.random.default_rng(0)
+    print(f"{'batch':>6}  {'keras':>10}  {'numpy':>10}  {'keras win/s':>12}  {'numpy win/s':>12}  speed-up")
+    for batch_size in batch_sizes:
+        batch = windows[rng.integers(0, len(windows), batch_size)]
+        repeats = max(3, args.repeats * 64 // max(batch_size, 64))
+        keras_seconds = best_seconds(keras_model, batch, repeats)
+        numpy_seconds = best_seconds(numpy_model, batch, repeats)
+        print(f"{batch_size:>6}  {keras_seconds * 1e3:>7.3f} ms  {numpy_seconds * 1e3:>7.3f} ms  "
+              f"{batch_size / keras_seconds:>12.0f}  {batch_size / numpy_seconds:>12.0f}  "
+              f"{keras_seconds / numpy_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
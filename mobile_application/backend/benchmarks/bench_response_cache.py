@@ -0,0 +1,77 @@
+"""Read-only endpoints: requests/sec with and without the response cache, plus 304 revalidation.
+
+Run from the backend folder:  python benchmarks/bench_response_cache.py [--requests 300]
+
+Serves the bundled CSVs (migrated into a scratch store) through Flask's test client, so the
+numbers are per-request server cost without network overhead. Also checks that cached bodies
+match freshly built ones and that an upsert invalidates the cached response.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import storage
+import response_cache
+from app import app
+
+endpoints = {
+    "/latest_news": ["news_sentiment"],
+    "/past_predictions": ["stocks", "predictions"],
+    "/fgi_data": ["fgi"],
+    "/fgi_tomorrow": ["fgi"],
+    "/past_recommendations": ["recommendations"],
+}
+
+
+def requests_per_second(client, path, count, headers=None, status=200):
+    start = time.perf_counter()
+    for _ in range(count):
+        response = client.get(path, headers=headers)
+        assert response.status_code == status, (path, response.status_code)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300, help="Requests per endpoint and mode")
+    args = parser.parse_args()
+
+    storage.store_dir = os.path.join(tempfile.mkdtemp(prefix="response_cache_"), "store")  # Keep the real store untouched
+    storage.migrate()
+    client = app.test_client()
+
+    print(f"{'endpoint':<22} {'uncached':>10} {'cached':>10} {'304':>10}   (requests/sec)")
+    for path in endpoints:
+        response_cache.ENABLED = False
+        uncached_body = client.get(path).data
+        uncached = requests_per_second(client, path, args.requests)
+
+        response_cache.ENABLED = True
+        response = client.get(path)
+        assert response.data == uncached_body, f"{path}: cached body differs"
+        cached = requests_per_second(client, path, args.requests)
+        not_modified = requests_per_second(client, path, args.requests,
+                                           headers={"If-None-Match": response.headers["ETag"]}, status=304)
+        print(f"{path:<22} {uncached:>10.0f} {cached:>10.0f} {not_modified:>10.0f}   "
+              f"({cached / uncached:.0f}x cached)")
+
+    # ✅ Invalidation: a refresh writing tomorrow's FGI changes the next response
+    before = client.get("/fgi_tomorrow")
+    latest = storage.tail("fgi", 1)
+    latest["Date"] = latest["Date"] + pd.Timedelta(days=1)
+    storage.upsert("fgi", latest)
+    after = client.get("/fgi_tomorrow", headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == 200 and after.get_json()["Date"] != before.get_json()["Date"]
+    print(f"invalidation: /fgi_tomorrow {before.get_json()['Date']} → {after.get_json()['Date']} after upsert")
+    print("cache stats:", response_cache.stats()["fgi_tomorrow"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""LSTM serving runtimes: Keras (.h5) vs TFLite (LiteRT) vs ONNX Runtime vs pure NumPy.
+
+Run from the backend folder:  python export_model.py && python benchmarks/bench_runtimes.py [--calls 500]
+
+Each runtime is measured in a fresh worker process: time to import the runtime and load the
+model, resident memory afterwards, whether TensorFlow got imported, single-window latency (what
+/predict does) and throughput on a 1024-window batch (what batch_predict/backtest do).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+runtimes = ["keras", "tflite", "onnx", "numpy"]
+
+
+def rss_mb():
+    with open("/proc/self/status") as status:
+        fields = dict(line.split(":", 1) for line in status)
+    return int(fields["VmRSS"].split()[0]) / 1024
+
+
+def worker(runtime, calls):
+    """Runs inside the child process; prints one JSON line."""
+    import numpy as np
+
+    baseline_rss = rss_mb()
+    start = time.perf_counter()
+    import model_registry
+    from model import model_paths
+    model = model_registry.get_model(model_paths[runtime])
+    load_seconds = time.perf_counter() - start
+    loaded_rss = rss_mb()
+
+    rng = np.random.default_rng(0)
+    window = rng.random((1, 60, 1)).astype(np.float32)
+    model.predict_on_batch(window)  # Warm-up
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        model.predict_on_batch(window)
+        latencies.append(time.perf_counter() - start)
+
+    batch = rng.random((1024, 60, 1)).astype(np.float32)
+    model.predict_on_batch(batch)
+    start = time.perf_counter()
+    model.predict_on_batch(batch)
+    batch_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "load_seconds": load_seconds,
+        "loaded_rss_mb": loaded_rss,
+        "loaded_added_mb": loaded_rss - baseline_rss,
+        "peak_rss_mb": rss_mb(),
+        "tensorflow_imported": "tensorflow" in sys.modules,
+        "p50_ms": float(np.percentile(latencies, 50) * 1e3),
+        "p99_ms": float(np.percentile(latencies, 99) * 1e3),
+        "batch_windows_per_s": 1024 / batch_seconds,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--worker", choices=runtimes, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        return worker(args.worker, args.calls)
+
+    from model import model_paths
+    print(f"{'runtime':<8} {'import+load':>12} {'RSS':>9} {'+model':>9} {'after batch':>12} {'TF':>4} "
+          f"{'p50 (1 window)':>15} {'p99':>9} {'batch 1024':>14}")
+    for runtime in runtimes:
+        if not os.path.exists(model_paths[runtime]):
+            print(f"{runtime:<8} missing {os.path.basename(model_paths[runtime])} (run export_model.py)")
+            continue
+        env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL="3")
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", runtime,
+                                 "--calls", str(args.calls)], cwd=backend_dir, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{runtime:<8} {result['load_seconds']:>10.2f} s {result['loaded_rss_mb']:>6.0f} MB "
+              f"{result['loaded_added_mb']:>6.0f} MB {result['peak_rss_mb']:>9.0f} MB "
+              f"{'yes' if result['tensorflow_imported'] else 'no':>4} {result['p50_ms']:>12.3f} ms {result['p99_ms']:>6.3f} ms "
+              f"{result['batch_windows_per_s']:>8.0f} win/s")
+
+
+if __name__ == "__main__":
+    main()
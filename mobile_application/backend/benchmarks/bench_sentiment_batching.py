@@ -0,0 +1,61 @@
+"""FinBERT scoring throughput (articles/sec) per batch size, on an offline stand-in model.
+
+Run from the backend folder:  python benchmarks/bench_sentiment_batching.py [--size base] [--threads N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import sentiment_analysis
+from standin_models import build_standin_finbert, load_news_texts
+
+
+def per_article_baseline(texts):
+    """The old path: one tokenizer call and one forward pass per article."""
+    import torch
+    import torch.nn.functional as F
+
+    tokenizer, model = sentiment_analysis.load_finbert()
+    labels = []
+    for text in texts:
+        inputs = tokenizer(text, return_tensors="pt", truncation=True, padding=True, max_length=512)
+        with torch.no_grad():
+            probs = F.softmax(model(**inputs).logits, dim=-1)
+        labels.append(sentiment_analysis.sentiment_labels[torch.argmax(probs)])
+    return np.array(labels, dtype=object)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", choices=["small", "base"], default="small")
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="Repeat news_data.csv to get more articles")
+    args = parser.parse_args()
+
+    texts = load_news_texts(repeat=args.repeat)
+    sentiment_analysis.tokenizer, sentiment_analysis.model = build_standin_finbert(texts, size=args.size)
+    print(f"{len(texts)} articles, stand-in size={args.size}, threads={args.threads or 'default'}")
+
+    start = time.perf_counter()
+    baseline_labels = per_article_baseline(texts)
+    baseline = time.perf_counter() - start
+    print(f"{'per-article loop':<18} {len(texts) / baseline:9.1f} articles/sec")
+
+    for batch_size in (1, 8, 16, 32, 64, 128):
+        start = time.perf_counter()
+        labels, _ = sentiment_analysis.predict_sentiments(texts, batch_size=batch_size,
+                                                         num_threads=args.threads, use_cache=False)
+        elapsed = time.perf_counter() - start
+        agreement = (labels == baseline_labels).mean() * 100
+        print(f"batch_size={batch_size:<7} {len(texts) / elapsed:9.1f} articles/sec  "
+              f"({baseline / elapsed:4.1f}x, {agreement:.1f}% label agreement)")
+
+
+if __name__ == "__main__":
+    main()
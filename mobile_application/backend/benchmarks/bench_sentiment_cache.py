@@ -0,0 +1,57 @@
+"""Sentiment cache hit rate and time saved across consecutive news refreshes (offline stand-in model).
+
+Each simulated refresh keeps most of the previous articles and adds a few new ones,
+like news_data.py does when it re-fetches the latest 500 articles.
+
+Run from the backend folder:  python benchmarks/bench_sentiment_cache.py [--runs 5] [--new-per-run 20]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import sentiment_analysis
+from sentiment_cache import SentimentCache
+from standin_models import build_standin_finbert, load_news_texts
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--new-per-run", type=int, default=20)
+    parser.add_argument("--size", choices=["small", "base"], default="small")
+    args = parser.parse_args()
+
+    texts = load_news_texts()
+    sentiment_analysis.tokenizer, sentiment_analysis.model = build_standin_finbert(texts, size=args.size)
+    cache_dir = tempfile.mkdtemp(prefix="sentiment_cache_")
+    sentiment_analysis.cache = SentimentCache(os.path.join(cache_dir, "cache.sqlite"))
+
+    window = texts
+    for run in range(1, args.runs + 1):
+        if run > 1:
+            # Drop the oldest articles and prepend fresh ones
+            fresh = [f"Update {run}.{i}: {text}" for i, text in enumerate(texts[:args.new_per_run])]
+            window = fresh + window[:-args.new_per_run]
+
+        uncached_start = time.perf_counter()
+        sentiment_analysis.predict_probabilities(window, use_cache=False)
+        uncached = time.perf_counter() - uncached_start
+
+        sentiment_analysis.cache.reset_stats()
+        cached_start = time.perf_counter()
+        sentiment_analysis.predict_probabilities(window)
+        cached = time.perf_counter() - cached_start
+
+        stats = sentiment_analysis.cache.stats()
+        print(f"run {run}: {len(window)} articles  hit rate {stats['hit_rate']:6.1%}  "
+              f"uncached {uncached * 1000:8.1f} ms  cached {cached * 1000:8.1f} ms  "
+              f"saved {(uncached - cached) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Sliding-window sequence building: notebook loop vs zero-copy views (time and memory).
+
+Run from the backend folder:  python benchmarks/bench_sequences.py [--rows 4237 100000 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sequences import make_sequences, WindowDataset
+
+seq_length = 60
+
+
+def loop_sequences(values, seq_length):
+    """The notebooks' approach: append a slice per step, then copy everything into one array."""
+    X, y = [], []
+    for i in range(seq_length, len(values)):
+        X.append(values[i - seq_length:i])
+        y.append(values[i, 0])
+    return np.array(X), np.array(y)
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="*", default=[4237, 100000, 1000000])
+    parser.add_argument("--features", type=int, nargs="*", default=[1, 4])
+    parser.add_argument("--loop-max-bytes", type=float, default=1.5e9,
+                        help="Skip the copying loop when its output would exceed this size")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for rows in args.rows:
+        for features in args.features:
+            values = rng.random((rows, features))
+            (X, y), view_seconds, view_peak = measure(lambda: make_sequences(values, seq_length))
+            assert np.shares_memory(X, values)
+
+            copied_bytes = (rows - seq_length) * seq_length * features * values.itemsize
+            if copied_bytes <= args.loop_max_bytes:
+                (X_loop, y_loop), loop_seconds, loop_peak = measure(lambda: loop_sequences(values, seq_length))
+                assert np.array_equal(X, X_loop) and np.array_equal(y, y_loop)
+                loop = f"loop {loop_seconds * 1e3:9.1f} ms {loop_peak / 2**20:9.1f} MiB"
+                del X_loop, y_loop
+            else:
+                loop = f"loop skipped (would copy {copied_bytes / 2**20:.0f} MiB)"
+
+            print(f"{rows:>8} rows x {features} features: "
+                  f"view {view_seconds * 1e3:7.3f} ms {view_peak / 2**20:7.3f} MiB | {loop}")
+
+    # Lazy batches through the dataset adapter touch only one batch at a time
+    values = rng.random((100000, 4)).astype(np.float32)
+    dataset = WindowDataset(values, seq_length)
+    start = time.perf_counter()
+    for index in range(0, len(dataset), 97):
+        dataset[index]
+    print(f"WindowDataset: {len(dataset)} windows, random item access "
+          f"{(time.perf_counter() - start) / len(range(0, len(dataset), 97)) * 1e6:.1f} µs/item")
+
+
+if __name__ == "__main__":
+    main()
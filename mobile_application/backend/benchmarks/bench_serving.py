@@ -0,0 +1,176 @@
+"""Model registry and hot-swapped serving: swap latency, memory per resident model, traffic split and shadows.
+
+Run from the backend folder:  python benchmarks/bench_serving.py [--clients 4] [--swaps 6]
+
+A scratch registry gets the served LSTM (as lstm@v1 and lstm@v2) plus untrained RNN, LSTM+Transformer
+hybrid (Keras) and PyTorch Transformer models of notebook size, built in a child process so this
+process starts without TensorFlow or torch. Reported:
+  1. resident memory and deploy() time as models are added (the first Keras and the first torch
+     model also import their framework), then swap time when every model is already resident;
+  2. client threads calling serving.forecast while the primary is swapped back and forth: failed
+     requests (should be 0) and request latency before vs during the swaps;
+  3. a 10% candidate split over 10,000 (symbol, date) keys, the cost of a shadow model on a
+     recorded forecast, and live_error() over 30 recorded days (the untrained models' error is
+     meaningless; the point is that every deployed model gets a comparable number).
+The scratch store (storage.store_dir) keeps data/store/ untouched.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import model_bundle
+import serving
+import storage
+from backtest import load_history
+from batch_predict import forecast_windows
+from model import model_path as default_model_path
+from trading_calendar import next_session
+
+
+def rss_mb():
+    with open("/proc/self/status") as status:
+        fields = dict(line.split(":", 1) for line in status)
+    return int(fields["VmRSS"].split()[0]) / 1024
+
+
+def build_registry(registry):
+    """Runs in the child process: registers every model (untrained ones sized like the notebooks)."""
+    from architectures import artifact_suffix, build_model, families, save_model
+
+    manifest = model_bundle.load_manifest(default_model_path)
+    settings = manifest["preprocessing"]
+    serving.register(default_model_path, "lstm", registry)
+    serving.register(default_model_path, "lstm", registry)
+    scratch = tempfile.mkdtemp(prefix="serving_models_")
+    for architecture in ("rnn", "hybrid", "transformer"):
+        params = {"architecture": architecture, "units": 128, "dropout": 0.1, "learning_rate": 5e-4}
+        model = build_model(params, settings["window"], 1)
+        path = os.path.join(scratch, architecture + artifact_suffix[families[architecture]])
+        save_model(model, architecture, path)
+        model_bundle.write_manifest(path, settings["features"], settings["window"], settings["scaler_min"],
+                                    settings["scaler_max"], manifest["training_data"], architecture,
+                                    families[architecture])
+        serving.register(path, registry=registry)
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def percentiles(latencies):
+    return " ".join(f"p{q} {np.percentile(latencies, q) * 1e3:7.2f} ms" for q in (50, 99)) + \
+        f"  max {max(latencies) * 1e3:7.2f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--swaps", type=int, default=6)
+    parser.add_argument("--build", help=argparse.SUPPRESS)  # Child process: build the registry and exit
+    args = parser.parse_args()
+    if args.build:
+        build_registry(args.build)
+        return
+
+    serving.registry_dir = tempfile.mkdtemp(prefix="serving_registry_")
+    storage.store_dir = os.path.join(tempfile.mkdtemp(prefix="serving_store_"), "store")  # Keep data/store/ untouched
+    subprocess.run([sys.executable, os.path.abspath(__file__), "--build", serving.registry_dir], check=True,
+                   stdout=subprocess.DEVNULL)
+    print(f"registry: {', '.join(serving.list_ids())}")
+
+    history = load_history()
+    window = history["Close"].to_numpy(dtype=np.float64)[np.newaxis, -60:]
+    date = next_session(history["Date"].iloc[-1])
+
+    # 🧠 1. Memory and deploy time per resident model
+    order = ["lstm@v1", "rnn@v1", "hybrid@v1", "transformer@v1", "lstm@v2"]
+    print(f"\n{'resident models':<58} {'deploy':>9} {'RSS':>8} {'added':>8}")
+    previous = baseline = rss_mb()
+    print(f"{'none (numpy, pandas, serving imported)':<58} {'':>9} {baseline:>6.0f}MB")
+    for count in range(1, len(order) + 1):
+        _, seconds = timed(lambda: serving.deploy(order[0], shadows=order[1:count]))
+        print(f"{', '.join(order[:count]):<58} {seconds:>8.2f}s {rss_mb():>6.0f}MB {rss_mb() - previous:>+6.0f}MB")
+        previous = rss_mb()
+    _, seconds = timed(lambda: serving.deploy("rnn@v1", shadows=["lstm@v1", "hybrid@v1", "transformer@v1", "lstm@v2"]))
+    print(f"swap primary lstm@v1 → rnn@v1, all {len(order)} models resident: {seconds * 1e3:.1f} ms "
+          f"({rss_mb() - baseline:.0f} MB over the baseline for {len(order)} models)")
+
+    # 🔀 2. Requests in flight while the primary is swapped (each swap evicts and reloads the other model)
+    serving.deploy("lstm@v1")
+    latencies, failures, served, stop = [], [], {}, threading.Event()
+    lock = threading.Lock()
+
+    def client():
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                _, models = serving.forecast(window, dates=[date])
+            except Exception as e:
+                failures.append(repr(e))
+                continue
+            with lock:
+                latencies.append((start, time.perf_counter() - start))
+                served[models[0]] = served.get(models[0], 0) + 1
+
+    threads = [threading.Thread(target=client) for _ in range(args.clients)]
+    for thread in threads:
+        thread.start()
+    time.sleep(2)
+    swaps_start = time.perf_counter()
+    swap_seconds = []
+    for swap in range(args.swaps):
+        swap_seconds.append(timed(lambda: serving.deploy("rnn@v1" if swap % 2 == 0 else "lstm@v1"))[1])
+        time.sleep(0.5)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    before = [seconds for start, seconds in latencies if start < swaps_start]
+    during = [seconds for start, seconds in latencies if start >= swaps_start]
+    print(f"\n{args.clients} clients, {args.swaps} swaps (each {np.mean(swap_seconds) * 1e3:.0f} ms on average): "
+          f"{len(latencies)} requests, {len(failures)} failed, served by {served}")
+    print(f"  before swaps: {percentiles(before)}")
+    print(f"  during swaps: {percentiles(during)}")
+    if failures:
+        print(f"  first failure: {failures[0]}")
+
+    # 🧪 3. Traffic split, shadow cost and live error
+    deployment = serving.deploy("lstm@v1", {"rnn@v1": 0.1}, ["transformer@v1"])
+    keys = [f"{symbol}:{day:%Y-%m-%d}" for symbol in ("^NSEI", "RELIANCE.NS", "TCS.NS", "INFY.NS")
+            for day in pd.bdate_range("2016-01-01", periods=2500)]
+    share = np.mean(deployment.route(keys) == "rnn@v1")
+    print(f"\ncandidate rnn@v1 at 10%: {share:.1%} of {len(keys)} (symbol, date) keys")
+
+    windows = np.repeat(window, 50, axis=0)
+    symbols = [f"SYN{index:02d}.NS" for index in range(50)]
+    dates = [date] * 50
+    serving.forecast(windows, 1, symbols, dates, record=True)
+    _, unrecorded = timed(lambda: serving.forecast(windows, 1, symbols, dates))
+    _, recorded = timed(lambda: serving.forecast(windows, 1, symbols, dates, record=True))
+    shadow, preprocessor, _ = deployment.models["transformer@v1"]
+    _, shadow_seconds = timed(lambda: forecast_windows(windows, 1, shadow, symbols, preprocessor))
+    print(f"50 symbols: {unrecorded * 1e3:.1f} ms served, {recorded * 1e3:.1f} ms recorded "
+          f"(transformer shadow {shadow_seconds * 1e3:.1f} ms, the rest is 50 per-symbol model_predictions upserts)")
+
+    closes = history["Close"].to_numpy(dtype=np.float64)
+    storage.upsert("stocks", history.tail(31))
+    for end in range(len(closes) - 31, len(closes)):
+        serving.forecast(closes[np.newaxis, end - 60:end], dates=[history["Date"].iloc[end]], record=True)
+    for row in serving.live_error():
+        print(f"  {row['Model']:>16}: {row['Days']:>3} recorded days ({row['Served_Days']} served)  MAE {row['MAE']:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Parquet store vs CSV files: read and append-one-day latency at 10k and 1M rows.
+
+Run from the backend folder:  python benchmarks/bench_storage.py [--rows 10000 1000000]
+
+Uses the news_sentiment schema (many rows per day over ten years). The CSV baseline is
+what the backend used to do on every update: read the whole file, concatenate, rewrite it.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage
+
+table = "news_sentiment"
+
+
+def synthetic_news(rows, days=3650, seed=0, first_id=0):
+    """Articles spread evenly over `days` days, each with a unique URL."""
+    rng = np.random.default_rng(seed)
+    published = pd.Timestamp("2015-01-01") + pd.to_timedelta(np.sort(rng.integers(0, days * 86400, rows)), unit="s")
+    ids = np.arange(first_id, first_id + rows)
+    return pd.DataFrame({
+        "title": [f"Nifty 50 headline {i}" for i in ids],
+        "source": rng.choice(["The Times of India", "Mint", "Business Standard"], rows),
+        "publishedAt": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "description": "Markets moved as investors weighed earnings and global cues.",
+        "url": [f"https://example.com/news/{i}" for i in ids],
+        "text": "Markets moved as investors weighed earnings and global cues.",
+        "Sentiment": rng.choice(["negative", "neutral", "positive"], rows),
+        "Sentiment_Score": rng.random(rows),
+    })
+
+
+def timed(fn, repeat=3):
+    """Best of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="*", default=[10000, 1000000])
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        scratch = tempfile.mkdtemp(prefix="bench_storage_")
+        csv_path = os.path.join(scratch, "news.csv")
+        root = os.path.join(scratch, "store")
+        history = synthetic_news(rows)
+        day = synthetic_news(max(rows // 3650, 1), days=1, seed=1, first_id=rows)
+        day["publishedAt"] = "2024-12-31T09:15:00Z"
+
+        history.to_csv(csv_path, index=False)
+        storage.write(table, history, root)
+        csv_mb = os.path.getsize(csv_path) / 2**20
+        store_mb = sum(os.path.getsize(os.path.join(root, table, name)) for name in os.listdir(os.path.join(root, table))) / 2**20
+
+        def csv_append():
+            pd.concat([pd.read_csv(csv_path), day], ignore_index=True).to_csv(csv_path, index=False)
+
+        results = {
+            "CSV read all": timed(lambda: pd.read_csv(csv_path)),
+            "CSV append day": timed(csv_append, repeat=1),
+            "store read all": timed(lambda: storage.read(table, root=root)),
+            "store read 30 days": timed(lambda: storage.read(table, start="2024-12-01", root=root)),
+            "store tail(5)": timed(lambda: storage.tail(table, 5, root=root)),
+            "store upsert day": timed(lambda: storage.upsert(table, day, root=root)),
+        }
+        assert len(storage.read(table, root=root)) == rows + len(day)
+
+        print(f"\n=== {rows} rows (CSV {csv_mb:.1f} MiB, Parquet {store_mb:.1f} MiB, {len(day)} rows/day) ===")
+        for name, ms in results.items():
+            print(f"  {name:<20} {ms:10.1f} ms")
+        shutil.rmtree(scratch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Refreshing every Nifty 50 constituent vs the single index refresh of today.
+
+Run from the backend folder:  python benchmarks/bench_tickers.py [--symbols 50] [--workers 4]
+
+Works on a scratch store (migrated from the bundled CSVs) with synthetic random-walk OHLCV for each
+constituent, ending on the index's last stored session, so no network is used; downloads are
+skipped (in production they overlap on a thread pool and are bound by Yahoo Finance latency).
+Compares the index snapshot build, a naive loop that refreshes one symbol at a time, and
+tickers.refresh_symbols (one batched model call, then FGI, recommendation and writes in-process,
+on a forced process pool, and wherever tickers.pool_size decides). Also checks that the batched
+predictions match the per-symbol ones and that /predict?symbol= and /recommendations?symbol=
+serve them.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import storage
+import market_data
+import tickers
+import forecast_snapshot
+from model_registry import preload
+from model import model_path
+from trading_calendar import sessions_back, next_sessions
+
+storage.store_dir = os.path.join(tempfile.mkdtemp(prefix="tickers_"), "store")  # Keep the real store untouched
+
+
+def seed_symbols(symbols, bars=300, seed=0):
+    """Stores `bars` sessions of random-walk OHLCV per symbol, ending on the index's last stored session."""
+    last_date = market_data.last_stored_date()
+    dates = next_sessions(sessions_back(last_date, bars), bars)
+    rng = np.random.default_rng(seed)
+    for symbol in symbols:
+        close = rng.uniform(100, 5000) * np.exp(np.cumsum(rng.normal(0, 0.015, bars)))
+        spread = close * rng.uniform(0.002, 0.02, bars)
+        market_data.save_bars(pd.DataFrame({
+            "Date": [date.strftime('%Y-%m-%d') for date in dates], "Close": close,
+            "High": close + spread, "Low": close - spread, "Open": close + rng.normal(0, 0.5, bars) * spread,
+            "Volume": rng.integers(10 ** 5, 10 ** 7, bars),
+        }), ticker=symbol)
+
+
+def clear_outputs(symbols):
+    """Removes every per-symbol prediction/FGI/recommendation so each run starts from the same state."""
+    for symbol in symbols:
+        for name in ("predictions", "fgi", "recommendations"):
+            storage.write(name, [], market_data.symbol_root(symbol))
+
+
+def timed(step):
+    start = time.perf_counter()
+    result = step()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=len(tickers.nifty50_symbols))
+    parser.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 1))
+    args = parser.parse_args()
+    symbols = tickers.nifty50_symbols[:args.symbols]
+
+    preload(model_path)
+    quiet = open(os.devnull, "w")
+    stdout, sys.stdout = sys.stdout, quiet
+    forecast_snapshot.build_snapshot()  # Migrates the CSVs first
+    _, index_seconds = timed(lambda: forecast_snapshot.build_snapshot(force=True))  # Today's refresh: the index alone
+    seed_symbols(symbols)
+    sys.stdout = stdout
+
+    # ⏱️ Naive: the whole pipeline once per symbol (one model call each, no pool)
+    clear_outputs(symbols)
+    sys.stdout = quiet
+    naive, naive_seconds = timed(lambda: [tickers.refresh_symbols([symbol], download=False, pool=False)["results"][0]
+                                          for symbol in symbols])
+    sys.stdout = stdout
+
+    # ⏱️ Batched model call, FGI/recommendation in this process
+    clear_outputs(symbols)
+    batched, batched_seconds = timed(lambda: tickers.refresh_symbols(symbols, download=False, pool=False)["results"])
+
+    # ⏱️ Batched model call plus a forced process pool (spawn start-up included)
+    clear_outputs(symbols)
+    pooled, pooled_seconds = timed(lambda: tickers.refresh_symbols(symbols, download=False, workers=args.workers,
+                                                                   pool=True)["results"])
+
+    # ⏱️ What refresh_symbols picks on its own with up to --workers processes
+    clear_outputs(symbols)
+    report, auto_seconds = timed(lambda: tickers.refresh_symbols(symbols, download=False, workers=args.workers))
+
+    print(f"{'run':<40} {'seconds':>8} {'per symbol':>11}")
+    print(f"{'index snapshot (1 symbol, today)':<40} {index_seconds:>8.2f} {index_seconds * 1e3:>8.1f} ms")
+    for name, seconds in ((f"naive loop ({len(symbols)} symbols)", naive_seconds),
+                          ("batched, 1 process", batched_seconds),
+                          (f"batched, {args.workers} worker processes", pooled_seconds),
+                          (f"batched, auto ({report['workers']} process(es))", auto_seconds)):
+        print(f"{name:<40} {seconds:>8.2f} {seconds / len(symbols) * 1e3:>8.1f} ms")
+
+    # ✅ The batched and pooled runs store the same forecasts as refreshing each symbol alone
+    for single, batch, pool in zip(naive, batched, pooled):
+        assert single["Symbol"] == batch["Symbol"] == pool["Symbol"]
+        assert single["Recommendation"] == batch["Recommendation"] == pool["Recommendation"], single["Symbol"]
+        np.testing.assert_allclose([batch["Predicted_Close"], pool["Predicted_Close"]], single["Predicted_Close"],
+                                   rtol=1e-5)
+        assert batch["FGI_Score"] == pool["FGI_Score"] == single["FGI_Score"]
+    print(f"agreement: {len(symbols)} symbols, batched vs per-symbol predictions, FGI and recommendations match")
+
+    # ✅ Per-symbol endpoints
+    from app import app
+    client = app.test_client()
+    symbol = symbols[-1]
+    forecast = client.get("/predict", query_string={"symbol": symbol}).get_json()
+    assert forecast["Symbol"] == symbol and forecast["Recommendation"] == pooled[-1]["Recommendation"], forecast
+    history = client.get("/recommendations", query_string={"symbol": symbol}).get_json()
+    assert len(history) == 1 and history[0]["Date"] == pooled[-1]["Date"].replace("-", "/"), history
+    assert client.get("/predict", query_string={"symbol": "UNKNOWN.NS"}).status_code == 404
+    assert "Snapshot" in client.get("/predict").get_json()
+    print(f"endpoints: /predict?symbol={symbol} -> {forecast['Predicted_Price']:.2f} {forecast['Recommendation']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Trading-calendar lookups: the old holiday while-loop and per-refresh NSE calendar vs precomputed sessions.
+
+Run from the backend folder:  python benchmarks/bench_trading_calendar.py [--queries 20000]
+
+Also lists the 2025 dates where the old hard-coded holiday set and the NSE calendar disagree.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import trading_calendar
+
+# The set model.py used to hard-code
+legacy_holidays = set(pd.to_datetime([
+    '2025-01-26', '2025-02-26', '2025-03-14', '2025-03-31', '2025-04-06', '2025-04-10',
+    '2025-04-14', '2025-04-18', '2025-05-01', '2025-06-07', '2025-07-06', '2025-08-15',
+    '2025-08-27', '2025-10-02', '2025-10-21', '2025-10-22', '2025-11-05', '2025-12-25',
+]))
+
+
+def legacy_next_trading_day(date):
+    next_date = pd.Timestamp(date) + timedelta(days=1)
+    while next_date.weekday() >= 5 or next_date in legacy_holidays:
+        next_date += timedelta(days=1)
+    return next_date
+
+
+def legacy_schedule(date, horizon):
+    """What batch_predict did for a multi-day horizon: one while-loop step per day."""
+    schedule = []
+    for _ in range(horizon):
+        date = legacy_next_trading_day(date)
+        schedule.append(date)
+    return schedule
+
+
+def per_call_us(function, arguments):
+    start = time.perf_counter()
+    for argument in arguments:
+        function(*argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=20000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    trading_calendar.sessions()
+    load_ms = (time.perf_counter() - start) * 1e3
+    print(f"load {len(trading_calendar.sessions())} persisted sessions: {load_ms:.2f} ms (once per process)")
+
+    try:
+        import pandas_market_calendars as mcal
+        start = time.perf_counter()
+        nse = mcal.get_calendar('NSE')
+        nse.valid_days(start_date=pd.Timestamp.today() - timedelta(days=400), end_date=pd.Timestamp.today())
+        print(f"old per-refresh get_calendar('NSE') + valid_days(400 days): {(time.perf_counter() - start) * 1e3:.2f} ms")
+    except ImportError:
+        print("pandas_market_calendars not installed; skipping the per-refresh calendar build")
+
+    rng = np.random.default_rng(0)
+    dates = [(pd.Timestamp("2025-01-01") + timedelta(days=int(day)),) for day in rng.integers(0, 360, args.queries)]
+    print(f"\nper query ({args.queries} random 2025 dates):")
+    print(f"  old while-loop next_trading_day : {per_call_us(legacy_next_trading_day, dates):7.2f} µs")
+    print(f"  next_session                    : {per_call_us(trading_calendar.next_session, dates):7.2f} µs")
+    print(f"  previous_session                : {per_call_us(trading_calendar.previous_session, dates):7.2f} µs")
+    print(f"  sessions_back(date, 261)        : "
+          f"{per_call_us(trading_calendar.sessions_back, [(date, 261) for (date,) in dates]):7.2f} µs")
+    print(f"  session_count(date - 1y, date)  : "
+          f"{per_call_us(trading_calendar.session_count, [(date - timedelta(days=365), date) for (date,) in dates]):7.2f} µs")
+    print(f"  old loop, 30-day horizon        : "
+          f"{per_call_us(legacy_schedule, [(date, 30) for (date,) in dates]):7.2f} µs")
+    print(f"  next_sessions(date, 30)         : "
+          f"{per_call_us(trading_calendar.next_sessions, [(date, 30) for (date,) in dates]):7.2f} µs")
+
+    # Where the hard-coded 2025 list and the NSE calendar disagree
+    differences = []
+    for date in pd.date_range("2025-01-01", "2025-12-30"):
+        old, new = legacy_next_trading_day(date), trading_calendar.next_session(date)
+        if old != new:
+            differences.append(f"{date:%Y-%m-%d}: {old:%Y-%m-%d} → {new:%Y-%m-%d}")
+    print(f"\nnext trading day differs on {len(differences)} of 364 dates in 2025:")
+    for line in differences:
+        print("  " + line)
+
+
+if __name__ == "__main__":
+    main()
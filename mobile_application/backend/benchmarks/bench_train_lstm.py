@@ -0,0 +1,66 @@
+"""LSTM training speed: LSTM_model.ipynb's configuration vs train_lstm.py's, compared at equal validation loss.
+
+Run from the backend folder:  python benchmarks/bench_train_lstm.py [--epochs 100] [--patience 10]
+
+Every configuration trains the notebook's 256-unit LSTM on data/Nifty50_Train.csv (window 60, last
+20% for validation) with early stopping, as the notebook does. The target is the notebook
+configuration's best validation loss; "to target" is the wall time until a configuration first
+matches it. Epoch time is the median after the first epoch (which includes graph tracing).
+Prepared datasets are cached in a scratch folder so data/training_cache/ is untouched.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+import sweep
+import train_lstm
+
+sweep.cache_dir = tempfile.mkdtemp(prefix="train_lstm_")  # Keep data/training_cache/ untouched
+
+# name: train_lstm.train() arguments
+configs = {
+    "notebook (batch 8, NumPy arrays)": {"batch_size": 8, "pipeline": "numpy", "jit_compile": "auto"},
+    "batch 8, tf.data, 8 steps/call": {"batch_size": 8, "steps_per_execution": 8},
+    "batch 16, linear-scaled lr": {"batch_size": 16, "steps_per_execution": 8},
+    "batch 64, linear-scaled lr": {"batch_size": 64, "steps_per_execution": 8},
+    "batch 64, linear-scaled lr, XLA": {"batch_size": 64, "steps_per_execution": 8, "jit_compile": True},
+    "batch 64, sqrt-scaled lr": {"batch_size": 64, "lr_scaling": "sqrt", "steps_per_execution": 8},
+}
+
+
+def time_to_target(report, target):
+    """Seconds of training until the validation loss first reached target, or None."""
+    reached = np.flatnonzero(np.array(report["val_losses"]) <= target)
+    return float(np.cumsum(report["epoch_seconds"])[reached[0]]) if len(reached) else None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument("--patience", type=int, default=10)
+    args = parser.parse_args()
+
+    reports = {}
+    for name, config in configs.items():
+        print(f"[✔] Training: {name}")
+        reports[name] = train_lstm.train(epochs=args.epochs, patience=args.patience, verbose=False, **config)
+    target = reports["notebook (batch 8, NumPy arrays)"]["best_val_loss"]
+
+    print(f"\ntarget val_loss {target:.6f} (the notebook configuration's best)")
+    print(f"{'configuration':<34} {'lr':>8} {'epoch':>8} {'samples/s':>10} {'epochs':>7} {'total':>8} "
+          f"{'best val_loss':>14} {'to target':>10}")
+    for name, report in reports.items():
+        reached = time_to_target(report, target)
+        print(f"{name:<34} {report['learning_rate']:>8.5f} {report['epoch_time']:>7.2f}s "
+              f"{report['samples_per_sec']:>10.0f} {report['epochs']:>7} {report['seconds']:>7.1f}s "
+              f"{report['best_val_loss']:>14.6f} " + (f"{reached:>9.1f}s" if reached is not None else f"{'—':>10}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""SQLite stand-in for the MySQL users database, so auth benchmarks run without a server."""
+import sqlite3
+import time
+
+users_schema = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT, email TEXT UNIQUE, username TEXT, password TEXT, phone TEXT
+)
+"""
+
+
+class StandinCursor:
+    """pymysql-style cursor: %s placeholders and rows as dictionaries."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def execute(self, sql, args=()):
+        return self.cursor.execute(sql.replace("%s", "?"), args)
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def close(self):
+        self.cursor.close()
+
+
+class StandinConnection:
+    """Wraps sqlite3 with the parts of the pymysql connection API the backend uses."""
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.closed = False
+
+    def cursor(self):
+        return StandinCursor(self.conn.cursor())
+
+    def ping(self, reconnect=False):
+        if self.closed:
+            raise sqlite3.ProgrammingError("Connection closed")
+        self.conn.execute("SELECT 1")
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        self.closed = True
+        self.conn.close()
+
+
+def create_users_db(path, users=1000):
+    """Creates the users table with `users` rows (user{i}@example.com / password{i})."""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(users_schema)
+    conn.executemany(
+        "INSERT OR IGNORE INTO users (name, email, username, password, phone) VALUES (?, ?, ?, ?, ?)",
+        [(f"User {i}", f"user{i}@example.com", f"user{i}", f"password{i}", f"98{i:08d}") for i in range(users)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def standin_connect(path, handshake_ms=0.0):
+    """Returns a connect() function; handshake_ms simulates MySQL's TCP + auth round trips."""
+    def connect():
+        if handshake_ms:
+            time.sleep(handshake_ms / 1e3)
+        return StandinConnection(path)
+    return connect
@@ -0,0 +1,50 @@
+"""Offline stand-ins for FinBERT so sentiment benchmarks run without downloading weights."""
+import os
+import re
+import tempfile
+
+# BERT-base dimensions match ProsusAI/finbert; "small" keeps quick runs quick
+bert_sizes = {
+    "small": {"hidden_size": 256, "num_hidden_layers": 4, "num_attention_heads": 4, "intermediate_size": 1024},
+    "base": {"hidden_size": 768, "num_hidden_layers": 12, "num_attention_heads": 12, "intermediate_size": 3072},
+}
+
+
+def build_vocab(texts, max_words=20000):
+    """Builds a WordPiece vocabulary (special tokens + lowercased words) from the given texts."""
+    words = {}
+    for text in texts:
+        for word in re.findall(r"\w+|[^\w\s]", str(text).lower()):
+            words[word] = words.get(word, 0) + 1
+    most_common = sorted(words, key=words.get, reverse=True)[:max_words]
+    return ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + most_common
+
+
+def build_standin_finbert(texts, size="small", seed=0):
+    """Returns a randomly initialised (tokenizer, model) pair with FinBERT's 3-label head."""
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    vocab = build_vocab(texts)
+    vocab_dir = tempfile.mkdtemp(prefix="standin_finbert_")
+    vocab_file = os.path.join(vocab_dir, "vocab.txt")
+    with open(vocab_file, "w", encoding="utf-8") as file:
+        file.write("\n".join(vocab) + "\n")
+    tokenizer = BertTokenizerFast(vocab_file=vocab_file, do_lower_case=True)
+
+    torch.manual_seed(seed)
+    config = BertConfig(vocab_size=len(vocab), num_labels=3, max_position_embeddings=512,
+                        name_or_path=f"standin-finbert-{size}", **bert_sizes[size])
+    model = BertForSequenceClassification(config)
+    model.eval()
+    return tokenizer, model
+
+
+def load_news_texts(repeat=1):
+    """Returns the stored news_data.csv texts (title + description), optionally repeated."""
+    import pandas as pd
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    df = pd.read_csv(os.path.join(backend_dir, "data", "news_data.csv"))
+    texts = (df["title"].fillna('') + " " + df["description"].fillna('')).tolist()
+    return texts * repeat
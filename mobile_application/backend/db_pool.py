@@ -0,0 +1,141 @@
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes free within the pool's wait timeout."""
+
+
+def _ping(conn):
+    """Raises if the connection is no longer usable."""
+    if hasattr(conn, "ping"):
+        conn.ping(reconnect=False)  # pymysql: one round trip, fails on a dropped socket
+    else:
+        conn.cursor().execute("SELECT 1")
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of database connections.
+
+    Connections are opened lazily by `connect()` (up to max_size), handed out by `connection()`
+    and returned to the pool afterwards. Connections older than max_lifetime seconds are closed
+    instead of reused, idle ones are pinged before reuse if they sat longer than ping_after
+    seconds, and callers wait at most wait_timeout seconds for a free slot.
+    """
+
+    def __init__(self, connect, max_size=10, max_lifetime=3600, wait_timeout=5, ping_after=30, ping=_ping):
+        self.connect = connect
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.wait_timeout = wait_timeout
+        self.ping_after = ping_after
+        self.ping = ping
+
+        self._idle = deque()  # (conn, created_at, last_used_at), most recently used on the right
+        self._size = 0  # Open connections, idle or checked out
+        self._available = threading.Condition(threading.Lock())
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "broken": 0, "timeouts": 0}
+
+    # ====================== CHECKOUT / RETURN ======================
+
+    def _acquire(self):
+        """Checks out a connection, discarding expired or dead idle ones, within a single wait_timeout."""
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            with self._available:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.stats["timeouts"] += 1
+                        raise PoolTimeout(f"No database connection available after {self.wait_timeout}s "
+                                          f"({self.max_size} in use)")
+                    self._available.wait(remaining)
+                if self._idle:
+                    conn, created_at, last_used_at = self._idle.pop()
+                else:
+                    self._size += 1  # Reserve the slot; connect outside the lock
+                    conn = None
+
+            if conn is None:
+                return self._open()
+
+            now = time.monotonic()
+            if now - created_at >= self.max_lifetime:
+                self._discard(conn, "recycled")
+                continue
+            if now - last_used_at >= self.ping_after:
+                try:
+                    self.ping(conn)
+                except Exception:
+                    self._discard(conn, "broken")
+                    continue
+            self._count("reused")
+            return conn, created_at
+
+    def _open(self):
+        try:
+            conn = self.connect()
+        except Exception:
+            self._release_slot()
+            raise
+        self._count("created")
+        return conn, time.monotonic()
+
+    def _release(self, conn, created_at):
+        if time.monotonic() - created_at >= self.max_lifetime:
+            self._discard(conn, "recycled")
+            return
+        with self._available:
+            self._idle.append((conn, created_at, time.monotonic()))
+            self._available.notify()
+
+    def _discard(self, conn, reason):
+        self._count(reason)
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._release_slot()
+
+    def _count(self, key):
+        with self._available:
+            self.stats[key] += 1
+
+    def _release_slot(self):
+        with self._available:
+            self._size -= 1
+            self._available.notify()
+
+    # ====================== PUBLIC API ======================
+
+    @contextmanager
+    def connection(self):
+        """Yields a pooled connection; commits on success, rolls back on error, then returns it."""
+        conn, created_at = self._acquire()
+        try:
+            yield conn
+            conn.commit()
+        except Exception as error:
+            try:
+                conn.rollback()
+            except Exception:
+                # The connection itself failed (e.g. server gone); never hand it out again
+                self._discard(conn, "broken")
+                raise error  # The caller's error, not the rollback's
+            self._release(conn, created_at)
+            raise
+        self._release(conn, created_at)
+
+    def close(self):
+        """Closes every idle connection; checked-out ones stay open until they are returned."""
+        with self._available:
+            idle, self._idle = list(self._idle), deque()
+        for conn, _, _ in idle:
+            self._discard(conn, "recycled")
+
+    def status(self):
+        """Pool size, idle connections and counters."""
+        with self._available:
+            return {"size": self._size, "idle": len(self._idle), "max_size": self.max_size, **self.stats}
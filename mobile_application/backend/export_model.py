@@ -0,0 +1,98 @@
+import os
+import argparse
+
+import numpy as np
+
+from model import model_paths, sequence_length, load_preprocessor
+from model_registry import loaders
+from numpy_lstm import export_npz
+
+# Largest |exported - Keras| allowed on the scaled (0–1) output; ~1e-5 × Nifty's price range is a few paise
+tolerance = 1e-5
+
+
+def export_tflite(keras_model, path):
+    """Converts the Keras model to TFLite for a single (1, 60, 1) window.
+
+    A fixed input shape lets the converter emit the fused LSTM kernel instead of TensorFlow ops.
+    """
+    import tensorflow as tf
+
+    saved_model_dir = path + ".saved_model"
+    keras_model.export(saved_model_dir, format="tf_saved_model", verbose=False,
+                       input_signature=[tf.TensorSpec((1, sequence_length, 1), tf.float32, name="window")])
+    try:
+        flatbuffer = tf.lite.TFLiteConverter.from_saved_model(saved_model_dir).convert()
+    finally:
+        import shutil
+        shutil.rmtree(saved_model_dir, ignore_errors=True)
+    _write_atomic(path, flatbuffer)
+
+
+def export_onnx(keras_model, path, opset=17):
+    """Converts the Keras model to ONNX with a dynamic batch dimension."""
+    import tensorflow as tf
+    import tf2onnx
+
+    spec = tf.TensorSpec((None, sequence_length, 1), tf.float32, name="window")
+
+    @tf.function(input_signature=[spec])
+    def serve(windows):
+        return keras_model(windows, training=False)
+
+    onnx_model, _ = tf2onnx.convert.from_function(serve, input_signature=[spec], opset=opset)
+    _write_atomic(path, onnx_model.SerializeToString())
+
+
+def _write_atomic(path, content):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(content)
+    os.replace(tmp_path, path)
+
+
+def check_equivalence(keras_model, exported_model, windows):
+    """Largest absolute difference between the exported and Keras outputs on the given windows."""
+    expected = keras_model.predict_on_batch(windows)
+    actual = exported_model.predict_on_batch(windows)
+    return float(np.abs(np.asarray(actual) - np.asarray(expected)).max())
+
+
+def check_windows(count=256, seed=0):
+    """History windows scaled as the model serves them, plus random and edge-case windows."""
+    from backtest import load_history
+    from sequences import sliding_windows
+
+    closes = load_history()['Close'].to_numpy(dtype=np.float64)
+    windows = sliding_windows(closes[:, np.newaxis], sequence_length)[:, :, 0]
+    rng = np.random.default_rng(seed)
+    windows = windows[rng.choice(len(windows), count, replace=False)]
+    scaled = load_preprocessor(model_paths["keras"]).transform(windows)[:, :, 0]
+    edge = np.stack([np.zeros(sequence_length), np.ones(sequence_length), np.linspace(0, 1, sequence_length)])
+    return np.concatenate([scaled, rng.random((count, sequence_length)), edge])[..., np.newaxis].astype(np.float32)
+
+
+# Run as a script: export the LSTM and verify each artifact against the .h5
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the LSTM to TFLite/ONNX/NumPy and check it against Keras.")
+    parser.add_argument("formats", nargs="*", help="tflite, onnx and/or numpy (default: all)")
+    args = parser.parse_args()
+    exporters = {"tflite": export_tflite, "onnx": export_onnx, "numpy": export_npz}
+    for runtime in args.formats:
+        if runtime not in exporters:
+            parser.error(f"unknown format '{runtime}' (choose from {', '.join(exporters)})")
+
+    keras_model = loaders[".h5"](model_paths["keras"])
+    windows = check_windows()
+    failed = []
+    for runtime in args.formats or list(exporters):
+        path = model_paths[runtime]
+        exporters[runtime](keras_model, path)
+        error = check_equivalence(keras_model, loaders[os.path.splitext(path)[1]](path), windows)
+        status = "ok" if error <= tolerance else "FAILED"
+        print(f"[✔] Exported {os.path.basename(path)} ({os.path.getsize(path) / 1e6:.2f} MB): "
+              f"max |Δ| {error:.2e} on {len(windows)} windows ({status}, tolerance {tolerance:g})")
+        if error > tolerance:
+            failed.append(runtime)
+    if failed:
+        raise SystemExit(f"Exported model(s) differ from the Keras model: {', '.join(failed)}")
@@ -0,0 +1,315 @@
+import os
+import sys
+import copy
+import json
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+import storage
+import market_data
+from indicators import fgi_points, gdp_score, inflation_score, classify_sentiment
+
+# 📂 Define paths
+base_dir = os.path.dirname(__file__)
+state_path = os.path.join(base_dir, "data", "fgi_state.json")
+state_format = 2  # Bump when the persisted layout changes; older states are rebuilt from the history
+
+
+class RollingWindow:
+    """Fixed-size window with a running sum of its non-NaN values (O(1) per push)."""
+
+    def __init__(self, size):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.valid = 0
+        self.pushes = 0
+
+    def push(self, value):
+        value = float(value)
+        if len(self.values) == self.size:
+            oldest = self.values[0]
+            if not math.isnan(oldest):
+                self.total -= oldest
+                self.valid -= 1
+        self.values.append(value)
+        if not math.isnan(value):
+            self.total += value
+            self.valid += 1
+
+        # Re-sum exactly once per window length so floating-point drift cannot build up
+        self.pushes += 1
+        if self.pushes % self.size == 0:
+            self.total = math.fsum(v for v in self.values if not math.isnan(v))
+
+    def mean(self, min_periods=None):
+        """Mean of the non-NaN values, NaN until min_periods (default: a full window) are present."""
+        if self.valid < (self.size if min_periods is None else min_periods):
+            return math.nan
+        return self.total / self.valid
+
+    def to_dict(self):
+        return {"size": self.size, "values": list(self.values), "pushes": self.pushes}
+
+    @classmethod
+    def from_dict(cls, data):
+        window = cls(data["size"])
+        for value in data["values"]:
+            window.push(value)
+        window.pushes = data["pushes"]
+        return window
+
+
+class RollingExtremes:
+    """Min and max of the last `size` values, kept in monotonic deques (amortized O(1) per push)."""
+
+    def __init__(self, size):
+        self.size = size
+        self.pushes = 0
+        self.lows = deque()  # (push index, value), values increasing
+        self.highs = deque()  # (push index, value), values decreasing
+
+    def push(self, value):
+        index = self.pushes
+        self.pushes += 1
+        while self.lows and self.lows[-1][1] >= value:
+            self.lows.pop()
+        self.lows.append((index, value))
+        while self.highs and self.highs[-1][1] <= value:
+            self.highs.pop()
+        self.highs.append((index, value))
+
+        # Drop the extremes that slid out of the window
+        for queue in (self.lows, self.highs):
+            if queue[0][0] <= index - self.size:
+                queue.popleft()
+
+    def min(self):
+        return self.lows[0][1]
+
+    def max(self):
+        return self.highs[0][1]
+
+    def to_dict(self):
+        return {"size": self.size, "pushes": self.pushes, "lows": list(map(list, self.lows)),
+                "highs": list(map(list, self.highs))}
+
+    @classmethod
+    def from_dict(cls, data):
+        extremes = cls(data["size"])
+        extremes.pushes = data["pushes"]
+        extremes.lows = deque(tuple(item) for item in data["lows"])
+        extremes.highs = deque(tuple(item) for item in data["highs"])
+        return extremes
+
+
+def ema_step(previous, value, span):
+    """One step of pandas' ewm(span, adjust=False).mean() recursion."""
+    if math.isnan(previous):
+        return value
+    alpha = 2.0 / (span + 1.0)
+    old_weight = 1.0 - alpha
+    if previous == value:
+        return previous
+    return (old_weight * previous + alpha * value) / (old_weight + alpha)
+
+
+class FGIState:
+    """Rolling state behind the FGI, updated in O(1) per new daily bar."""
+
+    windows = {"sma_50": 50, "sma_200": 200, "true_range": 14, "atr": 50, "gains": 14, "losses": 14}
+
+    def __init__(self, interest_rate, gdp, inflation, window=market_data.fgi_window):
+        self.interest_rate = float(interest_rate)
+        self.gdp = float(gdp)
+        self.inflation = float(inflation)
+        self.last_date = None
+        self.prev_close = math.nan
+        self.ema_50 = math.nan
+        self.ema_200 = math.nan
+        self.scores = RollingExtremes(window)  # FGI_Normalized scales by the last `window` scores
+        for name, size in self.windows.items():
+            setattr(self, name, RollingWindow(size))
+
+    # ====================== UPDATES ======================
+
+    def update(self, date, close):
+        """Appends one bar and returns its indicator/FGI row (mutates the state)."""
+        close = float(close)
+        first = math.isnan(self.prev_close)
+
+        # ✅ Market Momentum: SMA & EMA
+        self.sma_50.push(close)
+        self.sma_200.push(close)
+        self.ema_50 = ema_step(self.ema_50, close, 50)
+        self.ema_200 = ema_step(self.ema_200, close, 200)
+
+        # ✅ Volatility: estimated True Range (±1% of the previous close) and ATR
+        true_range = 0.0 if first else abs(self.prev_close * 1.01 - self.prev_close * 0.99)
+        self.true_range.push(true_range)
+        atr_14 = self.true_range.mean()
+        self.atr.push(atr_14)
+
+        # ✅ RSI from running gain/loss sums
+        delta = 0.0 if first else close - self.prev_close
+        self.gains.push(delta if delta > 0 else 0.0)
+        self.losses.push(-delta if delta < 0 else 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rs = np.float64(self.gains.mean(1)) / np.float64(self.losses.mean(1))
+            rsi_14 = float(100 - (100 / (1 + rs)))
+
+        # ✅ FGI score, normalized by the min/max of the scores in the window
+        sma_50, sma_200 = self.sma_50.mean(), self.sma_200.mean()
+        score = int(fgi_points(sma_50, sma_200, rsi_14, atr_14, self.atr.mean(), self.interest_rate)
+                    + gdp_score(self.gdp) + inflation_score(self.inflation))
+        self.scores.push(score)
+        low, high = self.scores.min(), self.scores.max()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = float(np.float64(score - low) / (high - low) * 100)
+
+        self.prev_close = close
+        self.last_date = str(date)
+        return {
+            "Date": self.last_date,
+            "Close": close,
+            "SMA_50": sma_50,
+            "SMA_200": sma_200,
+            "EMA_50": self.ema_50,
+            "EMA_200": self.ema_200,
+            "True_Range": true_range,
+            "ATR_14": atr_14,
+            "RSI_14": rsi_14,
+            "Interest_Rate": self.interest_rate,
+            "FGI_Score": score,
+            "FGI_Normalized": normalized,
+            "Market_Sentiment": str(classify_sentiment(normalized)),
+        }
+
+    def what_if(self, date, close):
+        """Returns the FGI row for a hypothetical bar (e.g. tomorrow's prediction) without mutating the state."""
+        return copy.deepcopy(self).update(date, close)
+
+    # ====================== PERSISTENCE ======================
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in
+                ["interest_rate", "gdp", "inflation", "last_date", "prev_close", "ema_50", "ema_200"]}
+        data["format"] = state_format
+        data["scores"] = self.scores.to_dict()
+        data["windows"] = {name: getattr(self, name).to_dict() for name in self.windows}
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("format") != state_format:
+            raise ValueError(f"FGI state format {data.get('format')} is not {state_format}; rebuild it.")
+        state = cls(data["interest_rate"], data["gdp"], data["inflation"])
+        for name in ["last_date", "prev_close", "ema_50", "ema_200"]:
+            setattr(state, name, data[name])
+        state.scores = RollingExtremes.from_dict(data["scores"])
+        for name in cls.windows:
+            setattr(state, name, RollingWindow.from_dict(data["windows"][name]))
+        return state
+
+    def save(self, path=state_path):
+        """Writes the state atomically so readers never see a half-written file."""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=state_path):
+        with open(path, encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
+
+    @classmethod
+    def from_history(cls, data, interest_rate, gdp, inflation):
+        """Builds the state by replaying a Date/Close history once."""
+        state = cls(interest_rate, gdp, inflation)
+        for date, close in zip(data["Date"], data["Close"]):
+            state.update(date, close)
+        return state
+
+
+# ====================== PIPELINE HOOKS ======================
+
+def load_history(path=None, bars=None):
+    """Date/Close bars from the shared OHLCV store (the last `bars`, default all) or from a CSV at path."""
+    if path:
+        data = pd.read_csv(path)
+    elif bars:
+        data = market_data.window(bars, columns=["Date", "Close"])
+    else:
+        data = market_data.history(columns=["Date", "Close"])
+    data["Date"] = pd.to_datetime(data["Date"]).dt.strftime("%Y-%m-%d")
+    return data.sort_values(by="Date").reset_index(drop=True)
+
+
+def _resumable(path, macro, recent):
+    """The persisted state if the recent bars extend it, else None (it must be rebuilt).
+
+    A state is stale when it is in an older format, was built with other macro inputs, or ends on a
+    bar that is no longer stored as it was (download_new_bars re-fetches the last stored bar).
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        state = FGIState.load(path)
+    except (KeyError, ValueError):
+        return None
+    if [state.interest_rate, state.gdp, state.inflation] != macro:
+        return None
+    last_bar = recent[recent["Date"] == state.last_date]
+    if last_bar.empty or float(last_bar["Close"].iloc[0]) != state.prev_close:
+        return None
+    return state
+
+
+def sync_state(path=state_path, data_path=None):
+    """Feeds the stored bars that are newer than the persisted state into it, upserts their FGI rows and saves it."""
+    from fgi_model import load_macro_inputs
+
+    macro = [float(value) for value in load_macro_inputs()]
+    recent = load_history(data_path, market_data.fgi_window)
+    state = _resumable(path, macro, recent)
+
+    if state is not None:
+        new_rows = recent[recent["Date"] > state.last_date]
+        rows = [state.update(date, close) for date, close in zip(new_rows["Date"], new_rows["Close"])]
+        print(f"[✔] FGI state advanced by {len(rows)} bar(s) to {state.last_date}")
+    else:
+        history = load_history(data_path)
+        state = FGIState(*macro)
+        rows = [state.update(date, close) for date, close in zip(history["Date"], history["Close"])]
+        print(f"[✔] FGI state built from {len(history)} bars up to {state.last_date}")
+
+    # Rows for the new bars replace the what-if rows stored for their dates
+    if rows and not data_path:
+        storage.upsert("fgi", pd.DataFrame(rows))
+    state.save(path)
+    return state
+
+
+def fgi_for_tick(close, date=None, path=state_path):
+    """FGI for a live price (or predicted close) on top of the persisted state, without saving it."""
+    state = FGIState.load(path) if os.path.exists(path) else sync_state(path)
+    date = date or pd.Timestamp.today().strftime("%Y-%m-%d")
+    return state.what_if(date, close)
+
+
+def fgi_for_prediction(date, close, path=state_path):
+    """Tomorrow's FGI: the what-if row for the predicted close, stored as the newest row of the fgi table."""
+    row = sync_state(path).what_if(date, close)
+    storage.upsert("fgi", pd.DataFrame([row]))
+    return row
+
+
+# Run as a script: sync the state, optionally scoring a hypothetical close
+if __name__ == "__main__":
+    state = sync_state()
+    if len(sys.argv) > 1:
+        print(state.what_if(pd.Timestamp.today().strftime("%Y-%m-%d"), float(sys.argv[1])))
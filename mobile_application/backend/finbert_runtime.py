@@ -0,0 +1,140 @@
+import os
+import sys
+import time
+import warnings
+from types import SimpleNamespace
+
+import numpy as np
+
+# 📂 Define paths
+base_dir = os.path.dirname(os.path.abspath(__file__))
+models_dir = os.path.join(base_dir, "models")
+
+# ⚙️ FinBERT backends: fp32 is the Hugging Face model as downloaded; the others trade a little accuracy for speed
+backends = ["fp32", "int8", "onnx", "onnx-int8"]
+input_names = ["input_ids", "attention_mask", "token_type_ids"]
+
+
+# ====================== CONVERSION ======================
+
+def onnx_paths(model_name, revision, folder=models_dir):
+    """{backend: path} of the ONNX exports of one checkpoint; another model name or revision gets other files."""
+    stem = f"{model_name.replace('/', '--')}@{revision}"
+    return {"onnx": os.path.join(folder, f"{stem}.onnx"), "onnx-int8": os.path.join(folder, f"{stem}-int8.onnx")}
+
+
+def quantize_int8(model):
+    """Dynamic int8 quantization of every Linear layer (weights int8, activations quantized per batch)."""
+    import torch
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # torch.ao eager quantization is deprecated in favour of torchao
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def export_onnx(model, tokenizer, path, opset=17):
+    """Exports the FP32 model to ONNX with dynamic batch and sequence dimensions (written atomically)."""
+    import torch
+
+    sample = tokenizer(["Nifty 50 closes higher", "Markets fall"], padding=True, return_tensors="pt")
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+    tmp_path = path + ".tmp"
+    with warnings.catch_warnings(), torch.inference_mode():
+        warnings.simplefilter("ignore")
+        torch.onnx.export(model, (), tmp_path, kwargs={name: sample[name] for name in input_names},
+                          input_names=input_names, output_names=["logits"], dynamic_axes=dynamic_axes,
+                          opset_version=opset, dynamo=False)
+    os.replace(tmp_path, path)
+
+
+def quantize_onnx(source_path, path):
+    """Dynamic int8 quantization of an exported ONNX FinBERT (written atomically)."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    tmp_path = path + ".tmp"
+    quantize_dynamic(source_path, tmp_path, weight_type=QuantType.QInt8)
+    os.replace(tmp_path, path)
+
+
+class ONNXFinBERT:
+    """Runs an exported FinBERT with ONNX Runtime behind the transformers call interface (model(**inputs).logits)."""
+
+    def __init__(self, model_path, config):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.enable_cpu_mem_arena = False  # Batches vary in length; don't keep the largest one's buffers
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.config = config  # Used for the sentiment cache key
+
+    def __call__(self, **inputs):
+        import torch
+
+        feeds = {name: np.asarray(inputs[name], dtype=np.int64) for name in input_names}
+        return SimpleNamespace(logits=torch.from_numpy(self.session.run(None, feeds)[0]))
+
+
+def load_backend(model, tokenizer, backend, paths=None):
+    """Returns the FP32 model converted to the given backend, exporting ONNX files on first use.
+
+    paths defaults to onnx_paths() of the model's own name and commit (from its config).
+    """
+    if backend not in backends:
+        raise ValueError(f"SENTIMENT_BACKEND must be one of {', '.join(backends)}, got '{backend}'.")
+    if backend == "fp32":
+        return model
+    if backend == "int8":
+        return quantize_int8(model)
+
+    paths = paths or onnx_paths(getattr(model.config, "name_or_path", "") or "model",
+                                getattr(model.config, "_commit_hash", None) or "unknown")
+    if not os.path.exists(paths["onnx"]):
+        export_onnx(model, tokenizer, paths["onnx"])
+        print(f"[✔] Exported FinBERT to {os.path.basename(paths['onnx'])}")
+    if backend == "onnx-int8" and not os.path.exists(paths["onnx-int8"]):
+        quantize_onnx(paths["onnx"], paths["onnx-int8"])
+        print(f"[✔] Quantized FinBERT to {os.path.basename(paths['onnx-int8'])}")
+    return ONNXFinBERT(paths[backend], model.config)
+
+
+# ====================== AGREEMENT ======================
+
+def agreement(reference_probs, probs):
+    """Compares a backend's (n, 3) probabilities with the FP32 ones."""
+    reference_probs, probs = np.asarray(reference_probs), np.asarray(probs)
+    difference = np.abs(probs - reference_probs)
+    return {
+        "texts": len(probs),
+        "label_agreement": float((probs.argmax(axis=1) == reference_probs.argmax(axis=1)).mean()),
+        "max_abs_diff": float(difference.max()) if len(probs) else 0.0,
+        "mean_abs_diff": float(difference.mean()) if len(probs) else 0.0,
+    }
+
+
+# Run as a script: score news_data.csv with FP32 FinBERT and each backend, and report agreement and speed
+if __name__ == "__main__":
+    import pandas as pd
+    import sentiment_analysis
+
+    selected = sys.argv[1:] or backends[1:]
+    for backend in selected:
+        if backend not in backends:
+            raise SystemExit(f"Unknown backend '{backend}' (choose from {', '.join(backends)})")
+
+    news = pd.read_csv(sentiment_analysis.news_data_path)
+    texts = (news["title"].fillna('') + " " + news["description"].fillna('')).tolist()
+    sentiment_analysis.BACKEND = "fp32"  # Load the reference model; the backends are converted from it below
+    tokenizer, fp32_model = sentiment_analysis.load_finbert()
+
+    results = {}
+    for backend in ["fp32"] + [backend for backend in selected if backend != "fp32"]:
+        sentiment_analysis.model = load_backend(fp32_model, tokenizer, backend)
+        start = time.perf_counter()
+        results[backend] = sentiment_analysis.predict_probabilities(texts, use_cache=False)
+        elapsed = time.perf_counter() - start
+        report = agreement(results["fp32"], results[backend])
+        print(f"{backend:<10} {len(texts) / elapsed:7.1f} articles/sec  labels agree {report['label_agreement']:.1%}  "
+              f"max |Δp| {report['max_abs_diff']:.4f}  mean |Δp| {report['mean_abs_diff']:.5f}")
+    sentiment_analysis.model = fp32_model
@@ -0,0 +1,138 @@
+import os
+import sys
+import glob
+import json
+import threading
+from datetime import datetime, timezone
+
+import storage
+import market_data
+import market_sentiment
+from trading_calendar import next_session
+
+# 📸 One immutable forecast snapshot per forecast date, built once after market close
+schema_version = 1
+snapshot_folder = "snapshots"  # Inside storage.store_dir: <date>-v<N>.json plus latest.json
+_build_lock = threading.Lock()
+
+
+def snapshot_dir():
+    return os.path.join(storage.store_dir, snapshot_folder)
+
+
+def latest_path():
+    """The copy of the newest snapshot that /predict serves."""
+    return os.path.join(snapshot_dir(), "latest.json")
+
+
+def _versions(date):
+    """{version: path} of the snapshots stored for a forecast date."""
+    paths = glob.glob(os.path.join(snapshot_dir(), f"{date}-v*.json"))
+    return {int(os.path.basename(path)[len(date) + 2:-5]): path for path in paths}
+
+
+def _read(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def forecast_date():
+    """The session the next snapshot forecasts: the one after the newest stored bar."""
+    last_date = market_data.last_stored_date()
+    if last_date is None:
+        raise FileNotFoundError("Error: no stock data stored yet. Please fetch the stock data first.")
+    return next_session(last_date).strftime('%Y-%m-%d')
+
+
+def load(date, version=None):
+    """A stored snapshot (the newest version by default), or None."""
+    versions = _versions(date)
+    if not versions:
+        return None
+    return _read(versions[version or max(versions)])
+
+
+def latest():
+    """The newest snapshot, or None if none was built yet."""
+    try:
+        return _read(latest_path())
+    except FileNotFoundError:
+        return None
+
+
+def _compute(date):
+    """Runs prediction, FGI and recommendation once and collects them into a snapshot body."""
+    from model import predict_next_closing_price
+    from model_registry import model_info
+    import serving
+    from fgi_stream import fgi_for_prediction
+    from stock_recommendations import generate_recommendation, save_recommendation
+
+    predicted_date, predicted_price, prediction_range = predict_next_closing_price()  # Upserts the prediction
+    if predicted_date != date:
+        raise RuntimeError(f"Stock data changed while building the {date} snapshot (now {predicted_date}).")
+    fgi_for_prediction(predicted_date, predicted_price)  # What-if on the persisted FGI state
+    recommendation = generate_recommendation()
+    save_recommendation(recommendation)
+    model_id = serving.served_by(predicted_date)
+
+    return {
+        "Date": predicted_date,
+        "Predicted_Price": float(predicted_price),
+        "Prediction_Range": [float(bound) for bound in prediction_range],
+        "Overall_Market_Sentiment": recommendation["Market_Sentiment"],
+        "Today_Close": float(recommendation["Today_Close"]),
+        "FGI Score": float(recommendation["FGI_Score"]),
+        "FGI_Sentiment": recommendation["FGI_Sentiment"],
+        "Recommendation": recommendation["Recommendation"],
+        "Snapshot": {
+            "schema": schema_version,
+            "as_of": market_data.last_stored_date().strftime('%Y-%m-%d'),
+            "model": (model_info(serving.resolve(model_id)[1]) or {}).get("hash"),
+            "model_id": model_id,
+            "sentiment_date": (market_sentiment.latest() or {}).get("Date"),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+    }
+
+
+def build_snapshot(force=False):
+    """Builds the snapshot for the next session, once: a second call for the same date returns the stored one.
+
+    force=True recomputes it as a new version; stored versions are never modified.
+    """
+    with _build_lock:
+        date = forecast_date()
+        existing = load(date)
+        if existing is not None and not force:
+            print(f"[✔] Forecast snapshot for {date} already exists (v{existing['Snapshot']['version']})")
+            return existing
+
+        snapshot = _compute(date)
+        version = max(_versions(date), default=0) + 1
+        while True:
+            snapshot["Snapshot"]["version"] = version
+            try:
+                storage.write_json(snapshot, os.path.join(snapshot_dir(), f"{date}-v{version}.json"), exclusive=True)
+                break
+            except FileExistsError:  # Another process stored this version first
+                if not force:
+                    return load(date)
+                version += 1
+
+        current = latest()
+        if current is None or (current["Date"], current["Snapshot"]["version"]) <= (date, version):
+            storage.write_json(snapshot, latest_path())
+        print(f"[✔] Stored forecast snapshot for {date} (v{version}): {snapshot['Predicted_Price']:.2f}, "
+              f"{snapshot['Recommendation']}")
+        return snapshot
+
+
+def latest_or_build():
+    """The newest snapshot, building the first one if the store has none yet."""
+    return latest() or build_snapshot()
+
+
+# Run as a script: build today's snapshot (--force stores a new version)
+if __name__ == "__main__":
+    print(json.dumps(build_snapshot(force="--force" in sys.argv[1:]), indent=2))
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+
+# 🎚️ FGI sentiment bands (lower bound of FGI_Normalized → label), checked from the top
+sentiment_bands = [
+    (75, "🔴 Extreme Greed"),  # Changed to Bright Red
+    (50, "🟢 Greed"),  # Green for normal greed
+    (25, "🟠 Fear"),  # Orange for moderate fear
+]
+lowest_sentiment = "🔵 Extreme Fear"  # Blue for extreme fear
+
+
+# ====================== INDICATORS ======================
+
+def sma(close, window):
+    """Simple moving average over `window` rows."""
+    return close.rolling(window=window).mean()
+
+
+def ema(close, span):
+    """Exponential moving average (recursive form, as used by the FGI)."""
+    return close.ewm(span=span, adjust=False).mean()
+
+
+def estimated_true_range(close):
+    """True Range estimated as a ±1% band around the previous close (no intraday High/Low needed).
+
+    This is what the FGI has always used: the predicted row has no High/Low, and the
+    historical rows were scored the same way so that the index stays comparable.
+    """
+    prev_close = close.shift(1)
+    true_range = (prev_close * 1.01 - prev_close * 0.99).abs()
+    true_range.iloc[:1] = 0.0
+    return true_range
+
+
+def atr(true_range, window=14):
+    """Average True Range over `window` rows."""
+    return true_range.rolling(window=window).mean()
+
+
+def rsi(close, period=14):
+    """Relative Strength Index from simple rolling means of gains and losses."""
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+
+    avg_gain = gain.rolling(window=period, min_periods=1).mean()
+    avg_loss = loss.rolling(window=period, min_periods=1).mean()
+
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+# ====================== MACRO SCORES ======================
+
+def gdp_score(gdp):
+    """GDP above 5T USD → Greed (+1), 3–5T → Neutral (0), otherwise Fear (-1)."""
+    if gdp > 5e12:
+        return 1
+    elif gdp > 3e12:
+        return 0
+    return -1
+
+
+def inflation_score(inflation):
+    """Inflation below 4% → Greed (+1), 4–6% → Neutral (0), above 6% → Fear (-1)."""
+    if inflation < 4:
+        return 1
+    elif inflation <= 6:
+        return 0
+    return -1
+
+
+# ====================== FEAR & GREED INDEX ======================
+
+def fgi_points(sma_50, sma_200, rsi_14, atr_14, atr_baseline, interest_rate):
+    """Technical and interest-rate votes, for a single row or whole arrays."""
+    # 📈 Market momentum: bullish (SMA_50 above SMA_200) → Greed, otherwise Fear
+    score = np.where(np.greater(sma_50, sma_200), 1, -1)
+
+    # 📉 RSI: oversold → Fear, overbought → Greed
+    score = score - np.less(rsi_14, 30) + np.greater(rsi_14, 70)
+
+    # 💡 Volatility: ATR above its own rolling baseline → Fear, otherwise Greed
+    score = score + np.where(np.greater(atr_14, atr_baseline), -1, 1)
+
+    # 📊 Interest rate: low → Greed, high → Fear
+    return score + np.less(interest_rate, 5) - np.greater(interest_rate, 7)
+
+
+def fgi_score(sma_50, sma_200, rsi_14, atr_14, interest_rate, gdp, inflation, atr_baseline_window=50):
+    """Per-row FGI score: momentum, RSI, volatility, interest rate, GDP and inflation votes."""
+    atr_14 = pd.Series(atr_14, dtype=float)
+    atr_baseline = atr_14.rolling(window=atr_baseline_window).mean().to_numpy()
+    score = fgi_points(np.asarray(sma_50, dtype=float), np.asarray(sma_200, dtype=float),
+                       np.asarray(rsi_14, dtype=float), atr_14.to_numpy(), atr_baseline,
+                       np.asarray(interest_rate, dtype=float))
+    return (score + gdp_score(gdp) + inflation_score(inflation)).astype(np.int64)
+
+
+def normalize(score, window=None):
+    """Min-max scales the FGI score to 0–100 over the whole series, or over each row's last `window` rows."""
+    if window is None:
+        return (score - score.min()) / (score.max() - score.min()) * 100
+    low = score.rolling(window=window, min_periods=1).min()
+    high = score.rolling(window=window, min_periods=1).max()
+    return (score - low) / (high - low) * 100
+
+
+def classify_sentiment(normalized):
+    """Maps FGI_Normalized values to their sentiment labels."""
+    normalized = np.asarray(normalized, dtype=float)
+    conditions = [normalized >= lower for lower, _ in sentiment_bands]
+    labels = [label for _, label in sentiment_bands]
+    return np.select(conditions, labels, default=lowest_sentiment)
+
+
+def add_fgi_columns(data, interest_rate, gdp, inflation, normalize_window=None):
+    """Adds every indicator and FGI column (in the fgi_data_with_fgi.csv order) to a Close series frame.
+
+    normalize_window scales each row by the scores of its last normalize_window rows (see normalize).
+    """
+    close = data['Close']
+
+    # ✅ Market Momentum: SMA & EMA Crossover
+    data['SMA_50'] = sma(close, 50)
+    data['SMA_200'] = sma(close, 200)
+    data['EMA_50'] = ema(close, 50)
+    data['EMA_200'] = ema(close, 200)
+
+    # ✅ Volatility Indicator: ATR (the High/Low helper columns stay 0, as in the saved output)
+    data['High-Low'] = 0
+    data['High-Close'] = 0
+    data['Low-Close'] = 0
+    data['True_Range'] = estimated_true_range(close)
+    data['ATR_14'] = atr(data['True_Range'], 14)
+
+    # ✅ Relative Strength Index (RSI)
+    data['RSI_14'] = rsi(close, 14)
+
+    # ✅ Macro inputs and the combined score
+    data['Interest_Rate'] = interest_rate
+    data['FGI_Score'] = fgi_score(data['SMA_50'], data['SMA_200'], data['RSI_14'], data['ATR_14'],
+                                  data['Interest_Rate'], gdp, inflation)
+    data['FGI_Normalized'] = normalize(data['FGI_Score'], normalize_window)
+    data['Market_Sentiment'] = classify_sentiment(data['FGI_Normalized'])
+    return data
@@ -0,0 +1,89 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from market_data import download_new_bars, save_bars
+from interest_rate import download_interest_rate, save_interest_rate
+from gdp import download_gdp_data, save_gdp_data
+from inflation_rate import download_inflation_data, save_inflation_data
+from news_data import download_news, save_news
+
+# 🌐 Independent data sources: fetch(session, timeout) downloads, save(result) writes atomically.
+# timeout is per HTTP request (seconds); a failed fetch is retried with exponential backoff.
+SOURCES = {
+    "market data": {"fetch": download_new_bars, "save": save_bars, "timeout": 30, "retries": 2},
+    "interest rate": {"fetch": download_interest_rate, "save": save_interest_rate, "timeout": 10, "retries": 3},
+    "GDP": {"fetch": download_gdp_data, "save": save_gdp_data, "timeout": 10, "retries": 3},
+    "inflation rate": {"fetch": download_inflation_data, "save": save_inflation_data, "timeout": 10, "retries": 3},
+    "news": {"fetch": download_news, "save": save_news, "timeout": 10, "retries": 2},
+}
+
+backoff_seconds = 0.5  # First retry waits this long, then 2x, 4x, ...
+
+
+def make_session(pool_size=10):
+    """HTTP session shared by all sources: keep-alive connections, pooled per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _run_source(name, source, session):
+    """Fetches with retries, then saves; returns a report for the source."""
+    retries = source.get("retries", 0)
+    start = time.perf_counter()
+    for attempt in range(retries + 1):
+        try:
+            result = source["fetch"](session=session, timeout=source.get("timeout"))
+            break
+        except Exception as e:
+            if attempt == retries:
+                return {"ok": False, "attempts": attempt + 1, "seconds": time.perf_counter() - start,
+                        "error": f"{type(e).__name__}: {e}"}
+            delay = backoff_seconds * 2 ** attempt
+            print(f"⚠️ {name}: {type(e).__name__}: {e} (retrying in {delay:.2f}s)")
+            time.sleep(delay)
+    source["save"](result)
+    return {"ok": True, "attempts": attempt + 1, "seconds": time.perf_counter() - start, "error": None}
+
+
+def ingest(sources=None, session=None, max_workers=None):
+    """Fetches all sources concurrently and saves each as soon as it arrives.
+
+    A failing source is reported (after its retries) without stopping the others.
+    Returns {name: {"ok", "attempts", "seconds", "error"}}.
+    """
+    sources = SOURCES if sources is None else sources
+    own_session = session is None
+    session = session or make_session(len(sources))
+    report = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or len(sources) or 1) as executor:
+            futures = {executor.submit(_run_source, name, source, session): name for name, source in sources.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    report[name] = future.result()
+                except Exception as e:  # save() failed
+                    report[name] = {"ok": False, "attempts": 1, "seconds": None, "error": f"{type(e).__name__}: {e}"}
+                if report[name]["ok"]:
+                    print(f"[✔] {name} ingested in {report[name]['seconds']:.2f}s")
+                else:
+                    print(f"❌ {name} failed: {report[name]['error']}")
+    finally:
+        if own_session:
+            session.close()
+    return report
+
+
+# Run as a script: ingest every source once and print a summary
+if __name__ == "__main__":
+    start_time = time.perf_counter()
+    for name, entry in ingest().items():
+        status = "ok" if entry["ok"] else entry["error"]
+        print(f"{name:>16}: {status} ({entry['attempts']} attempt(s))")
+    print(f"[✔] Ingestion finished in {time.perf_counter() - start_time:.2f}s")
@@ -0,0 +1,49 @@
+import threading
+
+import numpy as np
+
+
+class TFLiteModel:
+    """Runs an exported .tflite model behind the Keras predict_on_batch interface.
+
+    The model is exported for a single (1, 60, 1) window, so batches are run one window at a time.
+    """
+
+    def __init__(self, model_path):
+        try:
+            from ai_edge_litert.interpreter import Interpreter  # LiteRT: the standalone TFLite runtime
+        except ImportError:
+            from tensorflow.lite import Interpreter  # Same kernels, but pulls in all of TensorFlow
+
+        self.interpreter = Interpreter(model_path=model_path)
+        self.interpreter.allocate_tensors()
+        self.input_index = self.interpreter.get_input_details()[0]["index"]
+        self.output_index = self.interpreter.get_output_details()[0]["index"]
+        self._lock = threading.Lock()  # An interpreter must not be invoked from two threads at once
+
+    def predict_on_batch(self, windows):
+        windows = np.asarray(windows, dtype=np.float32)
+        outputs = np.empty((len(windows), 1), dtype=np.float32)
+        with self._lock:
+            for row, window in enumerate(windows):
+                self.interpreter.set_tensor(self.input_index, window[np.newaxis])
+                self.interpreter.invoke()
+                outputs[row] = self.interpreter.get_tensor(self.output_index)[0]
+        return outputs
+
+
+class ONNXModel:
+    """Runs an exported .onnx model (any batch size) behind the Keras predict_on_batch interface."""
+
+    def __init__(self, model_path):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.enable_cpu_mem_arena = False  # Free large-batch buffers after each run instead of keeping them
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict_on_batch(self, windows):
+        windows = np.asarray(windows, dtype=np.float32)
+        return self.session.run(None, {self.input_name: windows})[0]
@@ -0,0 +1,126 @@
+import os
+from datetime import datetime, timedelta
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+import storage
+from trading_calendar import sessions_back
+
+# 📈 One canonical Nifty 50 daily OHLCV series (the "stocks" table); every consumer reads a window of it
+symbol = "^NSEI"
+lstm_window = 60  # Bars the LSTM needs
+fgi_window = 261  # Bars the FGI needs (SMA_200 plus warm-up)
+columns = ["Date", "Close", "High", "Low", "Open", "Volume"]
+legacy_fgi_csv = "fgi_data.csv"  # Older bars that only the FGI download used to keep
+symbols_folder = "symbols"  # Other tickers: storage.store_dir/symbols/<ticker>/<table>/
+_seeded = set()  # Stores already checked in this process
+
+
+def symbol_root(ticker=symbol):
+    """Store root holding a ticker's tables; None (the main store) for the Nifty 50 index itself."""
+    if ticker == symbol:
+        return None
+    return os.path.join(storage.store_dir, symbols_folder, quote(ticker, safe=""))
+
+
+def stored_symbols():
+    """Tickers other than the index that have their own tables in the store."""
+    folder = os.path.join(storage.store_dir, symbols_folder)
+    if not os.path.isdir(folder):
+        return []
+    return sorted(unquote(name) for name in os.listdir(folder) if os.path.isdir(os.path.join(folder, name)))
+
+
+def _seed():
+    """Adds the bars from the legacy fgi_data.csv that the stocks table does not have yet.
+
+    Only runs while the table holds fewer than fgi_window bars, i.e. right after migrating from CSVs.
+    """
+    if storage.store_dir in _seeded:
+        return
+    _seeded.add(storage.store_dir)
+    stored = storage.tail("stocks", fgi_window, columns=["Date"])
+    csv_path = os.path.join(storage.data_dir, legacy_fgi_csv)
+    if len(stored) >= fgi_window or not os.path.exists(csv_path):
+        return
+    legacy = pd.read_csv(csv_path, usecols=columns)
+    legacy = legacy[~pd.to_datetime(legacy['Date']).isin(storage.read("stocks", columns=["Date"])['Date'])]
+    if len(legacy):
+        storage.upsert("stocks", legacy)
+        print(f"[✔] Added {len(legacy)} older bars from {legacy_fgi_csv} to the stocks table")
+
+
+def last_stored_date(ticker=symbol):
+    """Date of the newest stored bar, or None if the store is empty."""
+    if ticker == symbol:
+        _seed()
+    latest = storage.tail("stocks", 1, columns=["Date"], root=symbol_root(ticker))
+    return None if latest.empty else latest['Date'].iloc[-1]
+
+
+def download_bars(start_date, end_date, timeout=10, ticker=symbol):
+    """Downloads daily bars for [start_date, end_date) from Yahoo Finance as a Date/OHLCV DataFrame."""
+    import yfinance as yf  # Imported lazily so importing this module stays cheap
+
+    bars = yf.download(ticker, start=start_date.strftime('%Y-%m-%d'), end=end_date.strftime('%Y-%m-%d'),
+                       interval="1d", timeout=timeout, progress=False)
+
+    # Check if the data is fetched successfully (yfinance reports failures as an empty frame)
+    if bars.empty:
+        raise ValueError(f"Data for {ticker} is unavailable. Please verify the ticker symbol.")
+
+    # Flatten yfinance's (Price, Ticker) column header
+    if isinstance(bars.columns, pd.MultiIndex):
+        bars.columns = bars.columns.get_level_values(0)
+
+    # Reset index to make the date a column, formatted as YYYY-MM-DD
+    bars = bars.reset_index()
+    bars['Date'] = pd.to_datetime(bars['Date']).dt.strftime('%Y-%m-%d')
+    return bars[columns]
+
+
+def download_new_bars(session=None, timeout=10, today=None, ticker=symbol):
+    """Downloads the bars from the last stored date onwards (the last fgi_window sessions if nothing is stored).
+
+    The last stored bar is fetched again so a bar saved during market hours gets its final values.
+    yfinance manages its own HTTP session.
+    """
+    today = pd.Timestamp(today or datetime.today()).normalize()
+    last_date = last_stored_date(ticker)
+    start_date = last_date if last_date is not None else sessions_back(today, fgi_window)
+    end_date = today + timedelta(days=1)  # yfinance's end date is exclusive
+    return download_bars(start_date, end_date, timeout, ticker)
+
+
+def save_bars(bars, ticker=symbol):
+    """Upserts downloaded bars into the ticker's stocks table (bars already stored are refreshed)."""
+    if bars.empty:
+        return
+    storage.upsert("stocks", bars, root=symbol_root(ticker))
+    print(f"[✔] Stored {len(bars)} bar(s) of {ticker} up to {bars['Date'].iloc[-1]}")
+
+
+def update(timeout=10):
+    """Brings the stocks table up to date with one incremental download."""
+    save_bars(download_new_bars(timeout=timeout))
+
+
+def window(n, columns=None, ticker=symbol):
+    """The last n stored bars, oldest first (e.g. window(lstm_window) or window(fgi_window))."""
+    if ticker == symbol:
+        _seed()
+    return storage.tail("stocks", n, columns=columns, root=symbol_root(ticker))
+
+
+def history(columns=None, ticker=symbol):
+    """Every stored bar, oldest first (what the FGI state is warmed up on)."""
+    if ticker == symbol:
+        _seed()
+    return storage.read("stocks", columns=columns, root=symbol_root(ticker))
+
+
+# Run as a script: update the store, then show the newest bars
+if __name__ == "__main__":
+    update()
+    print(window(5))
@@ -0,0 +1,89 @@
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import storage
+
+# 📰 Overall market sentiment, aggregated once per news refresh and materialized for O(1) reads
+record_file = "latest_market_sentiment.json"  # Kept next to the tables in storage.store_dir
+label_signs = {"negative": -1.0, "neutral": 0.0, "positive": 1.0}
+
+# 🗃️ Last record read from disk, keyed on the file's (path, mtime, size)
+_cached = (None, None)
+_lock = threading.Lock()
+
+
+def record_path():
+    return os.path.join(storage.store_dir, record_file)
+
+
+def summarize(labels, scores, date):
+    """Aggregates per-article labels and confidences into the market sentiment record for date.
+
+    Sentiment_Score is the mean confidence of the winning label (as before); Weighted_Score is the
+    mean signed confidence over all articles (+p positive, -p negative, 0 neutral), in [-1, 1].
+    """
+    labels = np.asarray(labels, dtype=object)
+    scores = np.asarray(scores, dtype=np.float64)
+    counts = pd.Series(labels).value_counts()
+    overall = counts.idxmax()
+    signs = np.array([label_signs[label] for label in labels])
+    return {
+        "Date": pd.Timestamp(date).strftime('%Y-%m-%d'),
+        "Overall_Sentiment": overall,
+        "Sentiment_Score": round(float(scores[labels == overall].mean()), 4),
+        "Weighted_Score": round(float((signs * scores).mean()), 4),
+        "Negative_Count": int(counts.get("negative", 0)),
+        "Neutral_Count": int(counts.get("neutral", 0)),
+        "Positive_Count": int(counts.get("positive", 0)),
+    }
+
+
+def save(record):
+    """Upserts the record into the market_sentiment table and materializes it as the latest record."""
+    storage.upsert("market_sentiment", pd.DataFrame([record]))
+    storage.write_json(record, record_path())
+
+
+def _materialize():
+    """Builds the latest record from the market_sentiment table (e.g. right after a CSV migration)."""
+    rows = storage.tail("market_sentiment", 1)
+    if rows.empty:
+        return None
+    row = rows.iloc[-1]
+    weighted_score = float(row.get("Weighted_Score", np.nan))  # Partitions written before the column lack it
+    record = {
+        "Date": row["Date"].strftime('%Y-%m-%d'),
+        "Overall_Sentiment": row["Overall_Sentiment"],
+        "Sentiment_Score": float(row["Sentiment_Score"]),
+        "Weighted_Score": None if np.isnan(weighted_score) else weighted_score,
+        "Negative_Count": int(row["Negative_Count"]),
+        "Neutral_Count": int(row["Neutral_Count"]),
+        "Positive_Count": int(row["Positive_Count"]),
+    }
+    storage.write_json(record, record_path())
+    return record
+
+
+def latest():
+    """The newest market sentiment record (a dict), or None if sentiment was never computed.
+
+    Costs one stat() per call; the JSON file is only re-read after a refresh replaced it.
+    """
+    global _cached
+    path = record_path()
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        with _lock:
+            return _materialize()
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if _cached[0] != key:
+        with _lock:
+            if _cached[0] != key:
+                with open(path) as file:
+                    _cached = (key, json.load(file))
+    return _cached[1]
@@ -1,26 +1,35 @@
 import pandas as pd
 import numpy as np
 import os
-from sklearn.preprocessing import MinMaxScaler
-from tensorflow.keras.models import load_model
-from datetime import timedelta
-import pandas_market_calendars as mcal  # For trading calendar
+import storage
+import market_data  # Shared OHLCV store
+from trading_calendar import next_session  # NSE sessions (holidays & weekends skipped)
+from model_registry import get_model  # Warm, process-wide model cache
+from model_bundle import get_preprocessor  # Scaler fitted at training time, from the model's bundle manifest
 
 # Define paths
 base_dir = os.path.dirname(__file__)
-data_path = os.path.join(base_dir, "data", "stocks_data.csv")
-model_path = os.path.join(base_dir, "models", "LSTM_model_best.h5")
-predicted_data_path = os.path.join(base_dir, "data", "predicted_prices.csv")
-
-def load_and_preprocess_data(data_path):
-    """Loads stock data, filters the last 60 valid rows, and applies scaling."""
-    try:
-        data = pd.read_csv(data_path)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Error: {data_path} not found. Please ensure the file exists.")
-
-    # Ensure 'Date' is in datetime format
-    data['Date'] = pd.to_datetime(data['Date'])
+model_paths = {
+    "keras": os.path.join(base_dir, "models", "LSTM_model_best.h5"),
+    "tflite": os.path.join(base_dir, "models", "LSTM_model_best.tflite"),  # Built by export_model.py
+    "onnx": os.path.join(base_dir, "models", "LSTM_model_best.onnx"),  # Built by export_model.py
+    "numpy": os.path.join(base_dir, "models", "LSTM_model_best.npz"),  # Built by export_model.py
+}
+
+# ⚙️ Inference runtime: MODEL_RUNTIME=tflite, onnx or numpy serves the exported model without importing TensorFlow
+runtime = os.getenv("MODEL_RUNTIME", "keras")
+if runtime not in model_paths:
+    raise ValueError(f"MODEL_RUNTIME must be one of {', '.join(model_paths)}, got '{runtime}'.")
+model_path = model_paths[runtime]
+
+sequence_length = 60  # LSTM input window (trading days)
+prediction_margin = 200  # ± range reported around each prediction
+
+def load_and_preprocess_data():
+    """Loads the last 60 valid closes (each model scales them with its own bundle preprocessing)."""
+    data = market_data.window(sequence_length)
+    if data.empty:
+        raise FileNotFoundError("Error: no stock data stored yet. Please fetch the stock data first.")
 
     # Remove any rows with missing Close prices (or any non-stock rows like predictions)
     data = data[pd.notnull(data['Close'])]
@@ -31,95 +40,54 @@ def load_and_preprocess_data(data_path):
     # Keep only the last 60 rows (for LSTM sequence input)
     data = data.tail(60)
 
-    # Scale the 'Close' prices
-    scaler = MinMaxScaler(feature_range=(0, 1))
-    data['Scaled_Close'] = scaler.fit_transform(data[['Close']])
+    return data
 
-    return data, scaler
 
+def load_preprocessor(model_path=model_path):
+    """Returns the scaling model_path was trained with (from its bundle manifest)."""
+    return get_preprocessor(model_path, sequence_length)
 
-# Function to load trained LSTM model
-def load_trained_model(model_path):
-    """Loads the trained LSTM model."""
-    try:
-        model = load_model(model_path)
-    except OSError:
-        raise OSError(f"Error: Model file {model_path} not found. Train the model first.")
 
-    return model
+# Function to load trained LSTM model
+def load_trained_model(model_path=model_path):
+    """Returns the trained LSTM model, loading it only on first use or when the file changes."""
+    return get_model(model_path)
 
 # Function to make the next day's prediction
 def predict_next_closing_price():
-    """Predicts the next day's closing price for the stock and stores it."""
-    data, scaler = load_and_preprocess_data(data_path)
-    model = load_trained_model(model_path)
-
-    # Prepare the last 60-day sequence for prediction
-    sequence_length = 60
-    input_sequence = data['Scaled_Close'].values[-sequence_length:].reshape(1, sequence_length, 1)
+    """Predicts the next day's closing price for the stock and stores it.
 
-    # Predict next day's closing price
-    predicted_scaled = model.predict(input_sequence)
+    The deployed model the day routes to serves it (see serving.py); shadow models' forecasts are recorded too.
+    """
+    import serving  # Imported here: serving builds on this module
 
-    # Inverse transform to get actual closing price
-    predicted_price = scaler.inverse_transform([[predicted_scaled[0, 0]]])[0, 0]
-
-    # Define margin for prediction range (±200)
-    margin = 200
-    prediction_range = (predicted_price - margin, predicted_price + margin)
+    data = load_and_preprocess_data()
 
     # Determine next valid trading day
     last_date = data['Date'].iloc[-1]
+    predicted_date = next_session(last_date)
 
-    # **Non-Trading Days (Holidays & Weekends)**
-    holidays = {
-        '2025-01-26', '2025-02-26', '2025-03-14', '2025-03-31', '2025-04-06', '2025-04-10',
-        '2025-04-14', '2025-04-18', '2025-05-01', '2025-06-07', '2025-07-06', '2025-08-15',
-        '2025-08-27', '2025-10-02', '2025-10-21', '2025-10-22', '2025-11-05', '2025-12-25'
-    }
-    holidays = set(pd.to_datetime(list(holidays)))  # Convert to datetime format
-
-    predicted_date = last_date + timedelta(days=1)
+    # Predict next day's closing price from the last 60-day sequence
+    window = data['Close'].to_numpy(dtype=np.float64)[np.newaxis, -sequence_length:]
+    prices, _ = serving.forecast(window, dates=[predicted_date], record=True)
+    predicted_price = float(prices[0, 0])
 
-    while predicted_date.weekday() >= 5 or predicted_date in holidays:  # Skip weekends & holidays
-        predicted_date += timedelta(days=1)
+    # Define margin for prediction range (±200)
+    prediction_range = (predicted_price - prediction_margin, predicted_price + prediction_margin)
 
-    # **NEW: Save Prediction to CSV**
+    # **NEW: Save Prediction (replaces any earlier prediction for the same date)**
     new_prediction = pd.DataFrame({"Date": [predicted_date.strftime('%Y-%m-%d')], "Predicted_Price": [predicted_price]})
-
-    # If file exists, append; otherwise, create a new file
-    if os.path.exists(predicted_data_path):
-        existing_data = pd.read_csv(predicted_data_path)
-        updated_data = pd.concat([existing_data, new_prediction]).drop_duplicates(subset=['Date'], keep='last')
-    else:
-        updated_data = new_prediction
-
-    updated_data.to_csv(predicted_data_path, index=False)
+    storage.upsert("predictions", new_prediction)
 
     # Output the prediction and the range
     return predicted_date.strftime('%Y-%m-%d'), predicted_price, prediction_range
 
-# If this script is run independently, print the next prediction
-if __name__ == "__main__":
-    next_date, predicted_price, prediction_range = predict_next_closing_price()
-    print(f"Predicted closing price for {next_date}: {predicted_price:.2f}")
-    print(f"Prediction range: {prediction_range[0]:.2f} to {prediction_range[1]:.2f}")
-
 # Function to get the last 7 days' prices
 def get_last_7_days_prices():
     """Fetches the last 7 days' actual and predicted closing prices."""
-    # Load actual prices from stock data
-    actual_data = pd.read_csv(data_path)
-    actual_data['Date'] = pd.to_datetime(actual_data['Date'])
-    actual_data = actual_data[['Date', 'Close']].sort_values(by="Date", ascending=False)
-
-    # Load predicted prices
-    if os.path.exists(predicted_data_path):
-        predicted_data = pd.read_csv(predicted_data_path)
-        predicted_data['Date'] = pd.to_datetime(predicted_data['Date'])
-        predicted_data = predicted_data.sort_values(by="Date", ascending=False)
-    else:
-        predicted_data = pd.DataFrame(columns=['Date', 'Predicted_Price'])
+    # Load actual and predicted prices
+    actual_data = storage.read("stocks", columns=['Date', 'Close']).sort_values(by="Date", ascending=False)
+    predicted_data = storage.read("predictions").sort_values(by="Date", ascending=False)
 
     # Merge actual and predicted prices on Date
     merged_data = actual_data.merge(predicted_data, on='Date', how='left')
@@ -129,4 +97,8 @@ def get_last_7_days_prices():
 
     return merged_data
 
-print(predict_next_closing_price())
+# If this script is run independently, print the next prediction
+if __name__ == "__main__":
+    next_date, predicted_price, prediction_range = predict_next_closing_price()
+    print(f"Predicted closing price for {next_date}: {predicted_price:.2f}")
+    print(f"Prediction range: {prediction_range[0]:.2f} to {prediction_range[1]:.2f}")
@@ -0,0 +1,195 @@
+import os
+import argparse
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+import storage
+from model_registry import file_hash
+
+# Define paths
+base_dir = os.path.dirname(os.path.abspath(__file__))
+repo_dir = os.path.dirname(os.path.dirname(base_dir))
+data_path = os.path.join(repo_dir, "data", "Nifty50_Train.csv")  # The LSTM notebook's training data
+index_symbol = "^NSEI"  # The series data_path holds
+
+# 📦 A bundle is a model artifact plus <stem>.bundle.json: the preprocessing it was trained with.
+# Every export of a model (.h5, .keras, .tflite, .onnx, .npz) shares the stem, and so the manifest.
+format_name = "nifty50-model-bundle"
+format_version = 1
+
+# 🧠 Resident preprocessors, keyed by manifest path
+_preprocessors = {}
+_lock = threading.Lock()
+
+
+def manifest_path(model_path):
+    """Path of the manifest describing model_path."""
+    return os.path.splitext(os.path.abspath(model_path))[0] + ".bundle.json"
+
+
+# ====================== PREPROCESSING ======================
+
+class Preprocessor:
+    """MinMax scaling to (0, 1) with the per-feature min/max fitted at training time.
+
+    Windows are (n, window) for one feature or (n, window, features); the first feature is the target.
+    The fitted scaler only describes the series it was fit on (`symbol`, the Nifty 50 index for our
+    models): rows for other symbols, and every row of a model without a fitted scaler, are scaled on
+    their own window's min/max, which is how the API scaled every input before bundles existed.
+    """
+
+    def __init__(self, features, window, scaler_min=None, scaler_max=None, symbol=None):
+        self.features = list(features)
+        self.window = window
+        self.symbol = symbol
+        self.fitted = scaler_min is not None
+        if self.fitted:
+            self.low = np.asarray(scaler_min, dtype=np.float64)
+            self.range = np.asarray(scaler_max, dtype=np.float64) - self.low
+            self.range[self.range == 0] = 1.0  # Same zero-range handling as MinMaxScaler
+            if self.low.shape != (len(self.features),):
+                raise ValueError(f"Expected {len(self.features)} scaler values, got {self.low.shape[0]}.")
+
+    def fits(self, symbols):
+        """Which rows the fitted scaler applies to, for the symbol of each window."""
+        return np.array([self.fitted and symbol == self.symbol for symbol in symbols], dtype=bool)
+
+    def _windows(self, windows):
+        windows = np.asarray(windows, dtype=np.float64)
+        if windows.ndim == 2:
+            windows = windows[..., np.newaxis]
+        if windows.shape[1:] != (self.window, len(self.features)):
+            raise ValueError(f"Expected windows of shape (n, {self.window}, {len(self.features)}), "
+                             f"got {windows.shape}.")
+        return windows
+
+    def bounds(self, windows, fitted=True):
+        """(low, range) broadcastable against (n, window, features) windows.
+
+        fitted is a bool or one bool per window (see fits()); False rows use their own min/max.
+        """
+        if self.fitted and np.all(fitted):
+            return self.low, self.range
+        windows = self._windows(windows)
+        low = windows.min(axis=1, keepdims=True)
+        data_range = windows.max(axis=1, keepdims=True) - low
+        data_range[data_range == 0] = 1.0
+        if self.fitted and np.any(fitted):
+            rows = np.reshape(fitted, (-1, 1, 1))
+            low, data_range = np.where(rows, self.low, low), np.where(rows, self.range, data_range)
+        return low, data_range
+
+    def transform(self, windows, fitted=True):
+        """Scales windows into the model's float32 (n, window, features) input, in one NumPy op."""
+        windows = self._windows(windows)
+        low, data_range = self.bounds(windows, fitted)
+        return ((windows - low) / data_range).astype(np.float32)
+
+    def inverse_transform(self, predicted, windows, fitted=True):
+        """Maps (n, 1) scaled target predictions for windows back to prices."""
+        low, data_range = self.bounds(windows, fitted)
+        low, data_range = np.reshape(low[..., 0], (-1, 1)), np.reshape(data_range[..., 0], (-1, 1))
+        return np.asarray(predicted, dtype=np.float64)[:, :1] * data_range + low
+
+
+# ====================== MANIFESTS ======================
+
+def write_manifest(model_path, features, window, scaler_min, scaler_max, training_data, architecture="lstm",
+                   framework="keras", **extra):
+    """Writes the manifest for model_path and returns it; extra keys (params, metrics, ...) are stored as given."""
+    manifest = {
+        "format": format_name,
+        "format_version": format_version,
+        "model": {"artifact": os.path.basename(model_path), "sha256": file_hash(model_path),
+                  "architecture": architecture, "framework": framework},
+        "preprocessing": {"scaler": "minmax", "feature_range": [0, 1], "features": list(features),
+                          "target": features[0], "window": window,
+                          "scaler_min": [float(value) for value in scaler_min],
+                          "scaler_max": [float(value) for value in scaler_max]},
+        "training_data": training_data,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **extra,
+    }
+    storage.write_json(manifest, manifest_path(model_path))
+    return manifest
+
+
+def bundle_from_csv(model_path, path=data_path, symbol=index_symbol, window=60, architecture="lstm",
+                    framework="keras"):
+    """Writes the manifest for a model trained like LSTM_model.ipynb: Close forward-filled, scaler fit on all rows."""
+    data = pd.read_csv(path, usecols=["Date", "Close"]).ffill().dropna()
+    closes = data['Close'].to_numpy(dtype=np.float64)
+    training_data = {"source": os.path.relpath(os.path.abspath(path), repo_dir), "symbol": symbol,
+                     "rows": len(data), "start_date": str(data['Date'].iloc[0]), "end_date": str(data['Date'].iloc[-1])}
+    return write_manifest(model_path, ["Close"], window, [closes.min()], [closes.max()], training_data,
+                          architecture, framework)
+
+
+def load_manifest(model_path):
+    """The manifest for model_path, or None if the model has none."""
+    import json
+
+    try:
+        with open(manifest_path(model_path)) as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        return None
+    if manifest.get("format") != format_name or manifest.get("format_version", 0) > format_version:
+        raise ValueError(f"{manifest_path(model_path)} is not a version {format_version} model bundle manifest.")
+    return manifest
+
+
+def get_preprocessor(model_path, window=60):
+    """Returns the warm preprocessor for model_path, re-reading the manifest only when it changes.
+
+    Models without a manifest fall back to per-window scaling over `window` closes.
+    """
+    path = manifest_path(model_path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    entry = _preprocessors.get(path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+
+    with _lock:
+        manifest = load_manifest(model_path)
+        if manifest is None:
+            print(f"⚠️ No bundle manifest for {os.path.basename(model_path)}; scaling each window on its own.")
+            preprocessor = Preprocessor(["Close"], window)
+        else:
+            settings = manifest["preprocessing"]
+            preprocessor = Preprocessor(settings["features"], settings["window"], settings["scaler_min"],
+                                        settings["scaler_max"], manifest["training_data"].get("symbol"))
+            print(f"[✔] Loaded bundle manifest {os.path.basename(path)}")
+        _preprocessors[path] = (mtime, preprocessor)
+        return preprocessor
+
+
+def clear():
+    """Drops every resident preprocessor (mainly for benchmarks)."""
+    with _lock:
+        _preprocessors.clear()
+
+
+# Run as a script: python model_bundle.py models/LSTM_model_best.h5
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write the bundle manifest for a model trained on a Date/Close CSV.")
+    parser.add_argument("model", help="Model artifact (its exports share the manifest)")
+    parser.add_argument("--data", default=data_path, help="CSV the scaler was fit on (default: data/Nifty50_Train.csv)")
+    parser.add_argument("--symbol", default=index_symbol,
+                        help="Series the data holds (only its windows use the fitted scaler)")
+    parser.add_argument("--window", type=int, default=60)
+    parser.add_argument("--architecture", default="lstm")
+    args = parser.parse_args()
+
+    manifest = bundle_from_csv(args.model, args.data, args.symbol, args.window, args.architecture)
+    settings = manifest["preprocessing"]
+    print(f"[✔] Wrote {manifest_path(args.model)}: {settings['features']} scaled from "
+          f"{settings['scaler_min'][0]:.2f}..{settings['scaler_max'][0]:.2f}, window {settings['window']}, "
+          f"{manifest['training_data']['start_date']} to {manifest['training_data']['end_date']}")
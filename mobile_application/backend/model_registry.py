@@ -0,0 +1,119 @@
+import os
+import hashlib
+import threading
+
+# Define paths
+base_dir = os.path.dirname(os.path.abspath(__file__))
+default_model_path = os.path.join(base_dir, "models", "LSTM_model_best.h5")
+
+# 🧠 Resident models, keyed by absolute artifact path
+_models = {}
+_lock = threading.Lock()
+
+
+def _load_keras_model(model_path):
+    """Loads a Keras model from disk (TensorFlow is imported only when needed)."""
+    from tensorflow.keras.models import load_model
+    return load_model(model_path, compile=False)
+
+
+def _load_tflite_model(model_path):
+    """Loads an exported .tflite model (LiteRT; TensorFlow is not imported)."""
+    from lite_runtime import TFLiteModel
+    return TFLiteModel(model_path)
+
+
+def _load_onnx_model(model_path):
+    """Loads an exported .onnx model with ONNX Runtime."""
+    from lite_runtime import ONNXModel
+    return ONNXModel(model_path)
+
+
+def _load_numpy_model(model_path):
+    """Loads LSTM weights exported to .npz and evaluates them in pure NumPy."""
+    from numpy_lstm import NumpyLSTM
+    return NumpyLSTM(model_path)
+
+
+def _load_torch_model(model_path):
+    """Loads a PyTorch Transformer saved by torch_transformer.save (torch is imported only when needed)."""
+    import torch_transformer
+    return torch_transformer.load(model_path)
+
+
+# 🔌 Loader used for each artifact type
+loaders = {".h5": _load_keras_model, ".keras": _load_keras_model, ".pt": _load_torch_model,
+           ".tflite": _load_tflite_model, ".onnx": _load_onnx_model, ".npz": _load_numpy_model}
+
+
+def file_hash(model_path):
+    """Returns the SHA-256 digest of a model artifact."""
+    digest = hashlib.sha256()
+    with open(model_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_model(model_path=default_model_path, loader=None):
+    """Returns the warm model for model_path, reloading only if the file has changed.
+
+    The loader is picked from the file extension unless one is given.
+    """
+    model_path = os.path.abspath(model_path)
+    loader = loader or loaders.get(os.path.splitext(model_path)[1].lower(), _load_keras_model)
+    try:
+        stat = os.stat(model_path)
+    except OSError:
+        raise OSError(f"Error: Model file {model_path} not found. Train the model first.")
+
+    entry = _models.get(model_path)
+    if entry is not None and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry["model"]
+
+    with _lock:
+        # Another thread may have (re)loaded the model while we were waiting
+        entry = _models.get(model_path)
+        if entry is not None and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["model"]
+
+        digest = file_hash(model_path)
+        if entry is not None and entry["hash"] == digest:
+            # File was touched but its contents are unchanged; keep the resident model
+            entry["mtime"], entry["size"] = stat.st_mtime_ns, stat.st_size
+            return entry["model"]
+
+        model = loader(model_path)
+        _models[model_path] = {
+            "model": model,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": digest,
+        }
+        print(f"[✔] Loaded model {os.path.basename(model_path)} ({digest[:12]})")
+        return model
+
+
+def preload(model_path=default_model_path, loader=None):
+    """Loads a model at startup so the first request is served from a warm model."""
+    return get_model(model_path, loader)
+
+
+def model_info(model_path=default_model_path):
+    """Returns metadata for a resident model, or None if it has not been loaded."""
+    entry = _models.get(os.path.abspath(model_path))
+    if entry is None:
+        return None
+    return {"path": model_path, "mtime": entry["mtime"], "size": entry["size"], "hash": entry["hash"]}
+
+
+def evict(model_path):
+    """Drops one resident model; callers still holding it keep a working reference."""
+    with _lock:
+        _models.pop(os.path.abspath(model_path), None)
+
+
+def clear():
+    """Drops every resident model (mainly for benchmarks)."""
+    with _lock:
+        _models.clear()
@@ -3,6 +3,10 @@ import csv
 import os
 from datetime import datetime
 
+import pandas as pd
+
+import storage
+
 # Step 1: Set up your News API key
 api_key = "Your API-key "  # Replace with your NewsAPI key
 
@@ -21,71 +25,84 @@ data_dir = os.path.join(os.path.dirname(__file__), "data")
 os.makedirs(data_dir, exist_ok=True)  # Ensure the data directory exists
 filename = os.path.join(data_dir, "news_data.csv")
 
-# Step 4: Initialize a list to store all articles and a set to track unique URLs
-all_articles = []
-unique_urls = set()  # Set to keep track of URLs to avoid duplicates
-max_articles = 500  # Define the number of articles you want to fetch
-current_page = 1
-
-# Step 5: Fetch articles in a loop until we reach the desired number or there are no more articles
-while len(all_articles) < max_articles:
-    # Update the page parameter for pagination
-    params["page"] = current_page
-
-    # Make a request to the API
-    response = requests.get(url, params=params)
-
-    # Check the response status
-    if response.status_code == 200:
-        # Parse the response JSON
-        articles = response.json().get("articles", [])
-
-        # Break the loop if no more articles are found
-        if not articles:
+# Function to page through NewsAPI and collect recent unique articles
+def download_news(session=requests, timeout=None, max_articles=500):
+    """Fetches up to max_articles recent Nifty50 articles, newest first, as title/source/publishedAt/description/url dicts."""
+    # Step 4: Initialize a list to store all articles and a set to track unique URLs
+    all_articles = []
+    unique_urls = set()  # Set to keep track of URLs to avoid duplicates
+    current_page = 1
+
+    # Step 5: Fetch articles in a loop until we reach the desired number or there are no more articles
+    while len(all_articles) < max_articles:
+        # Make a request to the API for the current page
+        response = session.get(url, params={**params, "page": current_page}, timeout=timeout)
+
+        # Check the response status
+        if response.status_code == 200:
+            # Parse the response JSON
+            articles = response.json().get("articles", [])
+
+            # Break the loop if no more articles are found
+            if not articles:
+                break
+
+            # Add the fetched articles to the list and remove duplicates
+            for article in articles:
+                # Check if the article's URL is unique
+                if article["url"] not in unique_urls:
+                    all_articles.append(article)
+                    unique_urls.add(article["url"])  # Add URL to the set
+
+            # Check if we have fetched enough articles
+            if len(all_articles) >= max_articles:
+                break
+
+            # Increment the page number for the next request
+            current_page += 1
+
+        elif current_page == 1:
+            # Nothing fetched yet: let the caller retry
+            response.raise_for_status()
             break
 
-        # Add the fetched articles to the list and remove duplicates
-        for article in articles:
-            # Check if the article's URL is unique
-            if article["url"] not in unique_urls:
-                all_articles.append(article)
-                unique_urls.add(article["url"])  # Add URL to the set
-
-        # Check if we have fetched enough articles
-        if len(all_articles) >= max_articles:
+        else:
+            # Handle errors (e.g. the plan's result limit); keep the pages we already have
+            print(f"Error: {response.status_code}")
+            print(f"Response: {response.text}")
             break
 
-        # Increment the page number for the next request
-        current_page += 1
-
-    else:
-        # Handle errors
-        print(f"Error: {response.status_code}")
-        print(f"Response: {response.text}")
-        break
-
-# Step 6: Prepare new articles to be added to the CSV
-new_articles = []
-for article in all_articles:
-    new_articles.append({
-        "title": article["title"],
-        "source": article["source"]["name"],
-        "publishedAt": article["publishedAt"],
-        "description": article["description"],
-        "url": article["url"]
-    })
-
-# Step 7: Sort the new articles by 'publishedAt' date in descending order
-new_articles.sort(key=lambda x: datetime.strptime(x["publishedAt"], "%Y-%m-%dT%H:%M:%SZ"), reverse=True)
-
-# Step 8: Write the filtered recent articles to the CSV file (overwrite existing file)
-with open(filename, mode='w', newline='', encoding='utf-8') as file:
-    writer = csv.DictWriter(file, fieldnames=["title", "source", "publishedAt", "description", "url"])
-    writer.writeheader()
-    writer.writerows(new_articles)
-
-print(f"Recent news articles related to Nifty50 have been saved to {filename}")
-print(f"Total articles saved: {len(new_articles)}")
+    # Step 6: Prepare new articles to be added to the CSV
+    new_articles = []
+    for article in all_articles:
+        new_articles.append({
+            "title": article["title"],
+            "source": article["source"]["name"],
+            "publishedAt": article["publishedAt"],
+            "description": article["description"],
+            "url": article["url"]
+        })
+
+    # Step 7: Sort the new articles by 'publishedAt' date in descending order
+    new_articles.sort(key=lambda x: datetime.strptime(x["publishedAt"], "%Y-%m-%dT%H:%M:%SZ"), reverse=True)
+    return new_articles
+
+# Function to save the articles to the CSV file
+def save_news(new_articles):
+    """Overwrites news_data.csv with the articles (atomically)."""
+    # Step 8: Write the filtered recent articles to the CSV file (overwrite existing file)
+    columns = ["title", "source", "publishedAt", "description", "url"]
+    storage.write_csv(pd.DataFrame(new_articles, columns=columns), filename)
+
+    print(f"Recent news articles related to Nifty50 have been saved to {filename}")
+    print(f"Total articles saved: {len(new_articles)}")
+
+# Function to page through NewsAPI and save recent articles to the CSV file
+def fetch_and_save_news(max_articles=500):
+    """Fetches up to max_articles recent Nifty50 articles and overwrites news_data.csv."""
+    new_articles = download_news(max_articles=max_articles)
+    save_news(new_articles)
+    return new_articles
 
 # Function to fetch latest news data
 def fetch_latest_news():
@@ -104,3 +121,6 @@ def fetch_latest_news():
         print(f"Error reading news data: {e}")
         return []
 
+# Run the fetcher when the script is executed directly
+if __name__ == "__main__":
+    fetch_and_save_news()
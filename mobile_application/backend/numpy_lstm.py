@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+
+# Gate order used in the .npz: the three sigmoid gates first, so each step needs one sigmoid and one tanh
+gate_order = ["input", "forget", "output", "cell"]
+_keras_gates = ["input", "forget", "cell", "output"]  # Keras' column order in kernel/recurrent_kernel/bias
+
+
+def export_npz(keras_model, path):
+    """Extracts the LSTM + Dense weights of a Keras model into a compact .npz (written atomically)."""
+    lstm = next(layer for layer in keras_model.layers if layer.__class__.__name__ == "LSTM")
+    dense = keras_model.layers[-1]
+    config = lstm.get_config()
+    if config["activation"] != "tanh" or config["recurrent_activation"] != "sigmoid" or config["return_sequences"]:
+        raise ValueError("Only a single tanh/sigmoid LSTM returning its last state is supported.")
+    if dense.__class__.__name__ != "Dense" or dense.get_config()["activation"] != "linear":
+        raise ValueError("The model must end with a linear Dense layer.")
+
+    kernel, recurrent_kernel, bias = lstm.get_weights()
+    units = config["units"]
+    order = np.concatenate([np.arange(units) + _keras_gates.index(gate) * units for gate in gate_order])
+    dense_kernel, dense_bias = dense.get_weights()
+
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, kernel=kernel[:, order], recurrent_kernel=recurrent_kernel[:, order], bias=bias[order],
+             dense_kernel=dense_kernel, dense_bias=dense_bias)
+    os.replace(tmp_path, path)
+
+
+class NumpyLSTM:
+    """LSTM(units) + Dense forward pass in NumPy, behind the Keras predict_on_batch interface.
+
+    State is kept units-major, (units, batch), so each gate is a contiguous block of rows. The input
+    projection for all timesteps is one matmul; each step then costs one (4 units, units) x (units, batch)
+    matmul plus the gate nonlinearities, done in place.
+    """
+
+    def __init__(self, model_path, dtype=np.float32):
+        with np.load(model_path) as weights:
+            self.kernel = np.ascontiguousarray(weights["kernel"].T, dtype=dtype)  # (4 units, features)
+            self.recurrent_kernel = np.ascontiguousarray(weights["recurrent_kernel"].T, dtype=dtype)  # (4 units, units)
+            self.bias = weights["bias"].astype(dtype)[:, np.newaxis]
+            self.dense_kernel = np.ascontiguousarray(weights["dense_kernel"].T, dtype=dtype)  # (outputs, units)
+            self.dense_bias = weights["dense_bias"].astype(dtype)
+        self.units = self.recurrent_kernel.shape[1]
+        self.dtype = dtype
+
+    def predict_on_batch(self, windows):
+        windows = np.asarray(windows, dtype=self.dtype)
+        batch, steps, _ = windows.shape
+        units = self.units
+
+        # Input contribution for every timestep at once: (steps, 4 units, batch)
+        projected = np.matmul(self.kernel, windows.transpose(1, 2, 0))
+        projected += self.bias
+
+        hidden = np.zeros((units, batch), dtype=self.dtype)
+        cell = np.zeros((units, batch), dtype=self.dtype)
+        gates = np.empty((4 * units, batch), dtype=self.dtype)
+        input_gate, forget_gate, output_gate, candidate = (gates[index * units:(index + 1) * units] for index in range(4))
+        sigmoid = gates[:3 * units]
+        for step in range(steps):
+            np.matmul(self.recurrent_kernel, hidden, out=gates)
+            gates += projected[step]
+            np.multiply(sigmoid, 0.5, out=sigmoid)  # sigmoid(x) = 0.5 * (1 + tanh(x / 2))
+            np.tanh(sigmoid, out=sigmoid)
+            sigmoid += 1
+            sigmoid *= 0.5
+            np.tanh(candidate, out=candidate)
+
+            cell *= forget_gate
+            candidate *= input_gate
+            cell += candidate
+            np.tanh(cell, out=hidden)
+            hidden *= output_gate
+
+        return (self.dense_kernel @ hidden).T + self.dense_bias
@@ -0,0 +1,45 @@
+import argparse
+import time
+
+from ingest import ingest
+from sentiment_analysis import run_sentiment_analysis
+from forecast_snapshot import build_snapshot
+from fgi_stream import sync_state
+from tickers import refresh as refresh_constituents
+
+# 🔄 Refresh stages, in the order they must run
+STAGES = {
+    "fetch": [
+        ("market, macro and news sources", ingest),  # Concurrent; see ingest.SOURCES
+        ("incremental FGI state", sync_state),  # Only the new bars; their rows are upserted into the fgi table
+    ],
+    "score": [
+        ("news sentiment", run_sentiment_analysis),
+    ],
+    "predict": [
+        ("daily forecast snapshot", build_snapshot),  # Prediction, FGI and recommendation, once per date
+    ],
+    "constituents": [
+        ("Nifty 50 constituents", refresh_constituents),  # Per-symbol bars, prediction, FGI and recommendation
+    ],
+}
+
+
+def run_refresh(stages=tuple(STAGES)):
+    """Runs the fetch → score → predict → constituents pipeline that used to run on import of app.py."""
+    for stage in STAGES:
+        if stage not in stages:
+            continue
+        for name, step in STAGES[stage]:
+            print(f"[✔] Refreshing {name}...")
+            start = time.perf_counter()
+            step()
+            print(f"[✔] {name} refreshed in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh backend data, sentiment and predictions.")
+    parser.add_argument("stages", nargs="*", choices=list(STAGES),
+                        help="Stages to run (default: all)")
+    args = parser.parse_args()
+    run_refresh(args.stages or list(STAGES))
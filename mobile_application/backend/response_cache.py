@@ -0,0 +1,71 @@
+import os
+import hashlib
+import threading
+
+from flask import current_app, request
+
+import storage
+
+# ⚙️ Set RESPONSE_CACHE=0 to rebuild every response (e.g. when debugging an endpoint)
+ENABLED = os.getenv("RESPONSE_CACHE", "1") != "0"
+
+# 🗃️ Pre-serialized responses, keyed by endpoint name
+_entries = {}
+_stats = {}
+_lock = threading.Lock()
+
+
+def _count(key, outcome):
+    with _lock:
+        counters = _stats.setdefault(key, {"hits": 0, "misses": 0, "not_modified": 0})
+        counters[outcome] += 1
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (path, None, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def cached_json(key, tables, build, files=(), root=None):
+    """Returns build()'s result as a JSON response, serialized once per version of the source tables.
+
+    The cache entry is keyed on the (path, mtime, size) of every file behind `tables` (in the store
+    `root`, the main one by default) and of any extra `files`, so it is invalidated as soon as the
+    refresh pipeline writes new data. Responses carry an ETag, and a matching If-None-Match gets a
+    304 without a body.
+    """
+    signature = tuple(storage.signature(name, root) for name in tables) + tuple(_file_signature(path) for path in files)
+    entry = _entries.get(key) if ENABLED else None
+
+    if entry is not None and entry["signature"] == signature:
+        _count(key, "hits")
+    else:
+        _count(key, "misses")
+        body = current_app.json.dumps(build()) + "\n"  # Same bytes as jsonify()
+        entry = {"signature": signature, "body": body, "etag": hashlib.sha1(body.encode("utf-8")).hexdigest()}
+        if ENABLED:
+            _entries[key] = entry
+
+    response = current_app.response_class(entry["body"], mimetype="application/json")
+    response.set_etag(entry["etag"])
+    response.headers["Cache-Control"] = "no-cache"  # Clients may keep it, but must revalidate
+    response = response.make_conditional(request)
+    if response.status_code == 304:
+        _count(key, "not_modified")
+    return response
+
+
+def stats():
+    """Hit/miss/304 counters per endpoint."""
+    with _lock:
+        return {key: dict(counters) for key, counters in _stats.items()}
+
+
+def clear():
+    """Drops every cached response and counter."""
+    with _lock:
+        _entries.clear()
+        _stats.clear()
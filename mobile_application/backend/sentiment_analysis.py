@@ -1,114 +1,224 @@
 import os
+import re
+import time
 import pandas as pd
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import torch.nn.functional as F
-import nltk
-
-# 📚 Download required NLTK resources
-nltk.download('punkt')
-nltk.download('stopwords')
+import storage
+from sentiment_cache import SentimentCache, cache_key
+import market_sentiment
+from finbert_runtime import backends, load_backend, onnx_paths, ONNXFinBERT
 
 # 📂 Define relative paths for data
 base_dir = os.path.dirname(__file__)  # Get the directory of the script
 news_data_path = os.path.join(base_dir, "data", "news_data.csv")  # News data CSV
-sentiment_output_path = os.path.join(base_dir, "data", "news_sentiment_results.csv")  # Sentiment results
-market_sentiment_path = os.path.join(base_dir, "data", "market_sentiment.csv")  # Overall sentiment tracking
 
-# 🎯 Load FinBERT model and tokenizer
+# 🎯 FinBERT model and tokenizer (loaded lazily on first use, then kept in memory)
 MODEL_NAME = "ProsusAI/finbert"
-tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
-
-# 📊 Load news data
-df = pd.read_csv(news_data_path)
-
-# 📝 Combine 'title' and 'description' for sentiment analysis
-df["text"] = df["title"].fillna('') + " " + df["description"].fillna('')
-
-# ====================== HELPER FUNCTION ======================
+FINBERT_REVISION = os.getenv("FINBERT_REVISION")  # Commit, branch or tag to load (default: main in the local HF cache)
+tokenizer = None
+model = None
+revision = None  # Resolved commit hash (see model_revision)
+
+# ⚙️ Batch scoring settings (override with environment variables)
+BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", 32))  # Articles per forward pass
+MAX_LENGTH = int(os.getenv("SENTIMENT_MAX_LENGTH", 512))  # Tokens kept per article
+NUM_THREADS = int(os.getenv("SENTIMENT_NUM_THREADS", 0))  # torch intra-op threads (0 = torch default)
+USE_CACHE = os.getenv("SENTIMENT_CACHE", "1") != "0"  # Reuse stored scores for unchanged texts
+BACKEND = os.getenv("SENTIMENT_BACKEND", "fp32")  # fp32, int8 (torch dynamic quantization), onnx or onnx-int8
+if BACKEND not in backends:
+    raise ValueError(f"SENTIMENT_BACKEND must be one of {', '.join(backends)}, got '{BACKEND}'.")
+
+# 🗃️ Persistent score cache (opened lazily)
+cache = None
+
+sentiment_labels = ["negative", "neutral", "positive"]
+
+def model_revision():
+    """The FinBERT commit hash, from FINBERT_REVISION or the local Hugging Face cache refs.
+
+    Resolved without importing torch or loading weights; None until the model was downloaded once.
+    """
+    global revision
+    if revision is None:
+        wanted = FINBERT_REVISION or "main"
+        if re.fullmatch(r"[0-9a-f]{40}", wanted):
+            revision = wanted
+        else:
+            from huggingface_hub.constants import HF_HUB_CACHE
+
+            ref_path = os.path.join(HF_HUB_CACHE, "models--" + MODEL_NAME.replace("/", "--"), "refs", wanted)
+            try:
+                with open(ref_path) as file:
+                    revision = file.read().strip() or None
+            except OSError:
+                pass
+    return revision
+
+def load_finbert():
+    """Loads the FinBERT tokenizer and model (converted to SENTIMENT_BACKEND) once per process."""
+    global tokenizer, model, revision
+    if model is None:
+        from transformers import AutoConfig, AutoTokenizer, AutoModelForSequenceClassification
+        pinned = model_revision() or FINBERT_REVISION  # Load exactly the commit the cache keys name
+        exports = onnx_paths(MODEL_NAME, revision) if revision else {}
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, revision=pinned)
+        if BACKEND in exports and os.path.exists(exports[BACKEND]):
+            # Already exported from this commit: serve from ONNX Runtime without loading the PyTorch weights
+            model = ONNXFinBERT(exports[BACKEND], AutoConfig.from_pretrained(MODEL_NAME, revision=pinned))
+        else:
+            fp32_model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME, revision=pinned)
+            fp32_model.eval()
+            revision = revision or getattr(fp32_model.config, "_commit_hash", None)
+            model = load_backend(fp32_model, tokenizer, BACKEND, onnx_paths(MODEL_NAME, revision or "unknown"))
+    return tokenizer, model
+
+def get_cache():
+    """Opens the sentiment cache once per process (None when caching is disabled)."""
+    global cache
+    if cache is None and USE_CACHE:
+        cache = SentimentCache()
+    return cache
+
+def model_identity(max_length=MAX_LENGTH):
+    """Returns the (name, revision) pair that cached scores are keyed on (loads FinBERT only if never downloaded)."""
+    commit = model_revision()
+    if commit is None:
+        _, loaded = load_finbert()
+        commit = getattr(loaded.config, "_commit_hash", None) or "unknown"
+    backend = "" if BACKEND == "fp32" else f"/backend={BACKEND}"  # Quantized scores are cached separately
+    return MODEL_NAME, f"{commit}/max_length={max_length}{backend}"
+
+# ====================== HELPER FUNCTIONS ======================
+
+# 🎯 Function to get class probabilities for many texts, reusing cached scores where possible
+def predict_probabilities(texts, batch_size=BATCH_SIZE, max_length=MAX_LENGTH, num_threads=NUM_THREADS,
+                          use_cache=True):
+    """Returns an (n_texts, 3) array of FinBERT probabilities, in sentiment_labels order."""
+    import numpy as np
+
+    texts = list(texts)
+    sentiment_cache = get_cache() if use_cache else None
+    if sentiment_cache is None:
+        return score_batches(texts, batch_size, max_length, num_threads)
+
+    name, revision = model_identity(max_length)
+    keys = [cache_key(name, revision, text) for text in texts]
+    cached = sentiment_cache.get_many(keys)
+
+    probs = np.zeros((len(texts), len(sentiment_labels)), dtype=np.float32)
+    missing = {}  # key -> first index of each distinct uncached text
+    for i, key in enumerate(keys):
+        if key in cached:
+            probs[i] = cached[key][1]
+        else:
+            missing.setdefault(key, i)
+
+    if missing:
+        start = time.perf_counter()
+        new_probs = score_batches([texts[i] for i in missing.values()], batch_size, max_length, num_threads)
+        sentiment_cache.record_scoring_time((time.perf_counter() - start) / len(missing))
+
+        by_key = dict(zip(missing, new_probs))
+        for i, key in enumerate(keys):
+            if key in by_key:
+                probs[i] = by_key[key]
+        sentiment_cache.put_many([(key, sentiment_labels[int(p.argmax())], p) for key, p in by_key.items()])
+
+    return probs
+
+# 🎯 Function to run FinBERT over many texts in batched forward passes
+def score_batches(texts, batch_size=BATCH_SIZE, max_length=MAX_LENGTH, num_threads=NUM_THREADS):
+    """Scores texts with FinBERT (no cache) and returns an (n_texts, 3) probability array."""
+    import numpy as np
+    import torch
+
+    tokenizer, model = load_finbert()
+    if num_threads:
+        torch.set_num_threads(num_threads)
+
+    texts = list(texts)
+    probs = np.zeros((len(texts), len(sentiment_labels)), dtype=np.float32)
+    if not texts:
+        return probs
+
+    # Tokenize once without padding, then batch texts of similar length so padding stays minimal
+    encoded = tokenizer(texts, truncation=True, max_length=max_length)
+    lengths = np.fromiter((len(ids) for ids in encoded["input_ids"]), dtype=np.int64, count=len(texts))
+    order = np.argsort(lengths, kind="stable")
+
+    with torch.inference_mode():
+        for start in range(0, len(order), batch_size):
+            batch_idx = order[start:start + batch_size]
+            features = [{key: encoded[key][i] for key in encoded.keys()} for i in batch_idx]
+            inputs = tokenizer.pad(features, padding=True, return_tensors="pt")
+            logits = model(**inputs).logits
+            probs[batch_idx] = torch.softmax(logits, dim=-1).numpy()
+
+    return probs
+
+# 🎯 Function to get sentiment labels and scores for many texts at once
+def predict_sentiments(texts, **kwargs):
+    """Returns (labels, scores) arrays: the most likely sentiment and its probability per text."""
+    import numpy as np
+
+    probs = predict_probabilities(texts, **kwargs)
+    best = probs.argmax(axis=1)
+    return np.array(sentiment_labels, dtype=object)[best], probs[np.arange(len(probs)), best].astype(np.float64)
 
 # 🎯 Function to get sentiment from FinBERT
 def predict_sentiment(text):
-    inputs = tokenizer(text, return_tensors="pt", truncation=True, padding=True, max_length=512)
-    with torch.no_grad():
-        outputs = model(**inputs)
-        probs = F.softmax(outputs.logits, dim=-1)
-
-    # Get class with highest probability
-    sentiment_labels = ["negative", "neutral", "positive"]
-    sentiment = sentiment_labels[torch.argmax(probs)]
-    sentiment_score = probs[0][torch.argmax(probs)].item()
-
-    return sentiment, sentiment_score
+    labels, scores = predict_sentiments([text])
+    return labels[0], float(scores[0])
 
 # ====================== SENTIMENT ANALYSIS ======================
 
-# 🔥 Apply sentiment prediction to each row
-df["Sentiment"], df["Sentiment_Score"] = zip(*df["text"].map(predict_sentiment))
-
-# 📊 Determine overall sentiment
-sentiment_counts = df["Sentiment"].value_counts()
-overall_sentiment = sentiment_counts.idxmax()
-overall_sentiment_score = df[df["Sentiment"] == overall_sentiment]["Sentiment_Score"].mean()
+# 🔄 Score news_data.csv and update the market sentiment summary
+def run_sentiment_analysis():
+    """Scores every article in news_data.csv, stores the results and updates the market sentiment table."""
+    # 📊 Load news data
+    df = pd.read_csv(news_data_path)
 
-# ✅ Save sentiment analysis results to CSV
-df.to_csv(sentiment_output_path, index=False)
+    # 📝 Combine 'title' and 'description' for sentiment analysis
+    df["text"] = df["title"].fillna('') + " " + df["description"].fillna('')
 
-# ====================== MARKET SENTIMENT SUMMARY ======================
+    # 🔥 Score every article in length-sorted batches, skipping texts already in the cache
+    sentiment_cache = get_cache()
+    if sentiment_cache is not None:
+        sentiment_cache.reset_stats()
+    df["Sentiment"], df["Sentiment_Score"] = predict_sentiments(df["text"])
 
-# 📅 Prepare sentiment summary for tomorrow's date
-tomorrow_date = (pd.Timestamp.today() + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
-sentiment_summary = pd.DataFrame([{
-    "Date": tomorrow_date,
-    "Overall_Sentiment": overall_sentiment,
-    "Sentiment_Score": round(overall_sentiment_score, 4),  # Rounded for clarity
-    "Negative_Count": sentiment_counts.get("negative", 0),
-    "Neutral_Count": sentiment_counts.get("neutral", 0),
-    "Positive_Count": sentiment_counts.get("positive", 0)
-}])
+    # ✅ Store sentiment analysis results (articles already stored are updated by URL)
+    storage.upsert("news_sentiment", df)
 
-# ====================== UPDATE MARKET SENTIMENT ======================
+    # ====================== MARKET SENTIMENT SUMMARY ======================
 
-# 📂 Check if market sentiment file exists
-if os.path.exists(market_sentiment_path):
-    market_df = pd.read_csv(market_sentiment_path)
+    # 📅 Aggregate counts, scores and the overall label for tomorrow's date
+    tomorrow_date = pd.Timestamp.today() + pd.Timedelta(days=1)
+    summary = market_sentiment.summarize(df["Sentiment"], df["Sentiment_Score"], tomorrow_date)
 
-    # 📅 Check if tomorrow's date already exists
-    if tomorrow_date in market_df["Date"].values:
-        # ✅ Correctly update the existing row
-        market_df.loc[market_df["Date"] == tomorrow_date, "Overall_Sentiment"] = overall_sentiment
-        market_df.loc[market_df["Date"] == tomorrow_date, "Sentiment_Score"] = round(overall_sentiment_score, 4)
-        market_df.loc[market_df["Date"] == tomorrow_date, "Negative_Count"] = sentiment_counts.get("negative", 0)
-        market_df.loc[market_df["Date"] == tomorrow_date, "Neutral_Count"] = sentiment_counts.get("neutral", 0)
-        market_df.loc[market_df["Date"] == tomorrow_date, "Positive_Count"] = sentiment_counts.get("positive", 0)
-    else:
-        # ➕ Append the new sentiment summary if date not present
-        market_df = pd.concat([market_df, sentiment_summary], ignore_index=True)
-else:
-    # 🆕 Create new file with the first sentiment summary
-    market_df = sentiment_summary
+    # ====================== UPDATE MARKET SENTIMENT ======================
 
-# ====================== CLEAN AND SAVE DATA ======================
+    # ✅ Insert tomorrow's summary (replacing the row if it exists) and materialize it for /predict
+    market_sentiment.save(summary)
 
-# 🧹 Drop duplicate rows by 'Date' before saving
-market_df.drop_duplicates(subset="Date", keep="last", inplace=True)
+    # ====================== DISPLAY RESULTS ======================
 
-# 🚫 Drop rows with all NaN values as a backup check
-market_df.dropna(how="all", inplace=True)
+    # 📰 Display sample sentiment results
+    print(df[["title", "Sentiment", "Sentiment_Score"]].head())
 
-# ✅ Save the updated file without duplicates or NaN values
-market_df.to_csv(market_sentiment_path, index=False)
+    # 📊 Print sentiment distribution
+    print("\nSentiment Distribution:")
+    print(df["Sentiment"].value_counts())
+    print(f"\n✅ Overall Market Sentiment: {summary['Overall_Sentiment']} ({summary['Sentiment_Score']}, "
+          f"weighted {summary['Weighted_Score']:+.4f})")
 
-# ====================== DISPLAY RESULTS ======================
+    # 🗃️ Print cache effectiveness for this run
+    if sentiment_cache is not None:
+        stats = sentiment_cache.stats()
+        seconds_per_text = sentiment_cache.seconds_per_text() or 0.0
+        print(f"🗃️ Sentiment cache: {stats['hits']} hits / {stats['misses']} misses "
+              f"({stats['hit_rate']:.1%} hit rate), ~{stats['hits'] * seconds_per_text:.2f}s of scoring saved")
 
-# 📰 Display sample sentiment results
-print(df[["title", "Sentiment", "Sentiment_Score"]].head())
-
-# 📊 Print sentiment distribution
-print("\nSentiment Distribution:")
-print(sentiment_counts)
-print(f"\n✅ Overall Market Sentiment: {overall_sentiment} ({round(overall_sentiment_score, 4)})")
+    return df
 
 # ====================== EXTERNAL SENTIMENT FUNCTION ======================
 
@@ -116,3 +226,7 @@ print(f"\n✅ Overall Market Sentiment: {overall_sentiment} ({round(overall_sent
 def analyze_sentiment(text):
     sentiment, sentiment_score = predict_sentiment(text)
     return sentiment, sentiment_score
+
+# 🚀 Run the bulk analysis when the script is executed directly
+if __name__ == "__main__":
+    run_sentiment_analysis()
@@ -0,0 +1,115 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+# 📂 Default cache location (next to the other backend data files)
+base_dir = os.path.dirname(__file__)
+default_cache_path = os.path.join(base_dir, "data", "sentiment_cache.sqlite")
+default_max_entries = int(os.getenv("SENTIMENT_CACHE_MAX_ENTRIES", 50000))
+
+
+def cache_key(model_name, model_revision, text):
+    """Content address of a scored text: SHA-256 over (model name, model revision, text)."""
+    payload = "\0".join([model_name, str(model_revision), text])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """Persistent, size-bounded (LRU) store of sentiment probabilities keyed by content hash."""
+
+    def __init__(self, path=default_cache_path, max_entries=default_max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sentiment ("
+            " key TEXT PRIMARY KEY, label TEXT NOT NULL, probs TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sentiment_last_used ON sentiment (last_used)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value REAL NOT NULL)")
+        self._conn.commit()
+
+    def get_many(self, keys):
+        """Returns {key: (label, probs)} for the keys that are cached, refreshing their LRU time."""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # SQLite limits bound parameters per statement, so look keys up in chunks
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, label, probs FROM sentiment WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, label, probs in rows:
+                    found[key] = (label, json.loads(probs))
+            if found:
+                now = time.time()
+                self._conn.executemany("UPDATE sentiment SET last_used = ? WHERE key = ?",
+                                       [(now, key) for key in found])
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries):
+        """Stores [(key, label, probs)] and evicts the least recently used rows beyond max_entries."""
+        if not entries:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sentiment (key, label, probs, last_used) VALUES (?, ?, ?, ?)",
+                [(key, label, json.dumps([float(p) for p in probs]), now) for key, label, probs in entries],
+            )
+            self._conn.execute(
+                "DELETE FROM sentiment WHERE key IN ("
+                " SELECT key FROM sentiment ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def record_scoring_time(self, seconds_per_text):
+        """Keeps a running average of the cost of scoring one uncached text."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE name = 'seconds_per_text'").fetchone()
+            value = seconds_per_text if row is None else 0.8 * row[0] + 0.2 * seconds_per_text
+            self._conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('seconds_per_text', ?)", (value,))
+            self._conn.commit()
+
+    def seconds_per_text(self):
+        """Returns the average cost of scoring one uncached text, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE name = 'seconds_per_text'").fetchone()
+        return None if row is None else row[0]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sentiment").fetchone()[0]
+
+    def stats(self):
+        """Returns hit/miss counters since this cache object was opened."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,88 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def sliding_windows(values, seq_length):
+    """Returns every seq_length-row window of values as a read-only, zero-copy view.
+
+    values is (n_rows,) or (n_rows, n_features); the result is (n_rows - seq_length + 1, seq_length, n_features).
+    """
+    values = np.asarray(values)
+    if values.ndim == 1:
+        values = values[:, None]
+    if len(values) < seq_length:
+        raise ValueError(f"Need at least {seq_length} rows to build a window, got {len(values)}.")
+    # sliding_window_view puts the window axis last; move it next to the sample axis
+    return sliding_window_view(values, seq_length, axis=0).transpose(0, 2, 1)
+
+
+def make_sequences(values, seq_length, target_column=0):
+    """Builds (X, y) for next-step prediction without copying the inputs.
+
+    X[i] is rows i .. i+seq_length-1 and y[i] is row i+seq_length (column target_column,
+    or the whole row when target_column is None) — the same pairs as the notebooks' loops.
+    """
+    values = np.asarray(values)
+    if values.ndim == 1:
+        values = values[:, None]
+    X = sliding_windows(values[:-1], seq_length)
+    y = values[seq_length:] if target_column is None else values[seq_length:, target_column]
+    return X, y
+
+
+class WindowDataset:
+    """Map-style dataset over next-step windows (works with torch.utils.data.DataLoader).
+
+    Only the base series is held in memory; each item is sliced on demand. start/stop
+    select a range of window indices, e.g. for a chronological train/test split.
+    """
+
+    def __init__(self, values, seq_length, target_column=0, start=0, stop=None, dtype=np.float32):
+        self.X, self.y = make_sequences(np.asarray(values, dtype=dtype), seq_length, target_column)
+        self.start = start
+        self.stop = len(self.y) if stop is None else min(stop, len(self.y))
+
+    def __len__(self):
+        return max(self.stop - self.start, 0)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        index += self.start
+        return np.array(self.X[index]), np.array(self.y[index])
+
+
+def tf_dataset(values, seq_length, batch_size=32, target_column=0, start=0, stop=None,
+               shuffle=False, seed=None, cache=False):
+    """tf.data pipeline that gathers next-step windows lazily, one batch at a time.
+
+    cache=True keeps the gathered batches after the first pass (only for unshuffled data, e.g. validation).
+    """
+    import tensorflow as tf
+
+    values = np.asarray(values, dtype=np.float32)
+    if values.ndim == 1:
+        values = values[:, None]
+    n_windows = len(values) - seq_length
+    stop = n_windows if stop is None else min(stop, n_windows)
+
+    series = tf.constant(values)
+    offsets = tf.range(seq_length, dtype=tf.int64)
+
+    def gather_batch(indices):
+        X = tf.gather(series, indices[:, None] + offsets[None, :])
+        target_rows = tf.gather(series, indices + seq_length)
+        y = target_rows if target_column is None else target_rows[:, target_column]
+        return X, y
+
+    dataset = tf.data.Dataset.range(start, stop)
+    if shuffle:
+        dataset = dataset.shuffle(stop - start, seed=seed, reshuffle_each_iteration=True)
+    dataset = dataset.batch(batch_size).map(gather_batch, num_parallel_calls=tf.data.AUTOTUNE)
+    if cache:
+        if shuffle:
+            raise ValueError("cache=True would freeze the first epoch's shuffled batches.")
+        dataset = dataset.cache()
+    return dataset.prefetch(tf.data.AUTOTUNE)
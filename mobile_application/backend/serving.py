@@ -0,0 +1,376 @@
+import os
+import re
+import json
+import zlib
+import shutil
+import argparse
+import tempfile
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+import storage
+import market_data
+import model_registry
+import model_bundle
+from batch_predict import forecast_windows
+from model import model_path as default_model_path, sequence_length
+
+# Define paths
+base_dir = os.path.dirname(os.path.abspath(__file__))
+
+# 🗂️ Versioned models: <registry_dir>/<name>/v<N>/ holds model.<ext> and model.bundle.json (never modified)
+registry_dir = os.getenv("MODEL_REGISTRY_DIR", os.path.join(base_dir, "models", "registry"))
+config_name = "serving.json"  # Inside registry_dir: which versions serve traffic, and how much
+default_model = "default"  # model.py's LSTM_model_best (the artifact MODEL_RUNTIME selects)
+
+# 🔀 The live deployment; replaced as a whole, so a request keeps the one it started with
+_deployment = None
+_swap_lock = threading.Lock()  # Held while a new deployment loads
+_failed_mtime = None  # serving.json version that failed to load
+
+_model_id = re.compile(r"^(?P<name>[A-Za-z0-9_-]+)(@(?P<version>v\d+|latest))?$")
+
+
+# ====================== REGISTRY ======================
+
+def _version_dirs(name, registry=None):
+    """{version number: folder} of a model name, oldest first."""
+    root = os.path.join(registry or registry_dir, name)
+    if not os.path.isdir(root):
+        return {}
+    found = (re.fullmatch(r"v(\d+)", entry) for entry in os.listdir(root))
+    return dict(sorted((int(match.group(1)), os.path.join(root, match.group(0))) for match in found if match))
+
+
+def register(artifact_path, name=None, registry=None):
+    """Copies an artifact and its bundle manifest into the registry as the name's next version.
+
+    name defaults to the manifest's architecture. The version folder is staged and renamed into place,
+    so readers never see a partial one. Returns the new model id ("name@vN").
+    """
+    manifest = model_bundle.load_manifest(artifact_path)
+    if manifest is None:
+        raise ValueError(f"{artifact_path} has no bundle manifest; write one first (see model_bundle.py).")
+    name = name or manifest["model"]["architecture"]
+    if not re.fullmatch(r"[A-Za-z0-9_-]+", name) or name == default_model:
+        raise ValueError(f"Invalid model name {name!r}; use letters, digits, '_' and '-' (not '{default_model}').")
+
+    root = os.path.join(registry or registry_dir, name)
+    os.makedirs(root, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".staging-", dir=root)
+    target = os.path.join(staging, "model" + os.path.splitext(artifact_path)[1].lower())
+    shutil.copyfile(artifact_path, target)
+    manifest["model"] = {**manifest["model"], "artifact": os.path.basename(target), "registered_from": artifact_path,
+                         "registered_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+    storage.write_json(manifest, model_bundle.manifest_path(target))
+
+    while True:
+        version = max(_version_dirs(name, registry), default=0) + 1
+        try:
+            os.rename(staging, os.path.join(root, f"v{version}"))  # Fails if a concurrent register took it
+            break
+        except OSError:
+            if os.path.isdir(os.path.join(root, f"v{version}")):
+                continue
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+    print(f"[✔] Registered {name}@v{version} ({manifest['model']['architecture']}, {manifest['model']['framework']})")
+    return f"{name}@v{version}"
+
+
+def resolve(model_id, registry=None):
+    """(pinned model id, artifact path) for "name@vN", "name@latest", "name" (latest) or "default"."""
+    if model_id == default_model:
+        return default_model, default_model_path
+    match = _model_id.match(model_id)
+    if not match:
+        raise ValueError(f"Invalid model id {model_id!r}; expected name@vN, name@latest or name.")
+    name, version = match.group("name"), match.group("version")
+    versions = _version_dirs(name, registry)
+    number = max(versions, default=None) if version in (None, "latest") else int(version[1:])
+    if number not in versions:
+        raise KeyError(f"Unknown model {model_id!r}; registered: {', '.join(list_ids(registry)) or 'none'}.")
+    folder = versions[number]
+    artifacts = [entry for entry in os.listdir(folder) if entry.startswith("model.") and not entry.endswith(".json")]
+    return f"{name}@v{number}", os.path.join(folder, artifacts[0])
+
+
+def list_ids(registry=None):
+    """Every registered model id, by name then version."""
+    registry = registry or registry_dir
+    names = sorted(entry for entry in os.listdir(registry) if not entry.startswith(".")
+                   and os.path.isdir(os.path.join(registry, entry))) if os.path.isdir(registry) else []
+    return [f"{name}@v{version}" for name in names for version in _version_dirs(name, registry)]
+
+
+def versions(registry=None):
+    """Registry contents: id, architecture, framework, training data range and metrics of every version."""
+    rows = []
+    for model_id in list_ids(registry):
+        manifest = model_bundle.load_manifest(resolve(model_id, registry)[1])
+        rows.append({"id": model_id, **{key: manifest["model"].get(key) for key in
+                                        ("architecture", "framework", "registered_at")},
+                     "window": manifest["preprocessing"]["window"],
+                     "features": manifest["preprocessing"]["features"],
+                     "training_data": manifest.get("training_data"), "metrics": manifest.get("metrics")})
+    return rows
+
+
+# ====================== DEPLOYMENT ======================
+
+class Deployment:
+    """An immutable routing table with every model it names loaded and warmed up.
+
+    primary serves whatever the candidates don't take; candidates serve a share of traffic each;
+    shadows predict alongside recorded (live) forecasts but are never served.
+    """
+
+    def __init__(self, config, models, mtime=None):
+        self.config = config
+        self.models = models  # model id → (model, preprocessor, artifact path)
+        self.mtime = mtime  # serving.json's mtime when it was read (None: no serving.json)
+        self.primary = config["primary"]
+        self.candidates = config.get("candidates", {})
+        self.shadows = config.get("shadows", [])
+        # Cumulative traffic shares: a key's hash in [0, 1) falls into one model's interval
+        self._bounds = np.cumsum(list(self.candidates.values()))
+        self._routes = list(self.candidates) + [self.primary]
+
+    def route(self, keys):
+        """The model id serving each routing key; a key always maps to the same model."""
+        buckets = np.array([zlib.crc32(str(key).encode()) / 2 ** 32 for key in keys])
+        return np.array(self._routes, dtype=object)[np.searchsorted(self._bounds, buckets, side="right")]
+
+    def describe(self):
+        """The routing table with each model's artifact hash."""
+        hashes = {model_id: (model_registry.model_info(path) or {}).get("hash")
+                  for model_id, (_, _, path) in self.models.items()}
+        return {**self.config, "models": hashes}
+
+
+def _validate(config, registry=None):
+    """Pins every id in a deployment config to its version and checks the traffic shares."""
+    primary = resolve(config["primary"], registry)[0]
+    candidates = {resolve(model_id, registry)[0]: float(share)
+                  for model_id, share in config.get("candidates", {}).items()}
+    shadows = [resolve(model_id, registry)[0] for model_id in config.get("shadows", [])]
+    if any(share <= 0 for share in candidates.values()) or sum(candidates.values()) >= 1:
+        raise ValueError("Candidate traffic shares must be positive and leave the primary some traffic (sum < 1).")
+    named = [primary, *candidates, *shadows]
+    if len(set(named)) != len(named):
+        raise ValueError("A model can only have one role (primary, candidate or shadow).")
+    return {"primary": primary, "candidates": candidates, "shadows": shadows}
+
+
+def _load(config, registry=None):
+    """Loads and warms every model of a config (one dummy batch each, so the first request is not a cold call)."""
+    models = {}
+    for model_id in [config["primary"], *config["candidates"], *config["shadows"]]:
+        path = resolve(model_id, registry)[1]
+        model = model_registry.get_model(path)
+        preprocessor = model_bundle.get_preprocessor(path)
+        if preprocessor.window > sequence_length:
+            raise ValueError(f"{model_id} needs {preprocessor.window} closes; the API serves {sequence_length}.")
+        model.predict_on_batch(np.zeros((1, preprocessor.window, len(preprocessor.features)), dtype=np.float32))
+        models[model_id] = (model, preprocessor, path)
+    return models
+
+
+def _config_mtime(registry=None):
+    try:
+        return os.stat(os.path.join(registry or registry_dir, config_name)).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _build(registry=None):
+    """A deployment from serving.json; without one, the default model serves everything."""
+    mtime = _config_mtime(registry)
+    config = {"primary": default_model}
+    if mtime is not None:
+        with open(os.path.join(registry or registry_dir, config_name)) as file:
+            config = json.load(file)
+    config = {**_validate(config, registry), "deployed_at": config.get("deployed_at")}
+    return Deployment(config, _load(config, registry), mtime)
+
+
+def _swap(deployment):
+    """Publishes a deployment and drops models only the previous one used (in-flight requests keep theirs)."""
+    global _deployment
+    previous, _deployment = _deployment, deployment
+    if previous is not None:
+        kept = {path for _, _, path in deployment.models.values()}
+        for _, _, path in previous.models.values():
+            if path not in kept:
+                model_registry.evict(path)
+        print(f"[✔] Swapped deployment: {describe_routes(deployment.config)}")
+    return deployment
+
+
+def _reload(registry, mtime):
+    """Background swap to the current serving.json; runs holding _swap_lock and releases it."""
+    global _failed_mtime
+    try:
+        _swap(_build(registry))
+    except Exception as e:
+        _failed_mtime = mtime  # Don't retry the same broken file on every request
+        print(f"⚠️ Keeping the current deployment; {config_name} could not be deployed: {e}")
+    finally:
+        _swap_lock.release()
+
+
+def current(registry=None):
+    """The live deployment, hot-swapped when serving.json changes.
+
+    A changed serving.json is loaded on a background thread while requests keep being served by the
+    deployment they got; only the very first call waits for its models to load.
+    """
+    deployment = _deployment
+    if deployment is None:
+        with _swap_lock:
+            if _deployment is None:
+                _swap(_build(registry))
+            return _deployment
+    mtime = _config_mtime(registry)
+    if mtime not in (deployment.mtime, _failed_mtime) and _swap_lock.acquire(blocking=False):
+        if _deployment.mtime == mtime:  # Swapped while we were checking
+            _swap_lock.release()
+        else:
+            threading.Thread(target=_reload, args=(registry, mtime), daemon=True).start()
+    return deployment
+
+
+def deploy(primary, candidates=None, shadows=None, registry=None):
+    """Loads and warms the new deployment, then publishes it in serving.json and swaps this process.
+
+    Requests keep the previous deployment until the swap; other workers swap on their next request.
+    A deployment whose models fail to load is never written.
+    """
+    config = _validate({"primary": primary, "candidates": candidates or {}, "shadows": shadows or []}, registry)
+    config["deployed_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    with _swap_lock:
+        models = _load(config, registry)
+        path = os.path.join(registry or registry_dir, config_name)
+        storage.write_json(config, path)
+        return _swap(Deployment(config, models, os.stat(path).st_mtime_ns))
+
+
+def describe_routes(config):
+    """One line: primary and candidates with their traffic shares, then shadows."""
+    shares = ", ".join(f"{model_id} {share:.0%}" for model_id, share in config["candidates"].items())
+    primary_share = 1 - sum(config["candidates"].values())
+    return (f"{config['primary']} {primary_share:.0%}" + (f", {shares}" if shares else "")
+            + (f"; shadows {', '.join(config['shadows'])}" if config["shadows"] else ""))
+
+
+# ====================== ROUTED FORECASTS ======================
+
+def forecast(windows, horizon=1, symbols=None, dates=None, record=False, registry=None):
+    """Forecasts every window with the model its (symbol, first forecast date) routes to.
+
+    One batched forecast_windows call per serving model, on the last `window` closes that model
+    was trained with. With record=True (live forecasts) the
+    shadows also forecast every window, and each model's first-step prices are stored in the
+    symbol's model_predictions table for live_error(). Returns (prices (n, horizon), model id per window).
+    """
+    if record and (dates is None or any(date is None for date in dates)):
+        raise ValueError("Recorded forecasts need the forecast date of every window.")
+    deployment = current(registry)
+    windows = np.asarray(windows, dtype=np.float64)
+    symbols = list(symbols) if symbols is not None else [market_data.symbol] * len(windows)
+    dates = [pd.Timestamp(date).strftime('%Y-%m-%d') if date is not None else None
+             for date in (dates if dates is not None else [None] * len(windows))]
+    served = deployment.route([f"{symbol}:{date}" for symbol, date in zip(symbols, dates)])
+
+    prices = np.empty((len(windows), horizon))
+    for model_id in dict.fromkeys(served):
+        rows = np.flatnonzero(served == model_id)
+        model, preprocessor, _ = deployment.models[model_id]
+        prices[rows] = forecast_windows(windows[rows, -preprocessor.window:], horizon, model,
+                                        [symbols[row] for row in rows], preprocessor)
+
+    if record:
+        predicted = {model_id: prices[served == model_id, 0] for model_id in dict.fromkeys(served)}
+        for model_id in deployment.shadows:
+            model, preprocessor, _ = deployment.models[model_id]
+            predicted[model_id] = forecast_windows(windows[:, -preprocessor.window:], 1, model, symbols,
+                                                   preprocessor)[:, 0]
+        _record(deployment, symbols, dates, served, predicted)
+    return prices, served
+
+
+def _record(deployment, symbols, dates, served, predicted):
+    """Upserts each model's prediction per (symbol, date) into the symbol's model_predictions table."""
+    rows = []
+    for model_id, prices in predicted.items():
+        role = "shadow" if model_id in deployment.shadows else (
+            "primary" if model_id == deployment.primary else "candidate")
+        indices = np.flatnonzero(served == model_id) if role != "shadow" else np.arange(len(symbols))
+        rows.extend({"Symbol": symbols[index], "Date": dates[index], "Model": model_id, "Role": role,
+                     "Predicted_Price": float(price)} for index, price in zip(indices, prices))
+    frame = pd.DataFrame(rows)
+    for symbol, group in frame.groupby("Symbol"):
+        storage.upsert("model_predictions", group.drop(columns="Symbol"), root=market_data.symbol_root(symbol))
+
+
+def served_by(date, symbol=None):
+    """The model id whose forecast was served for symbol (default: the index) on date, or None."""
+    frame = storage.read("model_predictions", start=date, end=date,
+                         root=market_data.symbol_root(symbol or market_data.symbol))
+    served = frame[frame["Role"] != "shadow"]["Model"]
+    return served.iloc[-1] if len(served) else None
+
+
+def live_error(symbol=None):
+    """MAE of each model's recorded forecasts against the closes that followed, best first."""
+    root = market_data.symbol_root(symbol or market_data.symbol)
+    recorded = storage.read("model_predictions", root=root)
+    closes = storage.read("stocks", columns=["Date", "Close"], root=root)
+    merged = recorded.merge(closes, on="Date")
+    merged["Error"] = (merged["Predicted_Price"] - merged["Close"]).abs()
+    summary = merged.groupby("Model").agg(days=("Error", "size"), mae=("Error", "mean"),
+                                          served_days=("Role", lambda roles: int((roles != "shadow").sum())))
+    return [{"Model": model_id, "Days": int(row.days), "Served_Days": int(row.served_days), "MAE": float(row.mae)}
+            for model_id, row in summary.sort_values("mae").iterrows()]
+
+
+# Run as a script:
+#   python serving.py register models/sweep_best.keras [--name rnn]
+#   python serving.py deploy lstm@v2 --candidate rnn@v1=0.1 --shadow transformer
+#   python serving.py status
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Versioned model registry and live deployment.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    register_parser = commands.add_parser("register", help="Add an artifact and its manifest as a new version")
+    register_parser.add_argument("artifact")
+    register_parser.add_argument("--name", help="Model name (default: its architecture)")
+    deploy_parser = commands.add_parser("deploy", help="Choose the primary, candidates and shadows")
+    deploy_parser.add_argument("primary", help="name@vN, name (latest version) or 'default'")
+    deploy_parser.add_argument("--candidate", action="append", default=[], metavar="ID=SHARE",
+                               help="Serve a share of traffic from another model, e.g. rnn@v1=0.1")
+    deploy_parser.add_argument("--shadow", action="append", default=[], metavar="ID",
+                               help="Record this model's live forecasts without serving them")
+    status_parser = commands.add_parser("status", help="Registry, deployment and live error per model")
+    status_parser.add_argument("--symbol", help="Live error for a constituent instead of the index")
+    args = parser.parse_args()
+
+    if args.command == "register":
+        register(args.artifact, args.name)
+    elif args.command == "deploy":
+        candidates = {}
+        for value in args.candidate:
+            model_id, _, share = value.partition("=")
+            if not share:
+                parser.error(f"--candidate needs ID=SHARE, got '{value}'")
+            candidates[model_id] = float(share)
+        print(f"[✔] Deployed: {describe_routes(deploy(args.primary, candidates, args.shadow).config)}")
+    else:
+        for row in versions():
+            print(f"{row['id']:>20}  {row['architecture']:<12} {row['framework']:<6} window {row['window']:<4} "
+                  f"{row['registered_at']}")
+        print(f"deployment: {describe_routes(current().config)}")
+        for row in live_error(args.symbol):
+            print(f"{row['Model']:>20}  {row['Days']:>4} days ({row['Served_Days']} served)  MAE {row['MAE']:.2f}")
@@ -0,0 +1,358 @@
+import os
+import sys
+import glob
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl  # Cross-process write locks (POSIX)
+except ImportError:  # Windows: writers are still serialized within a process
+    fcntl = None
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# 📂 Define paths
+base_dir = os.path.dirname(os.path.abspath(__file__))
+data_dir = os.path.join(base_dir, "data")
+store_dir = os.path.join(data_dir, "store")  # One folder per table, one Parquet file per year
+
+# 🗂️ Tables: typed schema, upsert key, date column used for partitioning and the CSV it replaces
+TABLES = {
+    "stocks": {
+        "schema": pa.schema([
+            ("Date", pa.date32()), ("Close", pa.float64()), ("High", pa.float64()),
+            ("Low", pa.float64()), ("Open", pa.float64()), ("Volume", pa.int64()),
+        ]),
+        "key": ["Date"],
+        "date_column": "Date",
+        "csv": "stocks_data.csv",
+    },
+    "predictions": {
+        "schema": pa.schema([("Date", pa.date32()), ("Predicted_Price", pa.float64())]),
+        "key": ["Date"],
+        "date_column": "Date",
+        "csv": "predicted_prices.csv",
+    },
+    "fgi": {
+        "schema": pa.schema([
+            ("Date", pa.date32()), ("Close", pa.float64()), ("High", pa.float64()), ("Low", pa.float64()),
+            ("Open", pa.float64()), ("Volume", pa.float64()), ("SMA_50", pa.float64()),
+            ("SMA_200", pa.float64()), ("EMA_50", pa.float64()), ("EMA_200", pa.float64()),
+            ("High-Low", pa.int64()), ("High-Close", pa.int64()), ("Low-Close", pa.int64()),
+            ("True_Range", pa.float64()), ("ATR_14", pa.float64()), ("RSI_14", pa.float64()),
+            ("Interest_Rate", pa.float64()), ("FGI_Score", pa.int64()), ("FGI_Normalized", pa.float64()),
+            ("Market_Sentiment", pa.string()),
+        ]),
+        "key": ["Date"],
+        "date_column": "Date",
+        "csv": "fgi_data_with_fgi.csv",
+    },
+    "recommendations": {
+        "schema": pa.schema([
+            ("Date", pa.date32()), ("Today_Close", pa.float64()), ("Predicted_Close", pa.float64()),
+            ("Market_Sentiment", pa.string()), ("FGI_Score", pa.float64()), ("FGI_Sentiment", pa.string()),
+            ("Recommendation", pa.string()),
+        ]),
+        "key": ["Date"],
+        "date_column": "Date",
+        "csv": "recommendations.csv",
+    },
+    "market_sentiment": {
+        "schema": pa.schema([
+            ("Date", pa.date32()), ("Overall_Sentiment", pa.string()), ("Sentiment_Score", pa.float64()),
+            ("Weighted_Score", pa.float64()),  # NaN for the rows migrated from the CSV, which lacks it
+            ("Negative_Count", pa.int64()), ("Neutral_Count", pa.int64()), ("Positive_Count", pa.int64()),
+        ]),
+        "key": ["Date"],
+        "date_column": "Date",
+        "csv": "market_sentiment.csv",
+    },
+    "news_sentiment": {
+        "schema": pa.schema([
+            ("title", pa.string()), ("source", pa.string()), ("publishedAt", pa.string()),
+            ("description", pa.string()), ("url", pa.string()), ("text", pa.string()),
+            ("Sentiment", pa.string()), ("Sentiment_Score", pa.float64()),
+        ]),
+        "key": ["url"],
+        "date_column": "publishedAt",  # ISO-8601 string, kept as NewsAPI returns it
+        "csv": "news_sentiment_results.csv",
+    },
+    "model_predictions": {  # Every deployed model's live forecast per day (see serving.py)
+        "schema": pa.schema([
+            ("Date", pa.date32()), ("Model", pa.string()), ("Role", pa.string()), ("Predicted_Price", pa.float64()),
+        ]),
+        "key": ["Date", "Model"],
+        "date_column": "Date",
+        "csv": None,
+    },
+}
+
+
+# 🔒 Per-table write locks: a reentrant lock per table folder, plus an flock on <table>/.lock held by its owner
+_locks = {}
+_locks_guard = threading.Lock()
+_held = threading.local()  # Table folders this thread has flocked, with their nesting depth
+
+# ====================== HELPERS ======================
+
+def _table_dir(name, root=None):
+    if name not in TABLES:
+        raise KeyError(f"Unknown table '{name}'. Known tables: {', '.join(TABLES)}")
+    return os.path.join(root or store_dir, name)
+
+
+def _partition_paths(name, root=None):
+    """Returns {year: path} for the table's partitions, oldest first."""
+    paths = glob.glob(os.path.join(_table_dir(name, root), "*.parquet"))
+    return dict(sorted((int(os.path.splitext(os.path.basename(path))[0]), path) for path in paths))
+
+
+def _dates(frame, name):
+    """The table's date column as naive UTC timestamps (dates and ISO-8601 strings alike)."""
+    dates = pd.to_datetime(frame[TABLES[name]["date_column"]], format="ISO8601", utc=True)
+    return dates.dt.tz_localize(None)
+
+
+def _years(frame, name):
+    return _dates(frame, name).dt.year.to_numpy()
+
+
+def _conform(name, data):
+    """Returns data as an Arrow table with exactly the table's schema (extra columns are dropped)."""
+    schema = TABLES[name]["schema"]
+    frame = pd.DataFrame(data).reset_index(drop=True)
+    columns = {}
+    for field in schema:
+        column = frame[field.name] if field.name in frame else pd.Series([None] * len(frame), dtype=object)
+        if pa.types.is_date32(field.type):
+            column = pd.to_datetime(column).to_numpy().astype("datetime64[D]")
+        columns[field.name] = column
+    return pa.Table.from_pandas(pd.DataFrame(columns), schema=schema, preserve_index=False)
+
+
+def _sorted_unique(name, frame):
+    """Keeps the last row per key, ordered by the date column."""
+    spec = TABLES[name]
+    frame = frame.drop_duplicates(subset=spec["key"], keep="last")
+    return frame.sort_values(by=spec["date_column"], kind="stable").reset_index(drop=True)
+
+
+def _tmp_path(path):
+    """A temporary path next to path, unique per process and thread so concurrent writers don't collide."""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _write_partition(path, table):
+    """Writes one partition atomically so readers never see a half-written file."""
+    tmp_path = _tmp_path(path)
+    try:
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@contextmanager
+def _table_lock(name, root=None):
+    """Holds the table's write lock across threads and processes (reentrant within a thread).
+
+    Every read-merge-write of a table's partitions runs under it, so concurrent upserts can't drop rows.
+    """
+    table_dir = _table_dir(name, root)
+    os.makedirs(table_dir, exist_ok=True)
+    with _locks_guard:
+        lock = _locks.setdefault(table_dir, threading.RLock())
+    with lock:
+        depths = _held.__dict__.setdefault("depths", {})
+        if depths.get(table_dir):
+            depths[table_dir] += 1
+            try:
+                yield
+            finally:
+                depths[table_dir] -= 1
+            return
+        with open(os.path.join(table_dir, ".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            depths[table_dir] = 1
+            try:
+                yield
+            finally:
+                depths[table_dir] = 0
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _to_frame(table):
+    return table.to_pandas(date_as_object=False)
+
+
+def _ensure(name, root=None):
+    """Migrates a table from its legacy CSV the first time it is used (main store only).
+
+    The CSVs hold Nifty 50 index data, so other roots (e.g. per-ticker stores) start empty.
+    """
+    if root is None and not exists(name):
+        migrate([name])
+
+
+# ====================== READ ======================
+
+def exists(name, root=None):
+    """True once the table has been created (even if it is empty)."""
+    return os.path.isdir(_table_dir(name, root))
+
+
+def signature(name, root=None):
+    """(path, mtime, size) of every partition file; it changes whenever the table is written."""
+    files = []
+    for path in _partition_paths(name, root).values():
+        try:
+            stat = os.stat(path)
+        except OSError:  # Partition removed by a concurrent write()
+            continue
+        files.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(files)
+
+
+def read(name, start=None, end=None, columns=None, root=None):
+    """Reads a table (optionally only the years overlapping [start, end]) as a DataFrame sorted by date.
+
+    Tables of the main store that were never written are migrated from their legacy CSV on first read.
+    """
+    _ensure(name, root)
+    spec = TABLES[name]
+    paths = _partition_paths(name, root)
+    first_year = pd.Timestamp(start).year if start is not None else None
+    last_year = pd.Timestamp(end).year if end is not None else None
+    selected = [path for year, path in paths.items()
+                if (first_year is None or year >= first_year) and (last_year is None or year <= last_year)]
+    if not selected:
+        return _to_frame(spec["schema"].empty_table()).loc[:, columns or slice(None)]
+
+    read_columns = columns if columns is None or spec["date_column"] in columns else columns + [spec["date_column"]]
+    frame = _to_frame(pa.concat_tables([pq.read_table(path, columns=read_columns) for path in selected]))
+    if start is not None or end is not None:
+        dates = _dates(frame, name)
+        if start is not None:
+            frame = frame[dates >= pd.Timestamp(start)]
+        if end is not None:
+            frame = frame[dates <= pd.Timestamp(end)]
+    return frame.loc[:, columns or slice(None)].reset_index(drop=True)
+
+
+def tail(name, n=1, columns=None, root=None):
+    """Returns the n most recent rows, reading only the newest partitions."""
+    _ensure(name, root)
+    tables, rows = [], 0
+    for path in reversed(list(_partition_paths(name, root).values())):
+        table = pq.read_table(path, columns=columns)
+        tables.insert(0, table)
+        rows += table.num_rows
+        if rows >= n:
+            break
+    if not tables:
+        return _to_frame(TABLES[name]["schema"].empty_table()).loc[:, columns or slice(None)]
+    return _to_frame(pa.concat_tables(tables)).tail(n).reset_index(drop=True)
+
+
+# ====================== WRITE ======================
+
+def upsert(name, data, root=None):
+    """Inserts rows, replacing existing rows with the same key; only the touched years are rewritten."""
+    _ensure(name, root)
+    table = _conform(name, data)
+    if table.num_rows == 0:
+        return
+    table_dir = _table_dir(name, root)
+
+    frame = _to_frame(table)
+    years = _years(frame, name)
+    with _table_lock(name, root):
+        paths = _partition_paths(name, root)
+        for year in sorted(set(years)):
+            rows = frame[years == year]
+            if year in paths:
+                rows = pd.concat([_to_frame(pq.read_table(paths[year])), rows], ignore_index=True)
+            merged = _conform(name, _sorted_unique(name, rows))
+            _write_partition(os.path.join(table_dir, f"{year}.parquet"), merged)
+
+
+def write(name, data, root=None):
+    """Replaces the whole table with data."""
+    table_dir = _table_dir(name, root)
+
+    frame = _sorted_unique(name, _to_frame(_conform(name, data)))
+    years = _years(frame, name) if len(frame) else []
+    with _table_lock(name, root):
+        stale = _partition_paths(name, root)
+        for year in sorted(set(years)):
+            _write_partition(os.path.join(table_dir, f"{year}.parquet"), _conform(name, frame[years == year]))
+            stale.pop(year, None)
+        for path in stale.values():
+            os.remove(path)
+
+
+def write_csv(frame, path, **to_csv_args):
+    """Writes a DataFrame to a CSV atomically, creating its folder if needed."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = _tmp_path(path)
+    try:
+        frame.to_csv(tmp_path, index=False, **to_csv_args)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def write_json(record, path, exclusive=False):
+    """Writes a JSON document atomically; with exclusive=True it fails if path already exists."""
+    import json
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = _tmp_path(path)
+    with open(tmp_path, "w") as file:
+        json.dump(record, file)
+    try:
+        if exclusive:
+            os.link(tmp_path, path)  # Atomic create-if-absent (raises FileExistsError)
+        else:
+            os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# ====================== MIGRATION ======================
+
+def migrate(names=None, root=None, csv_dir=None, force=False):
+    """One-shot import of the legacy CSV files into the store.
+
+    Tables that already exist are left alone unless force=True; tables without a CSV are skipped.
+    """
+    for name in names or TABLES:
+        if TABLES[name]["csv"] is None:
+            continue
+        csv_path = os.path.join(csv_dir or data_dir, TABLES[name]["csv"])
+        if not os.path.exists(csv_path) or (exists(name, root) and not force):
+            continue
+        with _table_lock(name, root):  # Another thread or worker may be migrating the same table
+            if _partition_paths(name, root) and not force:
+                continue
+            write(name, pd.read_csv(csv_path), root)
+        print(f"[✔] Migrated {TABLES[name]['csv']} → '{name}' table")
+
+
+# Run as a script: migrate the CSVs (--force overwrites existing tables), then print a summary of each table
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["migrate"]:
+        names = [arg for arg in sys.argv[2:] if arg != "--force"]
+        migrate(names or None, force="--force" in sys.argv)
+    for name in TABLES:
+        if exists(name):
+            frame = read(name)
+            date_column = TABLES[name]["date_column"]
+            print(f"{name:>16}: {len(frame):>7} rows, {frame[date_column].min()} → {frame[date_column].max()}")
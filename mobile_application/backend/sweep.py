@@ -0,0 +1,359 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import hashlib
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+import storage
+from model_bundle import write_manifest, index_symbol
+from architectures import families, artifact_suffix, build_model, save_model
+from indicators import sma, rsi
+from sequences import make_sequences
+
+# Define paths
+base_dir = os.path.dirname(os.path.abspath(__file__))
+repo_dir = os.path.dirname(os.path.dirname(base_dir))
+data_path = os.path.join(repo_dir, "data", "Nifty50_Train.csv")  # The LSTM notebook's training data
+models_dir = os.path.join(base_dir, "models")
+cache_dir = os.path.join(base_dir, "data", "training_cache")  # Prepared datasets, shared by every trial
+runs_dir = os.path.join(models_dir, "sweeps")  # One folder of trial artifacts per sweep
+
+validation_fraction = 0.2  # Last 20% of the windows, chronologically (as in the notebooks)
+
+# 📊 Input feature sets used by the notebooks ('Close' is always first: it is the target)
+feature_sets = {
+    "close": ["Close"],  # LSTM_model.ipynb, Transformer_model.ipynb
+    "sma_rsi": ["Close", "SMA_10", "RSI_14"],  # RNN_model.ipynb
+    "bollinger": ["Close", "Upper_Band", "Lower_Band", "ATR"],  # LSTM + Transformer_model.ipynb
+}
+
+# 🔍 Default search space; each trial picks one value per key
+search_space = {
+    "architecture": ["lstm", "rnn", "transformer", "hybrid"],
+    "features": ["close"],
+    "window": [30, 60],
+    "units": [64, 128, 256],
+    "dropout": [0.02, 0.1, 0.2],
+    "learning_rate": [1e-3, 5e-4, 1e-4],
+    "batch_size": [8, 32, 64],
+}
+
+
+# ====================== DATASETS ======================
+
+def add_features(frame):
+    """Adds every column a feature set can ask for."""
+    close = frame['Close']
+    frame['SMA_10'] = sma(close, 10)
+    frame['RSI_14'] = rsi(close, 14)
+    frame['SMA_20'] = sma(close, 20)
+    frame['Upper_Band'] = frame['SMA_20'] + close.rolling(window=20).std() * 2
+    frame['Lower_Band'] = frame['SMA_20'] - close.rolling(window=20).std() * 2
+    frame['ATR'] = frame['High'] - frame['Low']
+    return frame
+
+
+def prepare_dataset(features, window, path=data_path, root=None):
+    """Scales a feature set once and caches it as .npy plus a .json description; returns the description.
+
+    The scaler (min/max per column) is fit on the rows the training windows see, so validation data
+    does not leak into it. Trials memory-map the cached array, so all of them share one copy.
+    Cached under root (default: cache_dir).
+    """
+    root = root or cache_dir
+    stat = os.stat(path)
+    key = hashlib.sha1(json.dumps([os.path.abspath(path), stat.st_mtime_ns, stat.st_size, features, window,
+                                   validation_fraction]).encode()).hexdigest()[:16]
+    meta_path = os.path.join(root, f"{features}-w{window}-{key}.json")
+    if os.path.exists(meta_path):
+        with open(meta_path) as file:
+            return json.load(file)
+
+    columns = feature_sets[features]
+    frame = add_features(pd.read_csv(path)).dropna(subset=columns).reset_index(drop=True)
+    values = frame[columns].to_numpy(dtype=np.float64)
+    n_windows = len(values) - window
+    split = n_windows - int(np.ceil(validation_fraction * n_windows))
+    fitted = values[:split + window]
+    minimum, maximum = fitted.min(axis=0), fitted.max(axis=0)
+    scaled = ((values - minimum) / (maximum - minimum)).astype(np.float32)
+
+    array_path = meta_path[:-5] + ".npy"
+    os.makedirs(root, exist_ok=True)
+    with open(array_path + ".tmp", "wb") as file:
+        np.save(file, scaled)
+    os.replace(array_path + ".tmp", array_path)
+    meta = {
+        "features": features, "columns": columns, "window": window, "array": array_path,
+        "source": os.path.relpath(path, repo_dir), "rows": len(values), "split": split,
+        "start_date": str(frame['Date'].iloc[0]), "end_date": str(frame['Date'].iloc[-1]),
+        "train_end_date": str(frame['Date'].iloc[split + window - 1]),
+        "scaler_min": minimum.tolist(), "scaler_max": maximum.tolist(),
+    }
+    storage.write_json(meta, meta_path)
+    return meta
+
+
+def load_dataset(meta):
+    """(X_train, y_train, X_val, y_val) views over the memory-mapped cached array."""
+    values = np.load(meta["array"], mmap_mode="r")
+    X, y = make_sequences(values, meta["window"])
+    split = meta["split"]
+    return X[:split], y[:split], X[split:], y[split:]
+
+
+# ====================== TRIALS ======================
+
+def sample_trials(space, trials, seed=0):
+    """Every combination of the space if trials covers it, otherwise `trials` distinct random ones."""
+    keys = list(space)
+    grid = [dict(zip(keys, values)) for values in itertools.product(*(space[key] for key in keys))]
+    if trials is None or trials >= len(grid):
+        return grid
+    return random.Random(seed).sample(grid, trials)
+
+
+def _pin(cores):
+    """Pins this trial's process to `cores` and sizes its thread pools to match (before TF/PyTorch load)."""
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    # Read by TensorFlow, PyTorch and the BLAS libraries when they are first imported in this process
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "TF_NUM_INTRAOP_THREADS"):
+        os.environ[name] = str(len(cores))
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+
+
+def should_prune(progress, trial_id, epoch, best, warmup):
+    """Median rule: stop a trial whose best validation loss so far is worse than the median of the
+    other trials' best at the same epoch (after `warmup` epochs, once at least two others got there)."""
+    if epoch + 1 < warmup:
+        return False
+    others = [min(curve[:epoch + 1]) for other, curve in progress.items() if other != trial_id and len(curve) > epoch]
+    return len(others) >= 2 and best > np.median(others)
+
+
+def _train_keras(model, data, params, settings, report):
+    from tensorflow import keras
+
+    X_train, y_train, X_val, y_val = data
+
+    class Report(keras.callbacks.Callback):
+        def on_epoch_end(self, epoch, logs=None):
+            if report(epoch, float(logs["val_loss"])):
+                self.model.stop_training = True
+
+    early_stopping = keras.callbacks.EarlyStopping(monitor="val_loss", patience=settings["patience"],
+                                                   restore_best_weights=True)
+    model.fit(np.asarray(X_train), np.asarray(y_train), epochs=settings["epochs"], batch_size=params["batch_size"],
+              validation_data=(np.asarray(X_val), np.asarray(y_val)), callbacks=[Report(), early_stopping], verbose=0)
+    return model
+
+
+def _train_torch(model, data, params, settings, report):
+    import copy
+    import torch
+
+    X_train, y_train, X_val, y_val = (torch.from_numpy(np.array(part, dtype=np.float32)) for part in data)
+    y_train, y_val = y_train.reshape(-1, 1), y_val.reshape(-1, 1)
+    optimizer = torch.optim.Adam(model.parameters(), lr=params["learning_rate"])
+    criterion = torch.nn.MSELoss()
+    best, best_state, stale = np.inf, None, 0
+    for epoch in range(settings["epochs"]):
+        model.train()
+        for batch in torch.randperm(len(X_train)).split(params["batch_size"]):
+            optimizer.zero_grad()
+            loss = criterion(model(X_train[batch]), y_train[batch])
+            loss.backward()
+            optimizer.step()
+
+        model.eval()
+        with torch.no_grad():
+            val_loss = criterion(model(X_val), y_val).item()
+        if val_loss < best:
+            best, best_state, stale = val_loss, copy.deepcopy(model.state_dict()), 0
+        else:
+            stale += 1
+        if report(epoch, val_loss) or stale >= settings["patience"]:
+            break
+    model.load_state_dict(best_state)
+    return model.eval()
+
+
+def run_trial(trial_id, params, meta, progress, slots, settings):
+    """Trains one configuration in a fresh pool process and returns its leaderboard row.
+
+    The trial takes a set of cores from `slots` for its lifetime, and publishes its validation loss to
+    `progress` after every epoch so trials can prune each other.
+    """
+    start = time.perf_counter()
+    cores = slots.get()
+    _pin(cores)
+    row = {"trial": trial_id, **params, "status": "complete", "epochs": 0, "val_loss": np.nan, "val_mae": np.nan}
+    curve = []
+
+    def report(epoch, val_loss):
+        curve.append(val_loss)
+        progress[trial_id] = list(curve)
+        if epoch + 1 < settings["epochs"] and should_prune(progress, trial_id, epoch, min(curve),
+                                                           settings["prune_warmup"]):
+            row["status"] = "pruned"
+            return True
+        return False
+
+    try:
+        seed = settings["seed"] + trial_id
+        random.seed(seed)
+        np.random.seed(seed)
+        if families[params["architecture"]] == "torch":
+            import torch
+            torch.manual_seed(seed)
+            torch.set_num_threads(settings["threads"])
+            train = _train_torch
+        else:
+            from tensorflow import keras
+            keras.utils.set_random_seed(seed)
+            train = _train_keras
+
+        data = load_dataset(meta)
+        model = build_model(params, meta["window"], len(meta["columns"]))
+        model = train(model, data, params, settings, report)
+
+        # ✅ Scored the same way for every family: MSE on the scaled target, MAE in index points
+        predictions = model.predict_on_batch(np.asarray(data[2])).reshape(-1)
+        errors = predictions - np.asarray(data[3])
+        price_range = meta["scaler_max"][0] - meta["scaler_min"][0]
+        row.update(epochs=len(curve), val_loss=float(np.mean(errors ** 2)),
+                   val_mae=float(np.mean(np.abs(errors)) * price_range))
+
+        artifact = os.path.join(settings["run_dir"], f"trial-{trial_id:03d}{artifact_suffix[families[params['architecture']]]}")
+        save_model(model, params["architecture"], artifact)
+        row["artifact"] = artifact
+    except Exception as e:
+        row.update(status="failed", error=f"{type(e).__name__}: {e}")
+    finally:
+        slots.put(cores)
+    row["seconds"] = round(time.perf_counter() - start, 2)
+    return row
+
+
+# ====================== SWEEP ======================
+
+def _publish_best(row, meta, run_dir, output_dir):
+    """Copies the winning artifact to output_dir/sweep_best.<ext> with its bundle manifest next to it."""
+    suffix = os.path.splitext(row["artifact"])[1]
+    best_path = os.path.join(output_dir, "sweep_best" + suffix)
+    shutil.copyfile(row["artifact"], best_path + ".tmp")
+    os.replace(best_path + ".tmp", best_path)
+    for stale in set(artifact_suffix.values()) - {suffix}:  # A previous winner of another family
+        if os.path.exists(os.path.join(output_dir, "sweep_best" + stale)):
+            os.remove(os.path.join(output_dir, "sweep_best" + stale))
+
+    params = {key: row[key] for key in search_space if key in row}
+    training_data = {"symbol": index_symbol,
+                     **{key: meta[key] for key in ("source", "rows", "start_date", "end_date", "train_end_date")}}
+    write_manifest(best_path, meta["columns"], meta["window"], meta["scaler_min"], meta["scaler_max"], training_data,
+                   row["architecture"], families[row["architecture"]], params=params,
+                   metrics={"val_loss": row["val_loss"], "val_mae": row["val_mae"], "epochs": row["epochs"]},
+                   run=os.path.relpath(run_dir, base_dir))
+    return best_path
+
+
+def run_sweep(space=search_space, trials=16, workers=None, threads=1, epochs=30, patience=5, prune_warmup=3,
+              seed=0, path=data_path, output_dir=models_dir):
+    """Trains sampled configurations concurrently and returns the leaderboard (best first).
+
+    Up to `workers` trials (default: one per `threads` CPU cores) run at once, each pinned to its own cores.
+    The leaderboard is written to output_dir/sweep_leaderboard.csv and the best model to
+    output_dir/sweep_best.<keras|pt> with sweep_best.bundle.json describing it (see model_bundle.py).
+    """
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+    workers = workers or max(1, len(cpus) // threads)
+    combos = sample_trials(space, trials, seed)
+    datasets = {}
+    for params in combos:
+        if (params["features"], params["window"]) not in datasets:
+            datasets[params["features"], params["window"]] = prepare_dataset(params["features"], params["window"], path)
+
+    run_dir = os.path.join(runs_dir, time.strftime("%Y%m%d-%H%M%S"))
+    os.makedirs(run_dir, exist_ok=True)
+    settings = {"epochs": epochs, "patience": patience, "prune_warmup": prune_warmup, "seed": seed,
+                "threads": threads, "run_dir": run_dir}
+    print(f"[✔] Sweeping {len(combos)} trials on {workers} worker(s) × {threads} thread(s) → {run_dir}")
+
+    # One fresh interpreter per trial: thread settings apply before TF/PyTorch start, memory is returned
+    # after each trial, and TensorFlow and PyTorch never share a process (loading both can crash)
+    context = get_context("spawn")
+    rows = []
+    with context.Manager() as manager:
+        progress = manager.dict()
+        slots = manager.Queue()
+        for worker in range(workers):
+            slots.put({cpus[(worker * threads + i) % len(cpus)] for i in range(threads)})
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, max_tasks_per_child=1) as pool:
+            futures = [pool.submit(run_trial, trial_id, params, datasets[params["features"], params["window"]],
+                                   progress, slots, settings)
+                       for trial_id, params in enumerate(combos)]
+            for future in as_completed(futures):
+                row = future.result()
+                rows.append(row)
+                print(f"  trial {row['trial']:>3} {row['architecture']:<11} {row['status']:<8} "
+                      f"val_loss {row['val_loss']:.6f}  MAE {row['val_mae']:8.2f}  "
+                      f"{row['epochs']:>3} epochs  {row['seconds']:7.1f}s" + (f"  {row['error']}" if "error" in row else ""))
+
+    leaderboard = pd.DataFrame(rows)
+    leaderboard["finished"] = leaderboard["status"] == "complete"
+    leaderboard = leaderboard.sort_values(["finished", "val_loss"], ascending=[False, True]).drop(columns="finished")
+    leaderboard = leaderboard.reset_index(drop=True)
+    storage.write_csv(leaderboard, os.path.join(run_dir, "leaderboard.csv"))
+    storage.write_csv(leaderboard, os.path.join(output_dir, "sweep_leaderboard.csv"))
+
+    best = next(row for row in rows if row["trial"] == leaderboard["trial"].iloc[0])
+    if best["status"] == "complete":
+        best_path = _publish_best(best, datasets[best["features"], best["window"]], run_dir, output_dir)
+        print(f"[✔] Best: trial {best['trial']} ({best['architecture']}), val_loss {best['val_loss']:.6f}, "
+              f"MAE {best['val_mae']:.2f} → {best_path}")
+    else:
+        print("⚠️ No trial completed; nothing was published.")
+    return leaderboard
+
+
+def _load_space(value):
+    """--space accepts a JSON file or an inline JSON object; its keys replace the defaults."""
+    text = open(value).read() if os.path.exists(value) else value
+    overrides = json.loads(text)
+    unknown = set(overrides) - set(search_space)
+    if unknown:
+        raise ValueError(f"Unknown search space keys: {', '.join(sorted(unknown))}")
+    return {**search_space, **{key: value if isinstance(value, list) else [value] for key, value in overrides.items()}}
+
+
+# Run as a script: python sweep.py --trials 16 --epochs 30 --space '{"architecture": ["lstm", "rnn"]}'
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel hyperparameter sweep over the notebook models.")
+    parser.add_argument("--space", type=_load_space, default=search_space,
+                        help="JSON file or object overriding search space keys")
+    parser.add_argument("--trials", type=int, default=16, help="Random trials (0 = the whole grid)")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent trials (default: CPUs / threads)")
+    parser.add_argument("--threads", type=int, default=1, help="CPU cores per trial")
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--patience", type=int, default=5, help="Early-stopping patience (epochs)")
+    parser.add_argument("--prune-warmup", type=int, default=3, help="Epochs before a trial can be pruned")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data", default=data_path, help="Training CSV (Date, Open, High, Low, Close)")
+    args = parser.parse_args()
+
+    leaderboard = run_sweep(args.space, args.trials or None, args.workers, args.threads, args.epochs, args.patience,
+                            args.prune_warmup, args.seed, args.data)
+    columns = ["trial", *search_space, "status", "epochs", "val_loss", "val_mae", "seconds"]
+    print(leaderboard[columns].head(10).to_string(index=False))
+    sys.exit(0 if (leaderboard["status"] == "complete").any() else 1)
@@ -0,0 +1,198 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+import storage
+import market_data
+import market_sentiment
+import serving
+from batch_predict import forecast_windows
+from indicators import add_fgi_columns
+from model import sequence_length, prediction_margin
+from stock_recommendations import recommend
+from trading_calendar import next_session
+
+# 📈 Nifty 50 constituents (NSE composition as of March 2025), as Yahoo Finance tickers
+nifty50_symbols = [
+    "ADANIENT.NS", "ADANIPORTS.NS", "APOLLOHOSP.NS", "ASIANPAINT.NS", "AXISBANK.NS", "BAJAJ-AUTO.NS",
+    "BAJFINANCE.NS", "BAJAJFINSV.NS", "BEL.NS", "BPCL.NS", "BHARTIARTL.NS", "BRITANNIA.NS", "CIPLA.NS",
+    "COALINDIA.NS", "DRREDDY.NS", "EICHERMOT.NS", "GRASIM.NS", "HCLTECH.NS", "HDFCBANK.NS", "HDFCLIFE.NS",
+    "HEROMOTOCO.NS", "HINDALCO.NS", "HINDUNILVR.NS", "ICICIBANK.NS", "ITC.NS", "INDUSINDBK.NS", "INFY.NS",
+    "JSWSTEEL.NS", "KOTAKBANK.NS", "LT.NS", "M&M.NS", "MARUTI.NS", "NTPC.NS", "NESTLEIND.NS", "ONGC.NS",
+    "POWERGRID.NS", "RELIANCE.NS", "SBILIFE.NS", "SHRIRAMFIN.NS", "SBIN.NS", "SUNPHARMA.NS", "TCS.NS",
+    "TATACONSUM.NS", "TATAMOTORS.NS", "TATASTEEL.NS", "TECHM.NS", "TITAN.NS", "TRENT.NS", "ULTRACEMCO.NS",
+    "WIPRO.NS",
+]
+
+# ⚙️ Parallelism (override with environment variables)
+WORKERS = int(os.getenv("TICKER_WORKERS", 1))  # Most processes for indicators + writes (1 = in-process)
+SPAWN_SECONDS = float(os.getenv("TICKER_SPAWN_SECONDS", 2.0))  # Start-up of a spawned pool (its imports included)
+DOWNLOAD_WORKERS = int(os.getenv("TICKER_DOWNLOAD_WORKERS", 8))  # Concurrent Yahoo Finance downloads
+
+
+# ====================== PER-SYMBOL STEPS ======================
+
+def _download(symbol, timeout):
+    """Fetches and stores one symbol's new bars; returns the error message, if any."""
+    try:
+        market_data.save_bars(market_data.download_new_bars(timeout=timeout, ticker=symbol), ticker=symbol)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def finish_symbol(task):
+    """Stores one symbol's prediction, FGI and recommendation (runs in a worker process).
+
+    task is (symbol, store root, last fgi_window bars, predicted close, macro inputs, market sentiment).
+    The market sentiment comes from the news and is shared by every symbol.
+    """
+    symbol, root, bars, predicted_price, macro, sentiment = task
+    predicted_date = next_session(bars['Date'].iloc[-1]).strftime('%Y-%m-%d')
+    storage.upsert("predictions", pd.DataFrame({"Date": [predicted_date], "Predicted_Price": [predicted_price]}), root)
+
+    # FGI over the stored bars plus the predicted close, in one batch (the index streams it, see fgi_stream)
+    data = bars.assign(Date=pd.to_datetime(bars['Date']).dt.date).sort_values(by='Date').reset_index(drop=True)
+    data = pd.concat([data, pd.DataFrame({'Date': [predicted_date], 'Close': [predicted_price]})], ignore_index=True)
+    data = add_fgi_columns(data, *macro)
+    storage.write("fgi", data, root)
+
+    record = {
+        "Date": predicted_date,
+        "Today_Close": float(bars['Close'].iloc[-1]),
+        "Predicted_Close": float(predicted_price),
+        "Market_Sentiment": sentiment,
+        "FGI_Score": float(data['FGI_Normalized'].iloc[-1]),
+        "FGI_Sentiment": data['Market_Sentiment'].iloc[-1],
+    }
+    record["Recommendation"] = str(recommend(record["Today_Close"], record["Predicted_Close"],
+                                             record["FGI_Score"], sentiment))
+    storage.upsert("recommendations", pd.DataFrame([record]), root)
+    return {"Symbol": symbol, **record}
+
+
+# ====================== PIPELINE ======================
+
+def pool_size(workers, tasks, seconds_per_task, spawn_seconds=SPAWN_SECONDS):
+    """Worker processes worth spawning for `tasks` tasks of seconds_per_task each (1: run them in-process).
+
+    The pool must at least halve the in-process time once its start-up is paid.
+    """
+    size = min(workers, tasks, os.cpu_count() or 1)
+    if size <= 1:
+        return 1
+    in_process = tasks * seconds_per_task
+    return size if in_process / size + spawn_seconds < in_process / 2 else 1
+
+
+def refresh_symbols(symbols=None, download=True, workers=WORKERS, model=None, timeout=10, pool=None):
+    """Refreshes bars, prediction, FGI and recommendation for many symbols.
+
+    Downloads run concurrently and every symbol's next close is predicted in one batched model call.
+    The per-symbol FGI, recommendation and writes run in-process unless pool_size() finds that a
+    process pool of up to `workers` clearly pays for its start-up (pool=True/False forces either).
+    Returns {"results": [...], "skipped": {symbol: reason}, "workers": processes used}.
+    """
+    from fgi_model import load_macro_inputs
+
+    symbols = list(symbols or nifty50_symbols)
+    skipped = {}
+    if download:
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(symbols))) as downloads:
+            for symbol, error in zip(symbols, downloads.map(_download, symbols, [timeout] * len(symbols))):
+                if error:
+                    print(f"⚠️ {symbol}: {error}")  # Keep the stored bars; the symbol is still scored
+
+    # 📥 Last fgi_window bars per symbol (the LSTM uses the last sequence_length of them)
+    bars = {}
+    for symbol in symbols:
+        frame = market_data.window(market_data.fgi_window, ticker=symbol)
+        frame = frame[pd.notnull(frame['Close'])]
+        if len(frame) < sequence_length:
+            skipped[symbol] = f"{len(frame)} stored bars, need {sequence_length}"
+            continue
+        bars[symbol] = frame.reset_index(drop=True)
+    if not bars:
+        return {"results": [], "skipped": skipped, "workers": 1}
+
+    # 🔮 One model call for every symbol (per deployed model they route to, shadows recorded; see serving.py)
+    windows = np.stack([frame['Close'].to_numpy(dtype=np.float64)[-sequence_length:] for frame in bars.values()])
+    if model is None:
+        dates = [next_session(frame['Date'].iloc[-1]) for frame in bars.values()]
+        prices = serving.forecast(windows, 1, list(bars), dates, record=True)[0][:, 0]
+    else:
+        prices = forecast_windows(windows, 1, model, list(bars))[:, 0]
+
+    # ⚙️ FGI, recommendation and writes per symbol; the first one here also times a task
+    macro = load_macro_inputs()
+    sentiment = (market_sentiment.latest() or {}).get("Overall_Sentiment", "neutral")
+    tasks = [(symbol, market_data.symbol_root(symbol), frame, float(price), macro, sentiment)
+             for (symbol, frame), price in zip(bars.items(), prices)]
+    start = time.perf_counter()
+    results = [finish_symbol(tasks[0])]
+    rest = tasks[1:]
+    if pool is None:
+        size = pool_size(workers, len(rest), time.perf_counter() - start)
+    else:
+        size = min(workers, len(rest)) if pool else 1
+    if size > 1:
+        # Spawned workers don't inherit the parent's model runtime threads; they import no model at all
+        with ProcessPoolExecutor(max_workers=size, mp_context=get_context("spawn")) as executor:
+            results += executor.map(finish_symbol, rest, chunksize=max(1, len(rest) // (size * 4)))
+    else:
+        results += [finish_symbol(task) for task in rest]
+    return {"results": results, "skipped": skipped, "workers": size}
+
+
+def refresh():
+    """Refresh-stage entry point: every Nifty 50 constituent."""
+    report = refresh_symbols()
+    print(f"[✔] Refreshed {len(report['results'])} symbols in {report['workers']} process(es)"
+          + (f", skipped {', '.join(report['skipped'])}" if report['skipped'] else ""))
+    return report
+
+
+# ====================== READS ======================
+
+def latest_forecast(symbol):
+    """The newest prediction and recommendation of a symbol, shaped like the /predict snapshot."""
+    root = market_data.symbol_root(symbol)
+    rows = storage.tail("recommendations", 1, root=root)
+    if rows.empty:
+        raise KeyError(f"No forecast stored for {symbol}.")
+    row = rows.iloc[-1]
+    price = float(row["Predicted_Close"])
+    return {
+        "Symbol": symbol,
+        "Date": row["Date"].strftime('%Y-%m-%d'),
+        "Predicted_Price": price,
+        "Prediction_Range": [price - prediction_margin, price + prediction_margin],
+        "Overall_Market_Sentiment": row["Market_Sentiment"],
+        "Today_Close": float(row["Today_Close"]),
+        "FGI Score": float(row["FGI_Score"]),
+        "FGI_Sentiment": row["FGI_Sentiment"],
+        "Recommendation": row["Recommendation"],
+    }
+
+
+def recommendations(symbol):
+    """A symbol's stored recommendations, newest first."""
+    frame = storage.read("recommendations", root=market_data.symbol_root(symbol))
+    frame['Date'] = frame['Date'].dt.strftime('%Y/%m/%d')
+    return frame.sort_values(by="Date", ascending=False).to_dict(orient="records")
+
+
+# Run as a script: refresh the given symbols (default: all Nifty 50 constituents)
+if __name__ == "__main__":
+    start = time.perf_counter()
+    report = refresh_symbols(sys.argv[1:] or None)
+    for result in report["results"]:
+        print(f"{result['Symbol']:>15} {result['Date']}: {result['Predicted_Close']:10.2f}  {result['Recommendation']}")
+    for symbol, reason in report["skipped"].items():
+        print(f"{symbol:>15} skipped: {reason}")
+    print(f"[✔] {len(report['results'])} symbols in {time.perf_counter() - start:.2f}s")
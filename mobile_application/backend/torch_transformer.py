@@ -0,0 +1,102 @@
+import numpy as np
+import torch
+import torch.nn as nn
+
+# 🤖 The PyTorch Transformer from deeplearning_models/Transformer_model.ipynb, as an importable module
+
+
+class PositionalEncoding(nn.Module):
+    def __init__(self, d_model, max_len=5000):
+        super().__init__()
+        pe = torch.zeros(max_len, d_model)
+        position = torch.arange(0, max_len, dtype=torch.float).unsqueeze(1)
+        div_term = torch.exp(torch.arange(0, d_model, 2).float() * (-np.log(10000.0) / d_model))
+        pe[:, 0::2] = torch.sin(position * div_term)
+        pe[:, 1::2] = torch.cos(position * div_term)
+        self.register_buffer("pe", pe.unsqueeze(0), persistent=False)  # Rebuilt on load, never saved
+
+    def forward(self, x):
+        return x + self.pe[:, :x.size(1), :]
+
+
+class MultiHeadAttention(nn.Module):
+    def __init__(self, d_model, num_heads):
+        super().__init__()
+        assert d_model % num_heads == 0
+        self.d_k = d_model // num_heads
+        self.num_heads = num_heads
+
+        self.W_q = nn.Linear(d_model, d_model)
+        self.W_k = nn.Linear(d_model, d_model)
+        self.W_v = nn.Linear(d_model, d_model)
+        self.W_o = nn.Linear(d_model, d_model)
+        self.softmax = nn.Softmax(dim=-1)
+
+    def forward(self, q, k, v):
+        batch_size = q.shape[0]
+        q = self.W_q(q).view(batch_size, -1, self.num_heads, self.d_k).transpose(1, 2)
+        k = self.W_k(k).view(batch_size, -1, self.num_heads, self.d_k).transpose(1, 2)
+        v = self.W_v(v).view(batch_size, -1, self.num_heads, self.d_k).transpose(1, 2)
+
+        scores = torch.matmul(q, k.transpose(-2, -1)) / np.sqrt(self.d_k)
+        attn_weights = self.softmax(scores)
+        attn_output = torch.matmul(attn_weights, v)
+
+        attn_output = attn_output.transpose(1, 2).contiguous().view(batch_size, -1, self.num_heads * self.d_k)
+        return self.W_o(attn_output)
+
+
+class TransformerEncoderBlock(nn.Module):
+    def __init__(self, d_model, num_heads, hidden_dim, dropout=0.1):
+        super().__init__()
+        self.attn = MultiHeadAttention(d_model, num_heads)
+        self.norm1 = nn.LayerNorm(d_model)
+        self.ffn = nn.Sequential(nn.Linear(d_model, hidden_dim), nn.ReLU(), nn.Linear(hidden_dim, d_model))
+        self.norm2 = nn.LayerNorm(d_model)
+        self.dropout = nn.Dropout(dropout)
+
+    def forward(self, x):
+        attn_out = self.attn(x, x, x)
+        x = self.norm1(x + self.dropout(attn_out))
+        ffn_out = self.ffn(x)
+        x = self.norm2(x + self.dropout(ffn_out))
+        return x
+
+
+class TransformerTimeSeries(nn.Module):
+    def __init__(self, input_dim=1, d_model=64, num_heads=4, hidden_dim=128, num_layers=2, dropout=0.1):
+        super().__init__()
+        self.config = {"input_dim": input_dim, "d_model": d_model, "num_heads": num_heads,
+                       "hidden_dim": hidden_dim, "num_layers": num_layers, "dropout": dropout}
+        self.input_layer = nn.Linear(input_dim, d_model)
+        self.pos_encoding = PositionalEncoding(d_model)
+        self.encoder_layers = nn.ModuleList([TransformerEncoderBlock(d_model, num_heads, hidden_dim, dropout)
+                                             for _ in range(num_layers)])
+        self.output_layer = nn.Linear(d_model, 1)
+
+    def forward(self, x):
+        x = self.input_layer(x)
+        x = self.pos_encoding(x)
+        for layer in self.encoder_layers:
+            x = layer(x)
+        x = self.output_layer(x[:, -1, :])
+        return x
+
+    def predict_on_batch(self, windows):
+        """Same call as the Keras models: (batch, steps, features) array in, (batch, 1) array out."""
+        self.eval()
+        with torch.inference_mode():
+            return self(torch.from_numpy(np.array(windows, dtype=np.float32))).numpy()
+
+
+def save(model, path):
+    """Saves the weights together with the constructor arguments, so load() needs no other input."""
+    torch.save({"config": model.config, "state_dict": model.state_dict()}, path)
+
+
+def load(path):
+    """Loads a model saved with save(), ready for predict_on_batch."""
+    checkpoint = torch.load(path, map_location="cpu", weights_only=True)
+    model = TransformerTimeSeries(**checkpoint["config"])
+    model.load_state_dict(checkpoint["state_dict"])
+    return model.eval()
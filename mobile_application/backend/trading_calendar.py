@@ -0,0 +1,132 @@
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+# 📂 Define paths
+base_dir = os.path.dirname(os.path.abspath(__file__))
+sessions_path = os.path.join(base_dir, "data", "nse_sessions.npz")  # Precomputed NSE sessions
+
+first_session_year = 2000
+years_ahead = 1  # Sessions are built up to the end of next year
+
+# 🗓️ Sorted datetime64[D] array of sessions, loaded once per process
+_sessions = None
+_lock = threading.Lock()
+
+
+# ====================== BUILD & LOAD ======================
+
+def build_sessions(start=f"{first_session_year}-01-01", end=None):
+    """NSE sessions between start and end from pandas_market_calendars, as a sorted datetime64[D] array."""
+    import pandas_market_calendars as mcal  # Imported lazily; only needed to (re)build the cache
+
+    end = end or f"{pd.Timestamp.today().year + years_ahead}-12-31"
+    days = mcal.get_calendar('NSE').valid_days(start_date=start, end_date=end)
+    return days.tz_localize(None).to_numpy().astype("datetime64[D]")
+
+
+def save_sessions(sessions, path=None):
+    """Writes the sessions (and the build date) atomically."""
+    path = path or sessions_path
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, sessions=sessions, built=np.datetime64(pd.Timestamp.today().date(), "D"))
+    os.replace(tmp_path, path)
+
+
+def _load(path):
+    """Reads the persisted sessions, rebuilding them once a year (NSE publishes holidays each December)."""
+    cached = None
+    if os.path.exists(path):
+        with np.load(path) as data:
+            cached = (data["sessions"], pd.Timestamp(data["built"].item()).year)
+        if cached[1] >= pd.Timestamp.today().year:
+            return cached[0]
+    try:
+        sessions = build_sessions()
+    except ImportError:
+        if cached is None:
+            raise
+        print(f"⚠️ pandas_market_calendars is not installed; using the NSE sessions built in {cached[1]}")
+        return cached[0]
+    save_sessions(sessions, path)
+    print(f"[✔] Built {len(sessions)} NSE sessions up to {sessions[-1]}")
+    return sessions
+
+
+def sessions():
+    """All known NSE sessions as a sorted datetime64[D] array (loaded from disk on first use)."""
+    global _sessions
+    if _sessions is None:
+        with _lock:
+            if _sessions is None:
+                _sessions = _load(sessions_path)
+    return _sessions
+
+
+def _day(date):
+    return pd.Timestamp(date).to_datetime64().astype("datetime64[D]")
+
+
+def _session_at(index):
+    all_sessions = sessions()
+    if not 0 <= index < len(all_sessions):
+        raise ValueError(f"Date outside the NSE calendar ({all_sessions[0]} → {all_sessions[-1]}); "
+                         f"delete {os.path.basename(sessions_path)} to rebuild it.")
+    return pd.Timestamp(all_sessions[index])
+
+
+# ====================== QUERIES ======================
+
+def is_session(date):
+    """True if the market is open on date."""
+    all_sessions, day = sessions(), _day(date)
+    index = np.searchsorted(all_sessions, day)
+    return bool(index < len(all_sessions) and all_sessions[index] == day)
+
+
+def next_session(date):
+    """The first session strictly after date."""
+    return _session_at(int(np.searchsorted(sessions(), _day(date), side="right")))
+
+
+def next_sessions(date, n):
+    """The n sessions strictly after date, as a DatetimeIndex."""
+    start = int(np.searchsorted(sessions(), _day(date), side="right"))
+    _session_at(start + n - 1)  # Range check
+    return pd.DatetimeIndex(sessions()[start:start + n])
+
+
+def previous_session(date):
+    """The last session strictly before date."""
+    return _session_at(int(np.searchsorted(sessions(), _day(date), side="left")) - 1)
+
+
+def sessions_back(date, n):
+    """The first session of the n-session window ending on date (inclusive if date is a session)."""
+    return _session_at(int(np.searchsorted(sessions(), _day(date), side="right")) - n)
+
+
+def session_count(start, end):
+    """Number of sessions between start and end, both inclusive."""
+    all_sessions = sessions()
+    return max(0, int(np.searchsorted(all_sessions, _day(end), side="right")
+                      - np.searchsorted(all_sessions, _day(start), side="left")))
+
+
+def sessions_between(start, end):
+    """Sessions between start and end, both inclusive, as a DatetimeIndex."""
+    all_sessions = sessions()
+    return pd.DatetimeIndex(all_sessions[np.searchsorted(all_sessions, _day(start), side="left"):
+                                         np.searchsorted(all_sessions, _day(end), side="right")])
+
+
+# Run as a script: rebuild the persisted calendar, then show the next sessions
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["build"]:
+        save_sessions(build_sessions())
+    today = pd.Timestamp.today()
+    print(f"{len(sessions())} sessions, {sessions()[0]} → {sessions()[-1]}")
+    print("next sessions:", ", ".join(next_sessions(today, 5).strftime('%Y-%m-%d')))
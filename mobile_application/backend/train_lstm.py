@@ -0,0 +1,138 @@
+import json
+import time
+import argparse
+
+import numpy as np
+
+from architectures import build_model
+from model_bundle import write_manifest, index_symbol
+from sequences import tf_dataset
+from sweep import prepare_dataset, data_path
+
+# 📓 LSTM_model.ipynb's configuration (batch 8, in-memory NumPy arrays, eager-compatible Keras defaults)
+notebook_config = {"units": 256, "dropout": 0.02, "batch_size": 8, "learning_rate": 0.0005}
+window = 60
+
+
+def scaled_learning_rate(base_rate, batch_size, base_batch_size=notebook_config["batch_size"], rule="linear"):
+    """Learning rate for batch_size, given one tuned at base_batch_size.
+
+    "linear" multiplies it by the batch ratio, "sqrt" by its square root, "none" keeps it. For this LSTM
+    with Adam, linear scaling up to batch 64 reaches the notebook's validation loss (bench_train_lstm.py).
+    """
+    ratio = batch_size / base_batch_size
+    factors = {"linear": ratio, "sqrt": np.sqrt(ratio), "none": 1.0}
+    if rule not in factors:
+        raise ValueError(f"Unknown learning-rate scaling {rule!r}; expected one of {', '.join(factors)}.")
+    return float(base_rate * factors[rule])
+
+
+def train(units=256, dropout=0.02, batch_size=8, learning_rate=None, lr_scaling="linear", epochs=100, patience=10,
+          pipeline="tf.data", jit_compile=False, steps_per_execution=1, target_loss=None, seed=0, path=data_path,
+          output=None, verbose=True):
+    """Trains the notebook's LSTM and returns a report of its speed and validation loss.
+
+    pipeline="tf.data" streams windows through sequences.tf_dataset (shuffled, prefetched, the validation
+    batches cached); "numpy" passes in-memory arrays like the notebook. Keras runs the steps as a
+    tf.function graph; jit_compile=True also compiles them with XLA, and steps_per_execution > 1 runs
+    that many batches per graph call. learning_rate defaults to the notebook's, scaled to batch_size
+    with lr_scaling. Training stops after `patience` epochs without improvement (restoring the best
+    weights), or as soon as the validation loss reaches target_loss. The best model is saved to
+    `output` if given, with its bundle manifest (model_bundle.py).
+    """
+    from tensorflow import keras
+
+    keras.utils.set_random_seed(seed)
+    if learning_rate is None:
+        learning_rate = scaled_learning_rate(notebook_config["learning_rate"], batch_size, rule=lr_scaling)
+
+    meta = prepare_dataset("close", window, path)
+    values = np.load(meta["array"])
+    split = meta["split"]
+    if pipeline == "tf.data":
+        train_data = tf_dataset(values, window, batch_size, stop=split, shuffle=True, seed=seed)
+        validation_data = tf_dataset(values, window, 1024, start=split, cache=True)
+        fit_args = {}
+    elif pipeline == "numpy":
+        from sequences import make_sequences
+        X, y = make_sequences(values, window)
+        train_data, validation_data = np.array(X[:split]), (np.array(X[split:]), np.array(y[split:]))
+        fit_args = {"y": np.array(y[:split]), "batch_size": batch_size}
+    else:
+        raise ValueError(f"Unknown pipeline {pipeline!r}; expected 'tf.data' or 'numpy'.")
+
+    params = {"architecture": "lstm", "units": units, "dropout": dropout, "learning_rate": learning_rate}
+    model = build_model(params, window, 1, jit_compile=jit_compile, steps_per_execution=steps_per_execution)
+
+    report = {"units": units, "batch_size": batch_size, "learning_rate": learning_rate, "pipeline": pipeline,
+              "jit_compile": jit_compile, "steps_per_execution": steps_per_execution,
+              "epoch_seconds": [], "val_losses": [], "reached_target_after": None}
+
+    class Timer(keras.callbacks.Callback):
+        """Epoch wall time (training plus validation) and early exit once target_loss is reached."""
+
+        def on_train_begin(self, logs=None):
+            self.start = time.perf_counter()
+
+        def on_epoch_begin(self, epoch, logs=None):
+            self.epoch_start = time.perf_counter()
+
+        def on_epoch_end(self, epoch, logs=None):
+            report["epoch_seconds"].append(time.perf_counter() - self.epoch_start)
+            report["val_losses"].append(float(logs["val_loss"]))
+            if verbose:
+                print(f"  epoch {epoch + 1:>3}: {report['epoch_seconds'][-1]:6.2f}s  "
+                      f"loss {logs['loss']:.6f}  val_loss {logs['val_loss']:.6f}")
+            if target_loss is not None and logs["val_loss"] <= target_loss:
+                report["reached_target_after"] = time.perf_counter() - self.start
+                self.model.stop_training = True
+
+    early_stopping = keras.callbacks.EarlyStopping(monitor="val_loss", patience=patience, restore_best_weights=True)
+    start = time.perf_counter()
+    model.fit(train_data, epochs=epochs, validation_data=validation_data, callbacks=[Timer(), early_stopping],
+              verbose=0, **fit_args)
+    report["seconds"] = time.perf_counter() - start
+
+    # 📏 Steady-state speed excludes the first epoch (graph tracing / XLA compilation)
+    steady = report["epoch_seconds"][1:] or report["epoch_seconds"]
+    report["epoch_time"] = float(np.median(steady))
+    report["samples_per_sec"] = split / report["epoch_time"]
+    report["first_epoch_seconds"] = report["epoch_seconds"][0]
+    report["epochs"] = len(report["epoch_seconds"])
+    report["best_val_loss"] = min(report["val_losses"])
+    if output:
+        model.save(output)
+        training_data = {"symbol": index_symbol,
+                         **{key: meta[key] for key in ("source", "rows", "start_date", "end_date", "train_end_date")}}
+        write_manifest(output, meta["columns"], window, meta["scaler_min"], meta["scaler_max"], training_data,
+                       params={"units": units, "dropout": dropout, "batch_size": batch_size,
+                               "learning_rate": learning_rate},
+                       metrics={"val_loss": report["best_val_loss"], "epochs": report["epochs"]})
+        print(f"[✔] Saved model to {output} (with its bundle manifest)")
+    return report
+
+
+# Run as a script: python train_lstm.py --batch-size 16 --output models/LSTM_model_fast.keras
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the LSTM faster on CPU (tf.data, larger batches, scaled learning rate).")
+    parser.add_argument("--units", type=int, default=notebook_config["units"])
+    parser.add_argument("--dropout", type=float, default=notebook_config["dropout"])
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--learning-rate", type=float, default=None,
+                        help="Default: the notebook's 0.0005 scaled from batch 8 with --lr-scaling")
+    parser.add_argument("--lr-scaling", choices=["linear", "sqrt", "none"], default="linear")
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument("--patience", type=int, default=10)
+    parser.add_argument("--pipeline", choices=["tf.data", "numpy"], default="tf.data")
+    parser.add_argument("--jit", dest="jit_compile", action="store_true",
+                        help="Compile the train step with XLA (slower for this LSTM on our CPU boxes)")
+    parser.add_argument("--steps-per-execution", type=int, default=8)
+    parser.add_argument("--target-loss", type=float, default=None, help="Stop once val_loss reaches this")
+    parser.add_argument("--output", default=None, help="Where to save the best model (.keras or .h5)")
+    args = parser.parse_args()
+
+    report = train(args.units, args.dropout, args.batch_size, args.learning_rate, args.lr_scaling, args.epochs,
+                   args.patience, args.pipeline, args.jit_compile, args.steps_per_execution,
+                   args.target_loss, output=args.output)
+    print(json.dumps({key: value for key, value in report.items() if key not in ("epoch_seconds", "val_losses")},
+                     indent=2))